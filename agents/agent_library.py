@@ -15,19 +15,26 @@ class AgentConfig(TypedDict, total=False):
 
 agent_configs: dict[str, AgentConfig] = {
     "economic_data_retrieval_agent": {
-        "tools": [EconomicDataTools.get_core_cpi_data],
+        "tools": [EconomicDataTools.get_core_cpi_data, EconomicDataTools.get_fred_series_table],
         "prompt": get_economic_data_retrieval_prompt(),
         "agent_type": "worker"
     },
     "market_data_retrieval_agent": {
-        "tools": [MarketDataTools.get_stock_price],
+        "tools": [
+            MarketDataTools.get_stock_price,
+            MarketDataTools.get_stock_prices,
+            MarketDataTools.get_technical_indicators,
+            MarketDataTools.get_risk_metrics,
+            MarketDataTools.get_option_chain_summary
+            ],
         "prompt": get_market_data_retrieval_prompt(),
         "agent_type": "worker"
     },
     "financial_statement_retrieval_agent": {
         "tools":  [
             FinancialDataTools.get_income_statement,
-            FinancialDataTools.get_financial_event_filings
+            FinancialDataTools.get_financial_event_filings,
+            FinancialDataTools.screen_stocks
             ],
         "prompt": get_financial_statement_data_retrieval_prompt(),
         "agent_type": "worker"
@@ -77,6 +84,7 @@ agent_configs: dict[str, AgentConfig] = {
             dart_registry.get_ts_acquisition_tool,
             dart_registry.get_ts_trust_contract_tool,
             dart_registry.get_ts_trust_cancel_tool,
+            dart_registry.get_dart_event_study_tool,
         ],
         "prompt": get_domestic_insider_researcher_prompt(),
         "agent_type": "worker",
@@ -84,8 +92,12 @@ agent_configs: dict[str, AgentConfig] = {
     "international_insider_researcher": {
         "tools": [
             sec_registry.get_insider_trading_tool,
+            sec_registry.get_insider_activity_summary_tool,
+            sec_registry.get_insider_cluster_buying_tool,
             sec_registry.get_ownership_disclosure_tool,
-            sec_registry.get_institutional_holdings_tool  
+            sec_registry.get_institutional_holdings_tool,
+            sec_registry.get_filing_event_study_tool,
+            sec_registry.get_insider_signal_backtest_tool
         ],
         "prompt": get_international_insider_researcher_prompt(),
         "agent_type": "worker",
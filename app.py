@@ -28,6 +28,9 @@ from utils.logger import logger
 from routers.v1 import reports
 from schemas.report import UserInput
 from services.vector_store_provider import VectorStoreProvider
+from services.fundamentals_prefetcher import FundamentalsPrefetcher
+from services.macro_prefetcher import MacroReleasePrefetcher
+from tools.market_data_tool import FinancialDataTools, EconomicDataTools
 from main_graph import build_graph
 
 load_dotenv()
@@ -138,6 +141,18 @@ async def lifespan(app: FastAPI):
         app.state.report_refresh_task = report_refresh_task
         logger.info("리포트 preload + 주기적 refresh Task 시작")
 
+        # 감시 종목 재무제표 프리페치 (실적 발표 직후 갱신)
+        fundamentals_prefetcher = FundamentalsPrefetcher(
+            FinancialDataTools.fundamentals_cache, screener=FinancialDataTools.screener
+        )
+        app.state.fundamentals_prefetch_task = asyncio.create_task(fundamentals_prefetcher.run())
+        logger.info("재무제표 프리페치 Task 시작")
+
+        # 주요 FRED 시계열 프리페치 (경제지표 발표 직후 갱신)
+        macro_prefetcher = MacroReleasePrefetcher(EconomicDataTools.fred_cache, EconomicDataTools.release_calendar)
+        app.state.macro_prefetch_task = asyncio.create_task(macro_prefetcher.run())
+        logger.info("경제지표 프리페치 Task 시작")
+
     #    # 4. MCP Watchdog 비동기 태스크 시작
     #     watchdog_task = asyncio.create_task(mcp_watchdog_task(app))
     #     app.state.watchdog_task = watchdog_task
@@ -158,6 +173,20 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("리포트 preload+refresh Task 종료 완료")
 
+    if hasattr(app.state, "fundamentals_prefetch_task"):
+        app.state.fundamentals_prefetch_task.cancel()
+        try:
+            await app.state.fundamentals_prefetch_task
+        except asyncio.CancelledError:
+            logger.info("재무제표 프리페치 Task 종료 완료")
+
+    if hasattr(app.state, "macro_prefetch_task"):
+        app.state.macro_prefetch_task.cancel()
+        try:
+            await app.state.macro_prefetch_task
+        except asyncio.CancelledError:
+            logger.info("경제지표 프리페치 Task 종료 완료")
+
     # # 종료 시 MCP 연결 정리
     # if hasattr(app.state, "mcp_watchdog_task"):
     #     app.state.mcp_watchdog_task.cancel()
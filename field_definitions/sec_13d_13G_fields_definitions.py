@@ -6,7 +6,7 @@ class SEC_13D_13G_NecessaryFields:
     # 기본 신고 정보
     ACCESSION_NO = "accessionNo"  # SEC 신고서 고유 식별 번호
     FORM_TYPE = "formType"  # 신고서 유형 (예: 13D, 13G, 13D/A, 13G/A)
-    FILED_AT = "filedAt"  # 신고 날짜 (YYYY-MM-DD)
+    FILED_AT = "filedAt"  # 신고 시각 (ISO 8601, 예: 2024-05-01T18:30:00-04:00)
     NAME_OF_ISSUER = "nameOfIssuer"  # 신고 대상 기업명
     CUSIP = "cusip"  # 증권 식별 번호 (여러 개 가능)
     EVENT_DATE = "eventDate"  # 거래 발생 날짜
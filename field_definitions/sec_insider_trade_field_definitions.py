@@ -5,7 +5,7 @@ class SEC_Insider_Trade_NecessaryFields:
 
     # 기본 거래 정보
     ACCESSION_NO = "accessionNo"  # SEC 신고서 고유 식별 번호
-    FILED_AT = "filedAt"  # 신고 날짜 (YYYY-MM-DD)
+    FILED_AT = "filedAt"  # 신고 시각 (ISO 8601, 예: 2024-05-01T18:30:00-04:00)
     PERIOD_OF_REPORT = "periodOfReport"  # 거래 발생 날짜
     DOCUMENT_TYPE = "documentType"  # 신고 문서 유형 (보통 "4" = Form 4)
 
@@ -28,6 +28,7 @@ class SEC_Insider_Trade_NecessaryFields:
     SHARES = "amounts.shares"  # 거래 주식 수량
     PRICE_PER_SHARE = "amounts.pricePerShare"  # 주당 거래 가격 (옵션 행사 시 0일 수도 있음)
     TRANSACTION_TYPE = "coding.code"  # 거래 유형 (A = 매수, D = 매도, M = 옵션 행사, P = 시장 매수)
+    ACQUIRED_DISPOSED_CODE = "amounts.acquiredDisposedCode"  # 취득(A) / 처분(D) 구분
     SHARES_OWNED_AFTER = "postTransactionAmounts.sharesOwnedFollowingTransaction"  # 거래 후 총 보유 주식 수
 
     # 파생상품 거래 (옵션 등)
@@ -0,0 +1,81 @@
+import os
+import asyncio
+from typing import Optional
+
+from tools.fundamentals_cache import FundamentalsCache
+from tools.universe_screener import UniverseScreener
+from utils.logger import logger
+
+
+class FundamentalsPrefetcher:
+    """
+    감시 종목(watchlist)의 손익계산서를 실적 발표 직후 미리 갱신하는 백그라운드 태스크.
+
+    감시 종목은 환경변수 FUNDAMENTALS_WATCHLIST(쉼표 구분)와 이미 캐시에 있는 종목의 합집합이며,
+    CHECK_INTERVAL 마다 만료된 (ticker, freq) 만 골라 갱신한다.
+    screener 가 주어지면 갱신한 항목이 있거나 스냅샷이 SNAPSHOT_TTL 보다 오래됐을 때
+    스크리너 스냅샷(빠진 종목 프로필 포함)도 다시 만든다.
+    """
+
+    CHECK_INTERVAL = 60 * 60
+    MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        cache: FundamentalsCache,
+        watchlist: Optional[list[str]] = None,
+        screener: Optional[UniverseScreener] = None
+    ):
+        self.cache = cache
+        self.screener = screener
+        if watchlist is None:
+            watchlist = [t for t in os.getenv("FUNDAMENTALS_WATCHLIST", "").split(",") if t.strip()]
+        self.watchlist = [t.strip().upper() for t in watchlist]
+
+    def targets(self) -> list[str]:
+        return sorted(set(self.watchlist) | set(self.cache.cached_tickers()))
+
+    def due(self) -> list[tuple[str, str]]:
+        """
+        만료된 (ticker, freq) 목록. (캐시 메타를 디스크에서 읽으므로 스레드에서 호출)
+        """
+        return [
+            (ticker, freq)
+            for ticker in self.targets()
+            for freq in self.cache.FREQS
+            if self.cache.needs_refresh(ticker, freq)
+        ]
+
+    async def refresh_due(self) -> int:
+        """
+        만료된 항목만 갱신한다. (Yahoo 호출은 블로킹이므로 스레드에서 실행)
+
+        :return: 갱신한 항목 수
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def _refresh(ticker: str, freq: str):
+            async with semaphore:
+                await asyncio.to_thread(self.cache.refresh, ticker, freq)
+
+        due = await asyncio.to_thread(self.due)
+        results = await asyncio.gather(*(_refresh(ticker, freq) for ticker, freq in due), return_exceptions=True)
+        for (ticker, freq), result in zip(due, results):
+            if isinstance(result, Exception):
+                logger.warning(f"[FundamentalsPrefetcher] {ticker}/{freq} 갱신 실패: {result}")
+        return len(due)
+
+    async def run(self):
+        logger.info(f"[FundamentalsPrefetcher] 시작 (watchlist: {self.watchlist})")
+        while True:
+            try:
+                refreshed = await self.refresh_due()
+                if refreshed:
+                    logger.info(f"[FundamentalsPrefetcher] 재무제표 {refreshed}건 갱신")
+                if self.screener is not None and (
+                    refreshed or self.screener.snapshot_age() >= self.screener.SNAPSHOT_TTL
+                ):
+                    await asyncio.to_thread(self.screener.refresh, True)
+            except Exception as e:
+                logger.error(f"[FundamentalsPrefetcher] 갱신 루프 오류: {e}", exc_info=True)
+            await asyncio.sleep(self.CHECK_INTERVAL)
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from tools.fred_series_cache import FredSeriesCache
+from tools.fred_release_calendar import FredReleaseCalendar
+from tools.fred_panel import FredSeriesPanel
+from utils.logger import logger
+
+
+class MacroReleasePrefetcher:
+    """
+    FRED 발표 일정을 보고, 발표 직후 그 발표에 속한 시계열을 로컬 FRED 캐시에 미리 받아 두는 백그라운드 태스크.
+
+    - 감시 대상은 FredSeriesPanel.ALIASES 의 (series_id, release_id) 이며, 시작할 때 모든 시계열을 한 번 받아 둔다.
+    - 발표일의 발표 시각(RELEASE_TIMES, 미국 동부 시간) + PUBLISH_DELAY 에 메타 TTL 을 무시하고 동기화한다.
+    - FRED 반영이 늦어 last_updated 가 그대로인 시계열은 RETRY_INTERVAL 간격으로 RETRY_WINDOW 동안 다시 확인한다.
+    - 다음 발표 시각까지 잠들되, 일정 변경을 반영하도록 최대 CHECK_INTERVAL 마다 깨어난다.
+    """
+
+    TIMEZONE = ZoneInfo("America/New_York")
+    DEFAULT_RELEASE_TIME = time(8, 30)
+    # 08:30 이 아닌 발표 (G.17 산업생산, H.15 금리)
+    RELEASE_TIMES = {13: time(9, 15), 18: time(16, 15)}
+    PUBLISH_DELAY = timedelta(minutes=2)
+    RETRY_INTERVAL = 5 * 60
+    RETRY_WINDOW = 2 * 60 * 60
+    CHECK_INTERVAL = 60 * 60
+    MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        fred_cache: FredSeriesCache,
+        release_calendar: FredReleaseCalendar,
+        releases: Optional[dict[int, list[str]]] = None
+    ):
+        self.fred_cache = fred_cache
+        self.release_calendar = release_calendar
+        if releases is None:
+            releases = {}
+            for series_id, release_id in FredSeriesPanel.ALIASES.values():
+                if release_id is not None:
+                    releases.setdefault(release_id, []).append(series_id)
+        self.releases = releases
+        self.watchlist = sorted({series_id for series_id, _ in FredSeriesPanel.ALIASES.values()}
+                                | {series_id for series in releases.values() for series_id in series})
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._started: set[tuple[int, date]] = set()
+
+    def release_at(self, release_id: int, day: date) -> datetime:
+        """
+        발표 데이터를 받으러 갈 시각 (동부 시간 발표 시각 + PUBLISH_DELAY).
+        """
+        release_time = self.RELEASE_TIMES.get(release_id, self.DEFAULT_RELEASE_TIME)
+        return datetime.combine(day, release_time, tzinfo=self.TIMEZONE) + self.PUBLISH_DELAY
+
+    def schedule(self, now: datetime) -> tuple[list[int], Optional[datetime]]:
+        """
+        지금 받아야 하는 release 목록과, 그 다음 발표 시각.
+        (발표 일정 조회는 캐시가 만료됐을 때만 HTTP 를 호출하므로 스레드에서 실행한다)
+        """
+        today = now.date()
+        due, next_at = [], None
+        for release_id in self.releases:
+            dates = self.release_calendar.dates(release_id)
+            candidates = []
+            pos = int(np.searchsorted(dates, np.datetime64(today, "D")))
+            if pos < len(dates) and dates[pos] == np.datetime64(today, "D"):
+                candidates.append(today)
+            upcoming = self.release_calendar.upcoming(release_id, after=pd.Timestamp(today))
+            if upcoming is not None:
+                candidates.append(upcoming.date())
+
+            for day in candidates:
+                at = self.release_at(release_id, day)
+                if at <= now:
+                    if (release_id, day) not in self._started:
+                        due.append(release_id)
+                elif next_at is None or at < next_at:
+                    next_at = at
+        return due, next_at
+
+    async def _sync(self, series_id: str, force: bool):
+        async with self._semaphore:
+            await asyncio.to_thread(self.fred_cache.sync, series_id, force)
+
+    async def warm(self):
+        """
+        감시 시계열을 한 번씩 받아 둔다. (캐시가 신선하면 HTTP 없이 끝난다)
+        """
+        results = await asyncio.gather(*(self._sync(s, False) for s in self.watchlist), return_exceptions=True)
+        for series_id, result in zip(self.watchlist, results):
+            if isinstance(result, Exception):
+                logger.warning(f"[MacroReleasePrefetcher] {series_id} 초기 동기화 실패: {result}")
+
+    async def prefetch_release(self, release_id: int):
+        """
+        발표에 속한 시계열을 강제로 동기화하고, 아직 반영되지 않은 시계열은 재시도한다.
+        """
+        pending = list(self.releases.get(release_id, []))
+        before = {series_id: self.fred_cache.last_updated(series_id) for series_id in pending}
+        deadline = asyncio.get_running_loop().time() + self.RETRY_WINDOW
+
+        while pending:
+            await asyncio.gather(*(self._sync(series_id, True) for series_id in pending), return_exceptions=True)
+            pending = [s for s in pending if self.fred_cache.last_updated(s) == before[s]]
+            if not pending or asyncio.get_running_loop().time() + self.RETRY_INTERVAL > deadline:
+                break
+            await asyncio.sleep(self.RETRY_INTERVAL)
+
+        updated = [s for s in before if s not in pending]
+        logger.info(f"[MacroReleasePrefetcher] release {release_id} 프리페치: 갱신 {updated}, 미반영 {pending}")
+
+    async def run(self):
+        logger.info(f"[MacroReleasePrefetcher] 시작 (releases: {sorted(self.releases)})")
+        try:
+            await self.warm()
+        except Exception as e:
+            logger.error(f"[MacroReleasePrefetcher] 초기 동기화 오류: {e}", exc_info=True)
+
+        tasks: set[asyncio.Task] = set()
+        while True:
+            sleep_seconds = self.CHECK_INTERVAL
+            try:
+                now = datetime.now(self.TIMEZONE)
+                due, next_at = await asyncio.to_thread(self.schedule, now)
+                for release_id in due:
+                    self._started.add((release_id, now.date()))
+                    task = asyncio.create_task(self.prefetch_release(release_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                if next_at is not None:
+                    sleep_seconds = min(sleep_seconds, max(1.0, (next_at - now).total_seconds()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[MacroReleasePrefetcher] 스케줄 루프 오류: {e}", exc_info=True)
+
+            try:
+                await asyncio.sleep(sleep_seconds)
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
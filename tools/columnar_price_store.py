@@ -0,0 +1,313 @@
+import os
+import json
+import fcntl
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_cache import OHLCVCache
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class ColumnarPriceStore:
+    """
+    전 종목 일봉을 필드별 (거래일 × 종목) 메모리 맵 배열로 보관하는 컬럼형 가격 스토어.
+
+    - 행은 ORIGIN 부터의 평일 순번이라 날짜 → 행 변환이 계산만으로 끝난다. (휴장일은 NaN 행)
+    - 열은 종목이며 meta.json 의 tickers 순서가 종목 → 열 인덱스다.
+    - 파일은 행 우선 배열이라 한 날짜의 횡단면이 연속 메모리이고, 새 거래일은 파일 끝에 이어 붙는다.
+    - 읽기는 np.memmap 뷰를 그대로 쓰므로 복사가 없고, 여러 워커 프로세스가 OS 페이지 캐시를 공유한다.
+    - 쓰기는 파일 락(flock)을 잡은 한 프로세스만 하며, meta.json 을 원자적으로 교체해 다른 프로세스가 변경을 감지한다.
+    - 원본은 종목별 OHLCVCache 이며, sync 는 종목마다 마지막으로 반영한 날 이후만 옮긴다.
+    """
+
+    FIELDS = ("Open", "High", "Low", "Close", "Volume")
+    DTYPE = np.float32
+    ORIGIN = "2010-01-01"
+    ROW_CHUNK = 260
+    COL_CHUNK = 1024
+
+    def __init__(self, store_dir: Optional[str] = None):
+        self.store_dir = store_dir or os.path.dirname(data_path("prices", "columnar", "_"))
+        os.makedirs(self.store_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._meta: Optional[dict] = None
+        self._arrays: dict[str, np.ndarray] = {}
+        self._meta_mtime: Optional[int] = None
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.store_dir, "meta.json")
+
+    def _field_path(self, field: str) -> str:
+        return os.path.join(self.store_dir, f"{field.lower()}.bin")
+
+    def _empty_meta(self) -> dict:
+        return {"origin": self.ORIGIN, "rows": 0, "row_capacity": 0, "col_capacity": 0, "tickers": [], "ranges": {}}
+
+    def _read_meta(self) -> dict:
+        if not os.path.exists(self._meta_path):
+            return self._empty_meta()
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_meta(self, meta: dict):
+        tmp_path = f"{self._meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path)
+
+    def _open(self, meta: dict, mode: str) -> dict[str, np.ndarray]:
+        shape = (meta["row_capacity"], meta["col_capacity"])
+        if 0 in shape:
+            return {field: np.empty((0, 0), dtype=self.DTYPE) for field in self.FIELDS}
+        return {field: np.memmap(self._field_path(field), dtype=self.DTYPE, mode=mode, shape=shape) for field in self.FIELDS}
+
+    def _view(self) -> tuple[dict, dict[str, np.ndarray]]:
+        """
+        읽기 전용 메모리 맵. meta.json 이 바뀌었으면 (다른 프로세스의 쓰기) 다시 연다.
+        """
+        try:
+            mtime = os.stat(self._meta_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        with self._lock:
+            if self._meta is None or mtime != self._meta_mtime:
+                meta = self._read_meta()
+                self._arrays = self._open(meta, "r")
+                self._meta, self._meta_mtime = meta, mtime
+            return self._meta, self._arrays
+
+    @staticmethod
+    def rows_of(origin: str, days: np.ndarray) -> np.ndarray:
+        return np.busday_count(np.datetime64(origin, "D"), days.astype("datetime64[D]"))
+
+    @staticmethod
+    def dates_of(origin: str, rows: np.ndarray) -> np.ndarray:
+        return np.busday_offset(np.datetime64(origin, "D"), rows, roll="forward")
+
+    @contextmanager
+    def _writing(self):
+        """
+        프로세스 간 쓰기 락을 잡고 디스크의 최신 meta 와 쓰기용 메모리 맵을 넘긴다.
+        블록이 끝나면 배열을 flush 한 뒤 meta.json 을 교체한다.
+        """
+        with open(os.path.join(self.store_dir, ".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                meta = self._read_meta()
+                state = {"meta": meta, "arrays": self._open(meta, "r+")}
+                yield state
+                for array in state["arrays"].values():
+                    if isinstance(array, np.memmap):
+                        array.flush()
+                self._write_meta(state["meta"])
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _ensure_capacity(self, state: dict, rows: int, cols: int):
+        """
+        행이 모자라면 파일 끝을 늘리고, 열이 모자라면 더 넓은 배열로 옮겨 쓴다. (새 칸은 NaN)
+        """
+        meta = state["meta"]
+        row_capacity, col_capacity = meta["row_capacity"], meta["col_capacity"]
+        if rows <= row_capacity and cols <= col_capacity:
+            return
+        new_rows = max(row_capacity, -(-rows // self.ROW_CHUNK) * self.ROW_CHUNK)
+        new_cols = max(col_capacity, -(-cols // self.COL_CHUNK) * self.COL_CHUNK)
+
+        if new_cols == col_capacity:
+            # 행 우선 배열이므로 파일 끝을 늘리기만 하면 된다
+            size = new_rows * new_cols * np.dtype(self.DTYPE).itemsize
+            for field in self.FIELDS:
+                with open(self._field_path(field), "r+b") as f:
+                    f.truncate(size)
+            meta["row_capacity"] = new_rows
+            state["arrays"] = self._open(meta, "r+")
+            for array in state["arrays"].values():
+                array[row_capacity:] = np.nan
+            return
+
+        logger.info(f"[ColumnarPriceStore] 배열 확장: {row_capacity}x{col_capacity} → {new_rows}x{new_cols}")
+        for field in self.FIELDS:
+            tmp_path = f"{self._field_path(field)}.tmp"
+            grown = np.memmap(tmp_path, dtype=self.DTYPE, mode="w+", shape=(new_rows, new_cols))
+            grown[:] = np.nan
+            if row_capacity and col_capacity:
+                grown[:row_capacity, :col_capacity] = state["arrays"][field]
+            grown.flush()
+            del grown
+            # 이미 열려 있는 다른 프로세스의 맵은 이전 파일(inode)을 계속 본다
+            os.replace(tmp_path, self._field_path(field))
+        meta["row_capacity"], meta["col_capacity"] = new_rows, new_cols
+        state["arrays"] = self._open(meta, "r+")
+
+    def _pending(
+        self,
+        meta: dict,
+        arrays: dict,
+        col: Optional[int],
+        df: pd.DataFrame
+    ) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray, bool]]:
+        """
+        한 종목에서 새로 옮길 (행 번호, 날짜, 날짜 × FIELDS 값, 전체 재기록 여부).
+        마지막 반영일의 종가가 달라졌으면 (수정주가 변경) 전체를 다시 쓴다.
+        장이 끝난 봉(오늘 이전)만 옮긴다. 오늘 봉은 장중 종가가 계속 바뀌어 수정주가 변경으로 오인된다.
+        """
+        if df is None or df.empty or "Close" not in df.columns:
+            return None
+        df = df[df.index < OHLCVCache._today()]
+        if df.empty:
+            return None
+        days = df.index.values.astype("datetime64[D]")
+        lo = int(np.searchsorted(days, np.datetime64(meta["origin"], "D")))
+        full = True
+
+        if col is not None:
+            first, last = (np.datetime64(day, "D") for day in meta["ranges"][meta["tickers"][col]])
+            pos = int(np.searchsorted(days, last))
+            if pos < len(days) and days[pos] == last and not (days[lo:] < first).any():
+                stored = float(arrays["Close"][self.rows_of(meta["origin"], last), col])
+                fresh = float(df["Close"].iat[pos])
+                if np.isclose(stored, fresh, rtol=OHLCVCache.ADJUSTMENT_TOLERANCE, equal_nan=True):
+                    if pos + 1 == len(days):
+                        return None
+                    lo, full = pos, False
+
+        days = days[lo:]
+        keep = np.is_busday(days)
+        if not keep.any():
+            return None
+        values = df.iloc[lo:].reindex(columns=list(self.FIELDS)).to_numpy(dtype=self.DTYPE)[keep]
+        return self.rows_of(meta["origin"], days[keep]), days[keep], values, full
+
+    def sync(self, price_cache: OHLCVCache, tickers: Optional[list[str]] = None) -> int:
+        """
+        OHLCVCache 에 디스크 캐시된 종목을 스토어로 옮긴다. (종목별 마지막 반영일 이후만)
+
+        :return: 갱신된 종목 수
+        """
+        tickers = [t.strip().upper() for t in (tickers if tickers is not None else price_cache.cached_tickers())]
+        frames = {ticker: price_cache.cached(ticker) for ticker in dict.fromkeys(tickers)}
+
+        with self._writing() as state:
+            meta, arrays = state["meta"], state["arrays"]
+            columns = {ticker: idx for idx, ticker in enumerate(meta["tickers"])}
+            updates = {}
+            for ticker, df in frames.items():
+                pending = self._pending(meta, arrays, columns.get(ticker), df)
+                if pending is not None:
+                    updates[ticker] = pending
+            if not updates:
+                return 0
+
+            for ticker in updates:
+                if ticker not in columns:
+                    columns[ticker] = len(meta["tickers"])
+                    meta["tickers"].append(ticker)
+            rows = max(meta["rows"], max(int(rows[-1]) + 1 for rows, _, _, _ in updates.values()))
+            self._ensure_capacity(state, rows, len(meta["tickers"]))
+            arrays = state["arrays"]
+
+            for ticker, (rows_idx, days, values, full) in updates.items():
+                col = columns[ticker]
+                for k, field in enumerate(self.FIELDS):
+                    if full:
+                        arrays[field][:, col] = np.nan
+                    arrays[field][rows_idx, col] = values[:, k]
+                first = days[0] if full else min(np.datetime64(meta["ranges"][ticker][0], "D"), days[0])
+                meta["ranges"][ticker] = [str(first), str(days[-1])]
+            meta["rows"] = rows
+        return len(updates)
+
+    def window(
+        self,
+        field: str = "Close",
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> tuple[np.ndarray, list[str], np.ndarray]:
+        """
+        [start, end) 구간의 (날짜, 종목, 거래일 × 종목 배열). 배열은 메모리 맵의 복사 없는 읽기 전용 뷰다.
+        """
+        if field not in self.FIELDS:
+            raise ValueError(f"지원하지 않는 필드입니다: {field}")
+        meta, arrays = self._view()
+        rows, origin = meta["rows"], meta["origin"]
+        lo = int(np.clip(self.rows_of(origin, np.datetime64(start, "D")), 0, rows)) if start else 0
+        hi = int(np.clip(self.rows_of(origin, np.datetime64(end, "D")), 0, rows)) if end else rows
+        hi = max(lo, hi)
+        tickers = meta["tickers"]
+        return self.dates_of(origin, np.arange(lo, hi)), tickers, arrays[field][lo:hi, :len(tickers)]
+
+    def cross_section(self, field: str = "Close", date: Optional[str] = None) -> pd.Series:
+        """
+        한 거래일(기본: 마지막 행)의 전 종목 값. 연속 메모리 한 행을 그대로 감싼다.
+        """
+        end = (pd.Timestamp(date) + timedelta(days=1)).strftime("%Y-%m-%d") if date else None
+        dates, tickers, values = self.window(field, end=end)
+        if len(dates) == 0:
+            return pd.Series(dtype=float)
+        return pd.Series(values[-1], index=tickers, name=str(dates[-1]), copy=False)
+
+    def panel(
+        self,
+        field: str = "Close",
+        tickers: Optional[list[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        날짜 × 종목 DataFrame. 모든 종목이 비어 있는 행(휴장일)과 값이 없는 종목은 뺀다.
+        """
+        dates, columns, values = self.window(field, start, end)
+        if tickers is not None:
+            index = {ticker: idx for idx, ticker in enumerate(columns)}
+            wanted = [t.strip().upper() for t in tickers]
+            present = [t for t in dict.fromkeys(wanted) if t in index]
+            values = values[:, [index[t] for t in present]]
+            columns = present
+        frame = pd.DataFrame(values, index=pd.DatetimeIndex(dates), columns=columns, copy=False)
+        return frame.dropna(how="all").dropna(axis=1, how="all")
+
+    def stale(self, tickers: list[str], start: Optional[str] = None, end: Optional[str] = None) -> list[str]:
+        """
+        [start, end) 를 스토어만으로 채울 수 없는 종목. (당일 봉은 확인하지 않는다)
+        """
+        meta, _ = self._view()
+        today = OHLCVCache._today()
+        until = min(pd.Timestamp(end), today) if end else today
+        needed_last = np.busday_offset(np.datetime64(until.date(), "D"), -1, roll="forward")
+        needed_first = np.busday_offset(np.datetime64(start, "D"), 0, roll="forward") if start else None
+
+        result = []
+        for ticker in dict.fromkeys(t.strip().upper() for t in tickers):
+            synced = meta["ranges"].get(ticker)
+            if (
+                synced is None
+                or np.datetime64(synced[1], "D") < needed_last
+                or (needed_first is not None and np.datetime64(synced[0], "D") > needed_first)
+            ):
+                result.append(ticker)
+        return result
+
+    def closes(
+        self,
+        price_cache: OHLCVCache,
+        tickers: list[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        종목별 종가를 날짜 정렬해 앞 값으로 채운 패널. (PriceSeriesFormatter.align_closes 와 같은 모양)
+        스토어에 없는 구간이 있는 종목만 OHLCVCache 로 채운 뒤 옮긴다.
+        """
+        missing = self.stale(tickers, start, end)
+        if missing:
+            price_cache.get_many(missing, start=start, end=end)
+            self.sync(price_cache, missing)
+        return self.panel("Close", tickers, start, end).ffill()
@@ -84,7 +84,31 @@ class DartBaseAPI:
             print(f"기업코드 조회 중 오류 발생: {str(e)}")
             return None
 
-    def filter_by_dates(self, 
+    def return_stock_code(
+        self,
+        stock_code: Optional[str] = None,
+        corp_name: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        종목코드가 없으면 회사명으로 상장 종목코드(6자리)를 찾아 반환합니다.
+        """
+        if stock_code:
+            return stock_code.strip()
+        if corp_name is None:
+            return None
+
+        try:
+            df = pd.read_pickle(self.corp_list_file)
+            clean_name = corp_name.strip().replace(" ", "")
+            result = df[df['corp_name'].str.replace(" ", "") == clean_name]
+            codes = result['stock_code'].astype(str).str.strip()
+            codes = codes[codes != ""]
+            return codes.iloc[0] if not codes.empty else None
+        except Exception as e:
+            print(f"종목코드 조회 중 오류 발생: {str(e)}")
+            return None
+
+    def filter_by_dates(self,
         df: pd.DataFrame,
         date_column: str,
         start_date: Optional[str] = None,
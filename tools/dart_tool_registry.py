@@ -1,5 +1,8 @@
 from langchain.tools import tool
 from typing import Optional
+from tools.filing_records import serialize_frame
+from tools.event_study import EventStudyEngine
+from tools.market_data_tool import MarketDataTools
 from tools.dart_insider_trade_tool import (
     DARTMajorStockReportAPI, DARTExecutiveShareholdingAPI, 
     DartTSDispostionAPI, DartTSAcquisionAPI,
@@ -52,7 +55,7 @@ class DartToolRegistry:
         if df.empty:
             return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
         else:
-            return {"messages" : df.to_dict(orient="records")}
+            return {"messages" : serialize_frame(df)}
 
     @staticmethod
     @tool
@@ -105,7 +108,7 @@ class DartToolRegistry:
         if df.empty:
             return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
         else:
-            return {"messages" : df.to_dict(orient="records")}
+            return {"messages" : serialize_frame(df)}
 
     @staticmethod
     @tool
@@ -142,7 +145,7 @@ class DartToolRegistry:
         if df.empty:
             return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
         else:
-            return {"messages" : df.to_dict(orient="records")}
+            return {"messages" : serialize_frame(df)}
 
     @staticmethod
     @tool
@@ -179,7 +182,7 @@ class DartToolRegistry:
         if df.empty:
             return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
         else:
-            return {"messages" : df.to_dict(orient="records")}
+            return {"messages" : serialize_frame(df)}
 
     @staticmethod
     @tool
@@ -216,7 +219,7 @@ class DartToolRegistry:
         if df.empty:
             return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
         else:
-            return {"messages" : df.to_dict(orient="records")}
+            return {"messages" : serialize_frame(df)}
 
     @staticmethod
     @tool
@@ -253,4 +256,80 @@ class DartToolRegistry:
         if df.empty:
             return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
         else:
-            return {"messages" : df.to_dict(orient="records")}
+            return {"messages" : serialize_frame(df)}
+
+    @staticmethod
+    @tool
+    def get_dart_event_study_tool(
+        stock_code: Optional[str] = None,
+        corp_name: Optional[str] = None,
+        source: str = "executive",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        reference_date: Optional[str] = None,
+        horizons: Optional[list[int]] = None,
+        pre_event_days: int = 5,
+        model: str = "market",
+        limit: int = 100
+    ) -> dict:
+        """
+        임원·주요주주 소유 보고 또는 대량보유 상황보고 이후 주가 반응을 측정하는 이벤트 스터디 도구
+        보고서 접수일마다 시장 지수(코스피 ^KS11 / 코스닥 ^KQ11) 대비 누적 초과수익률(CAR)을 구간별로 계산하고,
+        구간별 평균/중앙값/t-stat/양(+)의 비율을 요약한다.
+
+        Args:
+            stock_code (str, optional): 종목코드
+            corp_name (str, optional): 회사명
+            source (str, optional): "executive"(임원·주요주주 소유 보고) 또는 "major"(대량보유 상황보고). 기본값 "executive"
+            start_date (str, optional): 조회 시작일 ("YYYY-MM-DD")
+            end_date (str, optional): 조회 종료일 ("YYYY-MM-DD")
+            reference_date (str, optional): 현재 시간
+            horizons (list[int], optional): 접수일 이후 CAR 구간 [0, h] 의 거래일 수 목록. 기본값 [1, 5, 20]
+            pre_event_days (int, optional): 접수일 이전 구간 [-n, -1] 의 거래일 수. 0 이면 생략. 기본값 5
+            model (str, optional): "market"(지수 차감) 또는 "market_model"(추정 구간 alpha/beta). 기본값 "market"
+            limit (int, optional): 사용할 최대 보고서 수
+
+        Returns:
+            dict: 구간별 CAR 요약과 이벤트별 CAR 표
+        """
+        stock_code = DartToolRegistry.exec_api.return_stock_code(stock_code=stock_code, corp_name=corp_name)
+        if stock_code is None:
+            return {"messages": f"해당 정보로 종목코드를 찾을 수 없습니다."}
+
+        if source == "major":
+            df = DartToolRegistry.major_api._get_major_stock_reports(
+                stock_code=stock_code,
+                start_date=start_date,
+                end_date=end_date,
+                reference_date=reference_date,
+                limit=limit
+            )
+            label_columns = ["repror", "stkrt", "stkrt_irds"]
+        else:
+            df = DartToolRegistry.exec_api._get_executive_shareholding(
+                stock_code=stock_code,
+                start_date=start_date,
+                end_date=end_date,
+                reference_date=reference_date,
+                limit=limit
+            )
+            label_columns = ["repror", "isu_exctv_ofcps", "sp_stock_lmp_irds_cnt"]
+        if df.empty:
+            return {"messages": f"해당 정보로 데이터를 찾을 수 없습니다."}
+
+        # 코스피(.KS)에 가격이 없으면 코스닥(.KQ)으로 본다
+        symbol, benchmark = f"{stock_code}.KS", "^KS11"
+        if MarketDataTools.price_cache.get(symbol, period="5d").empty:
+            symbol, benchmark = f"{stock_code}.KQ", "^KQ11"
+
+        events = MarketDataTools.event_engine.dart_events(df, symbol, label_columns)
+        try:
+            return {"messages": MarketDataTools.event_engine.run(
+                events,
+                benchmark=benchmark,
+                horizons=horizons or EventStudyEngine.DEFAULT_HORIZONS,
+                pre_event_days=pre_event_days,
+                model=model
+            )}
+        except ValueError as e:
+            return {"messages": str(e)}
@@ -0,0 +1,269 @@
+from datetime import timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_cache import OHLCVCache
+from tools.filing_records import serialize_columns
+from tools.sec_insider_aggregator import SECInsiderAggregator
+
+
+class EventStudyEngine:
+    """
+    공시일(이벤트)별 초과수익률(abnormal return)을 계산하는 이벤트 스터디 엔진.
+
+    - 0일은 공시일 당일 또는 그 이후 첫 거래일이며, 각 종목의 거래일 인덱스에서 searchsorted 로 찾는다.
+    - 종목별로 (이벤트 × 상대 거래일) 수익률 행렬을 한 번에 모아 모든 이벤트를 벡터화하여 계산한다.
+    - 초과수익률 모델
+        * "market": 종목 수익률 - 벤치마크 수익률
+        * "market_model": 추정 구간(ESTIMATION_WINDOW)의 OLS alpha/beta 로 기대수익률을 뺀다.
+    - 구간 [a, b] 의 누적 초과수익률(CAR)은 구간 안에 빠진 거래일이 있으면(예: 너무 최근 이벤트) 비워 둔다.
+    - 가격은 OHLCVCache 를 통해 읽으므로 같은 종목을 반복 분석해도 빠진 구간만 새로 받는다.
+    """
+
+    DEFAULT_HORIZONS = (1, 5, 20)
+    DEFAULT_PRE_EVENT_DAYS = 5
+    ESTIMATION_WINDOW = (-130, -11)
+    MIN_ESTIMATION_DAYS = 60
+    MODELS = ("market", "market_model")
+    MAX_EVENT_ROWS = 40
+
+    def __init__(self, price_cache: OHLCVCache):
+        self.price_cache = price_cache
+
+    @staticmethod
+    def windows(horizons, pre_event_days: int) -> list[tuple[int, int]]:
+        windows = [(-pre_event_days, -1)] if pre_event_days > 0 else []
+        windows += [(0, int(h)) for h in sorted(set(horizons)) if int(h) >= 0]
+        return windows
+
+    @staticmethod
+    def trading_day_positions(index: pd.DatetimeIndex, dates: pd.Series) -> np.ndarray:
+        """
+        각 이벤트 날짜의 0일(당일 또는 이후 첫 거래일) 위치. 가격 범위를 벗어나면 len(index).
+        """
+        return np.searchsorted(index.values, dates.to_numpy(dtype="datetime64[ns]"), side="left")
+
+    @staticmethod
+    def gather(values: np.ndarray, positions: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+        """
+        values[positions + offsets] 를 (이벤트 × 오프셋) 행렬로 모은다. 범위를 벗어나면 NaN.
+        """
+        idx = positions[:, None] + offsets[None, :]
+        valid = (idx >= 0) & (idx < len(values))
+        return np.where(valid, values[np.clip(idx, 0, max(len(values) - 1, 0))], np.nan)
+
+    @classmethod
+    def market_model(cls, stock: np.ndarray, market: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        이벤트별 추정 구간 수익률 행렬(이벤트 × 일)로 alpha, beta 를 한 번에 추정한다.
+        유효 관측치가 MIN_ESTIMATION_DAYS 보다 적은 이벤트는 NaN.
+        """
+        mask = np.isfinite(stock) & np.isfinite(market)
+        count = mask.sum(axis=1)
+        x = np.where(mask, market, 0.0)
+        y = np.where(mask, stock, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_x = x.sum(axis=1) / count
+            mean_y = y.sum(axis=1) / count
+            cov = (x * y).sum(axis=1) / count - mean_x * mean_y
+            var = (x * x).sum(axis=1) / count - mean_x ** 2
+            beta = cov / var
+        alpha = mean_y - beta * mean_x
+        enough = count >= cls.MIN_ESTIMATION_DAYS
+        return np.where(enough, alpha, np.nan), np.where(enough, beta, np.nan)
+
+    def _price_range(self, dates: pd.Series, windows: list[tuple[int, int]]) -> tuple[str, Optional[str]]:
+        lowest = min([w[0] for w in windows] + [self.ESTIMATION_WINDOW[0]])
+        highest = max(w[1] for w in windows)
+        # 거래일 → 달력일 환산 여유 (주말/휴일)
+        start = dates.min() - timedelta(days=int(-lowest * 7 / 5) + 14)
+        end = dates.max() + timedelta(days=int(highest * 7 / 5) + 14)
+        today = OHLCVCache._today()
+        return start.strftime("%Y-%m-%d"), (end.strftime("%Y-%m-%d") if end <= today else None)
+
+    def abnormal_returns(
+        self,
+        stock_close: pd.Series,
+        benchmark_close: pd.Series,
+        dates: pd.Series,
+        offsets: np.ndarray,
+        model: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        한 종목의 모든 이벤트에 대한 (이벤트 × 오프셋) 초과수익률 행렬과 0일 위치.
+        """
+        stock_close = stock_close.dropna()
+        index = stock_close.index
+        stock_ret = stock_close.pct_change(fill_method=None).to_numpy(dtype=float)
+        market_ret = benchmark_close.reindex(index).ffill().pct_change(fill_method=None).to_numpy(dtype=float)
+
+        positions = self.trading_day_positions(index, dates)
+        stock_window = self.gather(stock_ret, positions, offsets)
+        market_window = self.gather(market_ret, positions, offsets)
+
+        if model == "market_model":
+            estimation = np.arange(self.ESTIMATION_WINDOW[0], self.ESTIMATION_WINDOW[1] + 1)
+            alpha, beta = self.market_model(
+                self.gather(stock_ret, positions, estimation),
+                self.gather(market_ret, positions, estimation)
+            )
+            expected = alpha[:, None] + beta[:, None] * market_window
+        else:
+            expected = market_window
+        abnormal = stock_window - expected
+        abnormal[positions >= len(index)] = np.nan
+        return abnormal, positions
+
+    @staticmethod
+    def cumulative(abnormal: np.ndarray, offsets: np.ndarray, window: tuple[int, int]) -> np.ndarray:
+        columns = (offsets >= window[0]) & (offsets <= window[1])
+        block = abnormal[:, columns]
+        return np.where(np.isnan(block).any(axis=1), np.nan, block.sum(axis=1))
+
+    @staticmethod
+    def summarize(car: np.ndarray) -> tuple:
+        values = car[np.isfinite(car)]
+        n = values.size
+        if n == 0:
+            return 0, None, None, None, None
+        mean = values.mean()
+        std = values.std(ddof=1) if n > 1 else np.nan
+        t_stat = mean / (std / np.sqrt(n)) if n > 1 and std > 0 else np.nan
+
+        def _round(value, digits: int = 2):
+            return None if not np.isfinite(value) else round(float(value), digits)
+
+        return n, _round(mean * 100), _round(np.median(values) * 100), _round(t_stat), _round((values > 0).mean() * 100, 1)
+
+    def run(
+        self,
+        events: pd.DataFrame,
+        benchmark: str = "SPY",
+        horizons=DEFAULT_HORIZONS,
+        pre_event_days: int = DEFAULT_PRE_EVENT_DAYS,
+        model: str = "market"
+    ) -> dict:
+        """
+        이벤트 목록으로 이벤트 스터디를 수행한다.
+
+        :param events: 컬럼 ticker(가격 조회용 심볼), date(공시일), label(선택, 이벤트 설명)
+        :param benchmark: 벤치마크 심볼 (예: SPY, ^KS11)
+        :param horizons: 이벤트 이후 CAR 구간 [0, h] 의 h 목록 (거래일)
+        :param pre_event_days: 이벤트 이전 구간 [-n, -1] 의 n (0 이면 생략)
+        :param model: "market" 또는 "market_model"
+        """
+        if model not in self.MODELS:
+            raise ValueError(f"model 은 {self.MODELS} 중 하나여야 합니다.")
+        events = events.copy()
+        events["ticker"] = events["ticker"].astype(str).str.strip().str.upper()
+        events["date"] = pd.to_datetime(events["date"], errors="coerce")
+        if "label" not in events:
+            events["label"] = ""
+        events = events.dropna(subset=["date"]).sort_values("date", kind="stable").reset_index(drop=True)
+        if events.empty:
+            return {"events": "", "summary": "", "missing": []}
+
+        windows = self.windows(horizons, pre_event_days)
+        offsets = np.arange(min(w[0] for w in windows), max(w[1] for w in windows) + 1)
+        benchmark = benchmark.strip().upper()
+        start, end = self._price_range(events["date"], windows)
+        tickers = list(dict.fromkeys(events["ticker"]))
+        frames = self.price_cache.get_many(tickers + [benchmark], start=start, end=end)
+
+        benchmark_frame = frames.get(benchmark)
+        if benchmark_frame is None or benchmark_frame.empty:
+            return {"events": "", "summary": "", "missing": [benchmark]}
+        benchmark_close = benchmark_frame["Close"]
+
+        cars = np.full((len(events), len(windows)), np.nan)
+        day0 = np.full(len(events), None, dtype=object)
+        missing = []
+        for ticker, group in events.groupby("ticker", sort=False):
+            frame = frames.get(ticker)
+            if frame is None or frame.empty:
+                missing.append(ticker)
+                continue
+            abnormal, positions = self.abnormal_returns(frame["Close"], benchmark_close, group["date"], offsets, model)
+            index = frame["Close"].dropna().index
+            rows = group.index.to_numpy()
+            for col, window in enumerate(windows):
+                cars[rows, col] = self.cumulative(abnormal, offsets, window)
+            day0[rows] = [index[p].strftime("%Y-%m-%d") if p < len(index) else None for p in positions]
+
+        labels = [f"car_{a}_{b}" for a, b in windows]
+        event_rows = [
+            (ticker, date.strftime("%Y-%m-%d"), d0, label,
+             *[None if np.isnan(v) else round(v * 100, 2) for v in row])
+            for ticker, date, d0, label, row in zip(events["ticker"], events["date"], day0, events["label"], cars)
+            if d0 is not None
+        ]
+        summary_rows = [(f"[{a},{b}]", *self.summarize(cars[:, col])) for col, (a, b) in enumerate(windows)]
+
+        return {
+            "model": model,
+            "benchmark": benchmark,
+            "summary": serialize_columns(
+                ["window", "n", "mean_car_pct", "median_car_pct", "t_stat", "positive_pct"],
+                summary_rows,
+                title=f"Cumulative abnormal return by window (trading days, {model} vs {benchmark})"
+            ),
+            "events": serialize_columns(
+                ["ticker", "filed", "day0", "event"] + [f"{label}_pct" for label in labels],
+                event_rows[-self.MAX_EVENT_ROWS:],
+                title=f"Per-event CAR % ({len(event_rows)} events, most recent {min(len(event_rows), self.MAX_EVENT_ROWS)})"
+            ),
+            "missing": missing
+        }
+
+    @staticmethod
+    def insider_events(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        SECInsiderAggregator.to_frame 결과를 (종목, 공시일) 단위 이벤트로 묶는다.
+        """
+        if df.empty:
+            return pd.DataFrame(columns=["ticker", "date", "label"])
+        df = df.dropna(subset=["ticker", "filedAt"]).copy()
+        df["date"] = SECInsiderAggregator.filing_days(df["filedAt"])
+
+        grouped = df.groupby(["ticker", "date"], sort=False).agg(
+            codes=("transaction_code", lambda s: "".join(sorted(set(s.dropna())))),
+            insiders=("owner", "nunique"),
+            value=("value", "sum")
+        ).reset_index()
+        grouped["label"] = [
+            f"{codes} x{insiders} ${value / 1e6:,.2f}M"
+            for codes, insiders, value in zip(grouped["codes"], grouped["insiders"], grouped["value"])
+        ]
+        return grouped[["ticker", "date", "label"]]
+
+    @staticmethod
+    def ownership_events(filings: list[dict], ticker: str) -> pd.DataFrame:
+        """
+        13D/13G 공시 목록(SEC13D13GAPI.filter_response)을 이벤트로 만든다. 같은 날 공시는 하나로 묶는다.
+        (장 마감 후 제출은 다음 날 이벤트)
+        """
+        rows = []
+        for filing in filings or []:
+            owners = filing.get("owners") or []
+            label = filing.get("formType") or ""
+            if owners:
+                percent = max(o.get("amountAsPercent") or 0 for o in owners)
+                label += f" {owners[0].get('name')} {percent}%"
+            rows.append((ticker, filing.get("filedAt"), label))
+        df = pd.DataFrame(rows, columns=["ticker", "date", "label"])
+        df["date"] = SECInsiderAggregator.filing_days(df["date"])
+        return df.groupby(["ticker", "date"], sort=False)["label"].agg("; ".join).reset_index()
+
+    @staticmethod
+    def dart_events(df: pd.DataFrame, symbol: str, label_columns: list[str]) -> pd.DataFrame:
+        """
+        DART 보고서 DataFrame 의 접수일(rcept_dt)을 이벤트로 만든다. 같은 날 보고서는 하나로 묶는다.
+        """
+        if df.empty:
+            return pd.DataFrame(columns=["ticker", "date", "label"])
+        columns = [c for c in label_columns if c in df.columns]
+        labels = df[columns].astype(str).agg(" ".join, axis=1) if columns else pd.Series("", index=df.index)
+        events = pd.DataFrame({"ticker": symbol, "date": pd.to_datetime(df["rcept_dt"], errors="coerce"), "label": labels})
+        return events.groupby(["ticker", "date"], sort=False)["label"].agg("; ".join).reset_index()
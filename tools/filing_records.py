@@ -0,0 +1,230 @@
+import math
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _format_value(value) -> str:
+    """
+    LLM 에 전달할 값을 짧은 문자열로 변환한다.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return "Y" if value else "N"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value.is_integer():
+            return str(int(value))
+        return f"{value:.4f}".rstrip("0").rstrip(".")
+    if isinstance(value, (pd.Timestamp, datetime)):
+        if pd.isna(value):
+            return ""
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value).replace("|", "/").replace("\n", " ").strip()
+
+
+def serialize_columns(
+    columns: list[str],
+    rows: list[tuple],
+    title: Optional[str] = None,
+    max_rows: Optional[int] = None
+) -> str:
+    """
+    행 목록을 짧은 컬럼 지향 텍스트로 직렬화한다.
+
+    - 모든 행에서 값이 같은 컬럼은 'common:' 한 줄로 올리고 행에서 제외
+    - 모든 행에서 비어 있는 컬럼은 제외
+    - 나머지는 헤더 한 줄 + '|' 구분 행으로 출력
+    """
+    if not rows:
+        return f"# {title} (0 rows)" if title else ""
+
+    formatted = [[_format_value(value) for value in row] for row in rows]
+    column_values = list(zip(*formatted))
+
+    common, keep = [], []
+    for idx, values in enumerate(column_values):
+        first = values[0]
+        if all(value == first for value in values):
+            if first and len(rows) > 1:
+                common.append(f"{columns[idx]}={first}")
+            elif first:
+                keep.append(idx)
+        else:
+            keep.append(idx)
+
+    lines = []
+    if title:
+        lines.append(f"# {title} ({len(rows)} rows)")
+    if common:
+        lines.append("common: " + "; ".join(common))
+    if keep:
+        lines.append("cols: " + "|".join(columns[idx] for idx in keep))
+        shown = formatted if max_rows is None else formatted[:max_rows]
+        lines.extend("|".join(row[idx] for idx in keep) for row in shown)
+        if max_rows is not None and len(formatted) > max_rows:
+            lines.append(f"... (+{len(formatted) - max_rows} rows)")
+    return "\n".join(lines)
+
+
+def serialize_frame(df: pd.DataFrame, title: Optional[str] = None, max_rows: Optional[int] = None) -> str:
+    """
+    DataFrame(DART 조회 결과 등)을 serialize_columns 형식으로 직렬화한다.
+    """
+    return serialize_columns(
+        [str(column) for column in df.columns],
+        list(df.itertuples(index=False, name=None)),
+        title=title,
+        max_rows=max_rows
+    )
+
+
+class CompactRecord(ABC):
+    """
+    공시 조회 결과 1행을 표현하는 __slots__ 기반 레코드의 기반 클래스.
+    중첩 dict 대신 고정 필드만 보관하여 인스턴스당 메모리를 줄인다.
+    """
+
+    __slots__ = ()
+    TITLE = ""
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def to_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_dict(self) -> dict:
+        return dict(zip(self.__slots__, self.to_tuple()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    @abstractmethod
+    def from_filtered(cls, filings: Iterable[dict]) -> list:
+        """
+        filter_response 결과 목록에서 레코드 목록을 일괄 생성한다.
+        """
+
+    @classmethod
+    def serialize(cls, records: list, max_rows: Optional[int] = None) -> str:
+        return serialize_columns(
+            list(cls.__slots__),
+            [record.to_tuple() for record in records],
+            title=cls.TITLE,
+            max_rows=max_rows
+        )
+
+
+class InsiderTransactionRecord(CompactRecord):
+    """
+    Form 3/4/5 거래 1건 (SECInsiderTradeAPI.filter_response 기준).
+    table 은 비파생(N) / 파생(D) 구분.
+    """
+
+    __slots__ = (
+        "filedAt", "ticker", "owner", "role", "table", "date", "code", "ad",
+        "security", "shares", "price", "ownedAfter", "exercisePrice", "expiration"
+    )
+    TITLE = "SEC insider transactions"
+
+    @staticmethod
+    def _role(relationship: dict) -> str:
+        roles = []
+        if relationship.get("officerTitle"):
+            roles.append(relationship["officerTitle"])
+        elif relationship.get("isOfficer"):
+            roles.append("Officer")
+        if relationship.get("isDirector"):
+            roles.append("Director")
+        if relationship.get("isTenPercentOwner"):
+            roles.append("10%Owner")
+        return "/".join(roles)
+
+    @classmethod
+    def from_filtered(cls, filings: Iterable[dict]) -> list:
+        records = []
+        for filing in filings or []:
+            owner = filing.get("reportingOwner") or {}
+            head = (
+                filing.get("filedAt"),
+                (filing.get("issuer") or {}).get("tradingSymbol"),
+                owner.get("name"),
+                cls._role(owner.get("relationship") or {}),
+            )
+            for trans in filing.get("nonDerivativeTransactions", []):
+                records.append(cls(
+                    *head, "N", trans.get("transactionDate"), trans.get("transaction_code"),
+                    trans.get("acquiredDisposedCode"), trans.get("securityTitle"), trans.get("shares"),
+                    trans.get("pricePerShare"), trans.get("sharesOwnedAfter"), None, None
+                ))
+            for trans in filing.get("derivativeTransactions", []):
+                records.append(cls(
+                    *head, "D", trans.get("transactionDate"), trans.get("transaction_code"),
+                    None, trans.get("securityTitle"), trans.get("shares"),
+                    None, None, trans.get("conversionOrExercisePrice"), trans.get("expirationDate")
+                ))
+        return records
+
+
+class OwnershipFilingRecord(CompactRecord):
+    """
+    13D/13G 공시의 보고자 1명 (SEC13D13GAPI.filter_response 기준).
+    본문 항목 중 투자 목적(item4)만 앞부분을 남긴다.
+    """
+
+    __slots__ = (
+        "filedAt", "formType", "issuer", "cusip", "owner", "percent", "shares",
+        "soleVoting", "sharedVoting", "ownerType", "purpose"
+    )
+    TITLE = "SEC 13D/13G filings"
+    PURPOSE_CHARS = 200
+
+    @classmethod
+    def from_filtered(cls, filings: Iterable[dict]) -> list:
+        records = []
+        for filing in filings or []:
+            purpose = (filing.get("item4") or "")[:cls.PURPOSE_CHARS] or None
+            for owner in filing.get("owners", []) or [{}]:
+                records.append(cls(
+                    filing.get("filedAt"), filing.get("formType"), filing.get("nameOfIssuer"),
+                    filing.get("cusip"), owner.get("name"), owner.get("amountAsPercent"),
+                    owner.get("aggregateAmountOwned"), owner.get("soleVotingPower"),
+                    owner.get("sharedVotingPower"), owner.get("typeOfReportingPerson"), purpose
+                ))
+        return records
+
+
+class InstitutionalHoldingRecord(CompactRecord):
+    """
+    13F 보유 종목 1건 (SEC13FHoldingsAPI.filter_response 기준).
+    """
+
+    __slots__ = (
+        "filedAt", "institution", "period", "issuer", "ticker", "cusip", "titleOfClass",
+        "value", "shares", "shareType", "putCall"
+    )
+    TITLE = "SEC 13F holdings"
+
+    @classmethod
+    def from_filtered(cls, filings: Iterable[dict]) -> list:
+        records = []
+        for filing in filings or []:
+            head = (filing.get("filedAt"), filing.get("institutionName"), filing.get("periodOfReport"))
+            for holding in filing.get("holdings", []):
+                records.append(cls(
+                    *head, holding.get("nameOfIssuer"), holding.get("ticker"), holding.get("cusip"),
+                    holding.get("titleOfClass"), holding.get("value"), holding.get("shrsOrPrnAmt"),
+                    holding.get("shrsOrPrnAmtType"), holding.get("putCall")
+                ))
+        return records
@@ -0,0 +1,162 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.fred_series_cache import FredSeriesCache
+from tools.fred_release_calendar import FredReleaseCalendar
+from tools.filing_records import serialize_columns
+
+
+class FredSeriesPanel:
+    """
+    여러 FRED 시계열을 로컬 캐시에서 동시에 읽어 하나의 공통 주기 표로 맞추는 클래스.
+
+    - 별칭(ALIASES) 또는 FRED series_id 를 받으며, 별칭에는 발표(release) id 가 함께 묶여 있다.
+    - 기본 주기는 요청한 시계열 중 가장 긴 주기이며, 더 촘촘한 시계열은 기간 평균(avg) 또는 기말 값(eop)으로 집계한다.
+    - 변환(yoy/mom/diff)은 공통 주기로 맞춘 뒤 계산한다.
+    """
+
+    # 별칭 → (FRED series_id, release_id) - release_id 가 None 이면 발표 일정을 추적하지 않는다
+    ALIASES = {
+        "core_cpi": ("CPILFESL", 10),
+        "cpi": ("CPIAUCSL", 10),
+        "core_pce": ("PCEPILFE", 54),
+        "pce": ("PCEPI", 54),
+        "personal_income": ("PI", 54),
+        "unemployment": ("UNRATE", 50),
+        "payrolls": ("PAYEMS", 50),
+        "jobless_claims": ("ICSA", 180),
+        "mortgage_30y": ("MORTGAGE30US", None),
+        "fed_funds": ("DFF", 18),
+        "treasury_2y": ("DGS2", 18),
+        "treasury_10y": ("DGS10", 18),
+        "real_gdp": ("GDPC1", 53),
+        "retail_sales": ("RSAFS", 9),
+        "industrial_production": ("INDPRO", 13),
+    }
+
+    # FRED frequency_short → (순서, resample 규칙, yoy 기간 수)
+    # 일/주 단위는 1년의 행 수가 일정하지 않아(주말·휴일, 53주 해) 기간 수 대신 1년 전 날짜로 비교한다
+    FREQUENCIES = {
+        "D": (0, "D", None),
+        "W": (1, "W-SAT", None),
+        "BW": (2, "2W-SAT", None),
+        "M": (3, "MS", 12),
+        "Q": (4, "QS", 4),
+        "SA": (5, "2QS", 2),
+        "A": (6, "YS", 1),
+    }
+    TRANSFORMS = ("level", "yoy", "mom", "diff")
+    AGGREGATIONS = ("avg", "eop")
+    MAX_SERIES = 12
+    MAX_WORKERS = 8
+
+    def __init__(self, fred_cache: FredSeriesCache, release_calendar: FredReleaseCalendar):
+        self.fred_cache = fred_cache
+        self.release_calendar = release_calendar
+
+    @classmethod
+    def resolve(cls, name: str) -> tuple[str, str, Optional[int]]:
+        """
+        별칭 또는 series_id → (표시 이름, series_id, release_id)
+        """
+        key = name.strip().lower()
+        if key in cls.ALIASES:
+            series_id, release_id = cls.ALIASES[key]
+            return key, series_id, release_id
+        return name.strip().upper(), name.strip().upper(), None
+
+    def _fetch(self, series_id: str, start: str, end: Optional[str]) -> tuple[pd.Series, Optional[str]]:
+        values = self.fred_cache.series(series_id, start, end)
+        return values, self.fred_cache.frequency(series_id)
+
+    def build(
+        self,
+        names: list[str],
+        observation_start: str,
+        observation_end: Optional[str] = None,
+        frequency: Optional[str] = None,
+        aggregation: str = "avg",
+        transform: str = "level"
+    ) -> tuple[pd.DataFrame, dict, list[str]]:
+        """
+        Returns:
+            tuple: (날짜 × 시계열 표, 시계열별 정보, 빠진 시계열 목록)
+        """
+        if transform not in self.TRANSFORMS:
+            raise ValueError(f"지원하지 않는 transform 입니다: {transform} (가능: {', '.join(self.TRANSFORMS)})")
+        if aggregation not in self.AGGREGATIONS:
+            raise ValueError(f"지원하지 않는 aggregation 입니다: {aggregation} (가능: {', '.join(self.AGGREGATIONS)})")
+        if frequency is not None and frequency.upper() not in self.FREQUENCIES:
+            raise ValueError(f"지원하지 않는 frequency 입니다: {frequency} (가능: {', '.join(self.FREQUENCIES)})")
+
+        resolved = list(dict.fromkeys(self.resolve(name) for name in names if name and name.strip()))[:self.MAX_SERIES]
+        if not resolved:
+            raise ValueError("시계열을 하나 이상 지정해야 합니다.")
+
+        # 변환에 필요한 앞쪽 구간까지 받는다
+        fetch_start = observation_start
+        if transform != "level":
+            fetch_start = (pd.Timestamp(observation_start) - pd.DateOffset(years=1, months=3)).strftime("%Y-%m-%d")
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(resolved))) as executor:
+            fetched = list(executor.map(lambda item: self._fetch(item[1], fetch_start, observation_end), resolved))
+
+        info, frames, missing = {}, {}, []
+        native = []
+        for (label, series_id, release_id), (values, native_frequency) in zip(resolved, fetched):
+            values = values.dropna()
+            if values.empty:
+                missing.append(label)
+                continue
+            frames[label] = values
+            native_frequency = native_frequency if native_frequency in self.FREQUENCIES else "D"
+            native.append(native_frequency)
+            info[label] = {
+                "series_id": series_id,
+                "native_frequency": native_frequency,
+                "last_observation": values.index[-1].strftime("%Y-%m-%d")
+            }
+            if release_id is not None:
+                upcoming = self.release_calendar.upcoming(release_id)
+                info[label]["next_release"] = upcoming.strftime("%Y-%m-%d") if upcoming is not None else None
+        if not frames:
+            return pd.DataFrame(), info, missing
+
+        target = frequency.upper() if frequency else max(native, key=lambda f: self.FREQUENCIES[f][0])
+        _, rule, periods_per_year = self.FREQUENCIES[target]
+        columns = {}
+        for label, values in frames.items():
+            resampled = values.resample(rule)
+            columns[label] = resampled.mean() if aggregation == "avg" else resampled.last()
+        table = pd.DataFrame(columns).dropna(how="all")
+
+        if transform == "yoy":
+            if periods_per_year:
+                prior = table.shift(periods_per_year)
+            else:
+                # 1년 전 날짜 시점(as-of)의 값 (윤년 2/28, 2/29 는 다음 해 2/28 로 겹치므로 뒤의 값을 쓴다)
+                prior = table.shift(freq=pd.DateOffset(years=1)).ffill()
+                prior = prior[~prior.index.duplicated(keep="last")].reindex(table.index, method="ffill")
+            table = (table / prior - 1) * 100
+        elif transform == "mom":
+            table = (table / table.shift(1) - 1) * 100
+        elif transform == "diff":
+            table = table.diff()
+        table = table.replace([np.inf, -np.inf], np.nan)
+        table = table[table.index >= pd.Timestamp(observation_start)]
+        table.attrs.update({"frequency": target, "aggregation": aggregation, "transform": transform})
+        return table.dropna(how="all"), info, missing
+
+    def format(self, table: pd.DataFrame, limit: int = 24, title: Optional[str] = None) -> str:
+        """
+        최신순 limit 행을 'date|series1|series2...' 텍스트로 변환한다.
+        """
+        recent = table.iloc[::-1].iloc[:limit].round(4)
+        rows = [
+            (date, *(None if np.isnan(value) else float(value) for value in values))
+            for date, values in zip(recent.index, recent.to_numpy(dtype=float))
+        ]
+        return serialize_columns(["date", *table.columns], rows, title=title)
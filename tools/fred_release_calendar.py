@@ -0,0 +1,140 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.fred_series_cache import FredSeriesCache
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class FredReleaseCalendar:
+    """
+    FRED 발표(release) 일정을 release_id 단위로 디스크에 보관하고, 관측 기간을 실제 발표일에 매핑하는 인덱스.
+
+    - 예정된 미래 발표일까지 포함해 받으며, REFRESH_SECONDS 가 지나거나 다음 예정일이 지나면 다시 받는다.
+    - 관측치의 발표일 = 해당 관측 기간이 끝난 뒤(PERIOD_ENDS) 처음 열린 발표일.
+      정렬된 발표일 배열에 searchsorted 로 as-of 조인하므로 목록 길이/순서가 달라도 어긋나지 않는다.
+    """
+
+    REFRESH_SECONDS = 24 * 60 * 60
+    MAX_LIMIT = 10000
+
+    # 관측일(FRED date) → 그 관측 기간이 끝나는 날
+    PERIOD_ENDS = {
+        "M": lambda dates: (dates.astype("datetime64[M]") + 1).astype("datetime64[D]"),
+        "Q": lambda dates: (dates.astype("datetime64[M]") + 3).astype("datetime64[D]"),
+        # 주간 청구 건수 등은 주의 마지막 날(토요일)이 관측일
+        "W": lambda dates: dates + 1,
+        "D": lambda dates: dates,
+    }
+
+    def __init__(self, fred_cache: FredSeriesCache, cache_dir: Optional[str] = None):
+        self.fred_cache = fred_cache
+        self.cache_dir = cache_dir or os.path.dirname(data_path("fred", "releases", "_"))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._memory: dict[int, tuple[np.ndarray, float]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, release_id: int) -> str:
+        return os.path.join(self.cache_dir, f"{int(release_id)}.json")
+
+    def _load(self, release_id: int) -> Optional[tuple[np.ndarray, float]]:
+        with self._lock:
+            if release_id in self._memory:
+                return self._memory[release_id]
+        try:
+            with open(self._path(release_id), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[FredReleaseCalendar] {release_id} 캐시 로드 실패: {e}")
+            return None
+        entry = (np.array(stored["dates"], dtype="datetime64[D]"), stored["fetched_at"])
+        with self._lock:
+            self._memory[release_id] = entry
+        return entry
+
+    def _expired(self, entry: tuple[np.ndarray, float]) -> bool:
+        dates, fetched_at = entry
+        if time.time() - fetched_at >= self.REFRESH_SECONDS:
+            return True
+        # 받을 당시 '다음 예정일'이 이미 지났으면 일정이 바뀌었을 수 있다
+        fetched_day = np.datetime64(datetime.fromtimestamp(fetched_at).date(), "D")
+        today = np.datetime64(pd.Timestamp.now().date(), "D")
+        upcoming = dates[dates > fetched_day]
+        return bool(upcoming.size and upcoming[0] <= today)
+
+    def refresh(self, release_id: int) -> np.ndarray:
+        release_id = int(release_id)
+        try:
+            payload = self.fred_cache.request(
+                "release/dates",
+                release_id=release_id,
+                sort_order="asc",
+                limit=self.MAX_LIMIT,
+                include_release_dates_with_no_data="true"
+            )
+        except Exception as e:
+            logger.warning(f"[FredReleaseCalendar] {release_id} 발표 일정 갱신 실패: {e}")
+            entry = self._load(release_id)
+            return entry[0] if entry else np.array([], dtype="datetime64[D]")
+
+        dates = np.unique(np.array([item["date"] for item in payload.get("release_dates", [])], dtype="datetime64[D]"))
+        fetched_at = time.time()
+        with self._lock:
+            self._memory[release_id] = (dates, fetched_at)
+        try:
+            with open(self._path(release_id), "w", encoding="utf-8") as f:
+                json.dump({"dates": [str(day) for day in dates], "fetched_at": fetched_at}, f)
+        except Exception as e:
+            logger.warning(f"[FredReleaseCalendar] {release_id} 캐시 저장 실패: {e}")
+        return dates
+
+    def dates(self, release_id: int) -> np.ndarray:
+        """
+        오름차순 발표일 (예정일 포함, datetime64[D]).
+        """
+        entry = self._load(int(release_id))
+        if entry is None or self._expired(entry):
+            return self.refresh(release_id)
+        return entry[0]
+
+    def past_dates(self, release_id: int, limit: int) -> list[str]:
+        """
+        오늘까지 열린 발표일 최신순 limit 개.
+        """
+        dates = self.dates(release_id)
+        today = np.datetime64(pd.Timestamp.now().date(), "D")
+        past = dates[: np.searchsorted(dates, today, side="right")]
+        return [str(day) for day in past[::-1][:limit]]
+
+    def upcoming(self, release_id: int, after: Optional[pd.Timestamp] = None) -> Optional[pd.Timestamp]:
+        """
+        after(기본: 오늘) 이후 첫 예정 발표일.
+        """
+        dates = self.dates(release_id)
+        after = np.datetime64((after or pd.Timestamp.now()).date(), "D")
+        pos = np.searchsorted(dates, after, side="right")
+        return pd.Timestamp(dates[pos]) if pos < len(dates) else None
+
+    def align(self, release_id: int, observation_dates: list[str], frequency: str = "M") -> list[str]:
+        """
+        관측일마다 그 값이 처음 발표된 날. (해당 기간 종료 후 첫 발표일, 찾을 수 없으면 "N/A")
+        """
+        if not observation_dates:
+            return []
+        dates = self.dates(release_id)
+        if dates.size == 0:
+            return ["N/A"] * len(observation_dates)
+        period_ends = self.PERIOD_ENDS[frequency](np.array(observation_dates, dtype="datetime64[D]"))
+        pos = np.searchsorted(dates, period_ends, side="left")
+        found = pos < len(dates)
+        released = np.where(found, dates[np.minimum(pos, len(dates) - 1)], np.datetime64("NaT"))
+        return [str(day) if found[i] else "N/A" for i, day in enumerate(released)]
@@ -0,0 +1,176 @@
+import os
+import json
+import time
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import requests
+
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class FredSeriesCache:
+    """
+    FRED 관측치를 series_id 단위로 디스크에 보관하고, 시리즈가 갱신됐을 때만 다시 받는 캐시.
+
+    - 시리즈의 last_updated(FRED series 메타)가 그대로면 관측치를 요청하지 않는다.
+    - 바뀌었으면 전체 이력을 한 번의 요청으로 다시 받는다. 계절조정 재추정(CPI 는 매년 2월 5년치)이나
+      벤치마크 개정(PCE 는 수십 년치)이 먼 과거까지 바뀌므로, 최근 구간만 받아 붙이면 새/옛 수정치가 섞인다.
+    - 메타 확인은 CHECK_TTL_SECONDS 마다 한 번만 하며, 그 사이 요청은 디스크/메모리에서 구간을 잘라 반환한다.
+    - 갱신이 실패하면 가지고 있는 데이터를 그대로 반환한다.
+    """
+
+    BASE_URL = "https://api.stlouisfed.org/fred"
+    CHECK_TTL_SECONDS = 60 * 60
+    REQUEST_TIMEOUT = 15
+    MAX_LIMIT = 100000
+
+    def __init__(self, api_key: Optional[str], cache_dir: Optional[str] = None):
+        self.api_key = api_key
+        self.cache_dir = cache_dir or os.path.dirname(data_path("fred", "_"))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._memory: dict[str, tuple[pd.DataFrame, dict]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _lock_for(self, series_id: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(series_id, threading.Lock())
+
+    def _paths(self, series_id: str) -> tuple[str, str]:
+        base = os.path.join(self.cache_dir, series_id.replace("/", "_"))
+        return f"{base}.parquet", f"{base}.json"
+
+    def _load(self, series_id: str) -> tuple[pd.DataFrame, dict]:
+        with self._lock:
+            if series_id in self._memory:
+                return self._memory[series_id]
+
+        df, meta = pd.DataFrame(columns=["date", "value"]), {"checked_at": 0.0}
+        parquet_path, meta_path = self._paths(series_id)
+        if os.path.exists(parquet_path) and os.path.exists(meta_path):
+            try:
+                df = pd.read_parquet(parquet_path)
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except Exception as e:
+                logger.warning(f"[FredSeriesCache] {series_id} 캐시 로드 실패: {e}")
+                df, meta = pd.DataFrame(columns=["date", "value"]), {"checked_at": 0.0}
+
+        with self._lock:
+            self._memory[series_id] = (df, meta)
+        return df, meta
+
+    def _save(self, series_id: str, df: pd.DataFrame, meta: dict):
+        with self._lock:
+            self._memory[series_id] = (df, meta)
+        parquet_path, meta_path = self._paths(series_id)
+        try:
+            df.to_parquet(parquet_path, index=False)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except Exception as e:
+            logger.warning(f"[FredSeriesCache] {series_id} 캐시 저장 실패: {e}")
+
+    def request(self, path: str, **params) -> dict:
+        params.update({"api_key": self.api_key, "file_type": "json"})
+        response = requests.get(f"{self.BASE_URL}/{path}", params=params, timeout=self.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    def series_info(self, series_id: str) -> dict:
+        """
+        FRED series 메타 (last_updated, frequency_short, observation_end 등).
+        """
+        series = self.request("series", series_id=series_id).get("seriess", [])
+        return series[0] if series else {}
+
+    def _download(self, series_id: str) -> pd.DataFrame:
+        observations = self.request(
+            "series/observations", series_id=series_id, sort_order="asc", limit=self.MAX_LIMIT
+        ).get("observations", [])
+        return pd.DataFrame(
+            [(entry["date"], entry["value"]) for entry in observations], columns=["date", "value"]
+        )
+
+    def sync(self, series_id: str, force: bool = False) -> pd.DataFrame:
+        """
+        last_updated 가 바뀐 경우에만 전체 관측치를 다시 받아 교체한다.
+
+        :param force: True 이면 CHECK_TTL_SECONDS 와 관계없이 메타를 확인한다. (발표 직후 프리페치용)
+        """
+        series_id = series_id.strip().upper()
+        with self._lock_for(series_id):
+            df, meta = self._load(series_id)
+            if not force and not df.empty and time.time() - meta.get("checked_at", 0.0) < self.CHECK_TTL_SECONDS:
+                return df
+
+            try:
+                info = self.series_info(series_id)
+                meta = dict(meta, checked_at=time.time())
+                if df.empty or info.get("last_updated") != meta.get("last_updated"):
+                    df = self._download(series_id)
+                    meta.update({
+                        "last_updated": info.get("last_updated"),
+                        "frequency": info.get("frequency_short"),
+                        "last_observation": df["date"].iat[-1] if not df.empty else None
+                    })
+                    logger.info(f"[FredSeriesCache] {series_id} 갱신: {len(df)}건 수신")
+                self._save(series_id, df, meta)
+            except Exception as e:
+                logger.warning(f"[FredSeriesCache] {series_id} 갱신 실패, 캐시 데이터를 사용합니다: {e}")
+            return df
+
+    def observations(
+        self,
+        series_id: str,
+        observation_start: Optional[str] = None,
+        observation_end: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort_order: str = "asc"
+    ) -> list[dict]:
+        """
+        FRED series/observations 응답과 같은 모양의 [{"date", "value"}] 목록.
+        구간은 양끝 포함이며, limit 은 sort_order 방향의 앞에서부터 센다.
+        """
+        df = self.sync(series_id)
+        dates = df["date"].to_numpy(dtype=str)
+        lo = np.searchsorted(dates, observation_start, side="left") if observation_start else 0
+        hi = np.searchsorted(dates, observation_end, side="right") if observation_end else len(dates)
+        rows = df.iloc[lo:hi]
+        if sort_order == "desc":
+            rows = rows.iloc[::-1]
+        if limit:
+            rows = rows.iloc[:limit]
+        return rows.to_dict("records")
+
+    def last_updated(self, series_id: str) -> Optional[str]:
+        """
+        마지막으로 받은 시점의 FRED last_updated. (프리페처가 새 발표 반영 여부를 판단하는 데 사용)
+        """
+        return self._load(series_id.strip().upper())[1].get("last_updated")
+
+    def frequency(self, series_id: str) -> Optional[str]:
+        """
+        FRED frequency_short ("D", "W", "BW", "M", "Q", "SA", "A"). 동기화된 적이 없으면 None.
+        """
+        return self._load(series_id.strip().upper())[1].get("frequency")
+
+    def series(
+        self,
+        series_id: str,
+        observation_start: Optional[str] = None,
+        observation_end: Optional[str] = None
+    ) -> pd.Series:
+        """
+        날짜 인덱스의 float 시계열. (결측 "." 은 NaN)
+        """
+        rows = pd.DataFrame(self.observations(series_id, observation_start, observation_end), columns=["date", "value"])
+        return pd.Series(
+            pd.to_numeric(rows["value"], errors="coerce").to_numpy(dtype=float),
+            index=pd.DatetimeIndex(pd.to_datetime(rows["date"])),
+            name=series_id.strip().upper()
+        )
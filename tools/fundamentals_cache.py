@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pandas as pd
+
+from tools.ticker_pool import YFTickerPool
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class FundamentalsCache:
+    """
+    (ticker, freq) 단위 손익계산서를 디스크에 보관하고, 실적 발표 일정으로 무효화하는 캐시.
+
+    - 유효 기간은 고정 TTL 이 아니라 '다음 실적 발표일 다음 날' 까지다.
+    - 발표일이 지났는데 Yahoo 데이터에 새 분기가 아직 없으면 RETRY_SECONDS 간격으로 다시 확인한다.
+      (MAX_REPORT_LAG_DAYS 가 지나면 포기하고 다음 발표일 기준으로 돌아감)
+    - 발표일을 모르는 종목은 DEFAULT_TTL_SECONDS 만큼만 유지한다.
+    - 갱신이 실패하면 만료된 데이터라도 그대로 반환한다.
+    """
+
+    FREQS = ("quarterly", "yearly")
+    RETRY_SECONDS = 6 * 60 * 60
+    DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+    MAX_TTL_SECONDS = 100 * 24 * 60 * 60
+    MAX_REPORT_LAG_DAYS = 14
+
+    def __init__(self, ticker_pool: YFTickerPool, cache_dir: Optional[str] = None):
+        self.ticker_pool = ticker_pool
+        self.cache_dir = cache_dir or os.path.dirname(data_path("fundamentals", "_"))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._memory: dict[tuple[str, str], tuple[pd.DataFrame, dict]] = {}
+        self._lock = threading.Lock()
+
+    def _paths(self, ticker: str, freq: str) -> tuple[str, str]:
+        base = os.path.join(self.cache_dir, f"{ticker.replace('/', '_')}_{freq}")
+        return f"{base}.parquet", f"{base}.json"
+
+    def _load(self, ticker: str, freq: str) -> Optional[tuple[pd.DataFrame, dict]]:
+        key = (ticker, freq)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+
+        parquet_path, meta_path = self._paths(ticker, freq)
+        if not (os.path.exists(parquet_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            df = pd.read_parquet(parquet_path)
+            # Parquet 은 문자열 컬럼명만 지원하므로 저장 시 문자열로 바꾼 기간 컬럼을 복원
+            df.columns = pd.to_datetime(df.columns)
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except Exception as e:
+            logger.warning(f"[FundamentalsCache] {ticker}/{freq} 캐시 로드 실패: {e}")
+            return None
+
+        with self._lock:
+            self._memory[key] = (df, meta)
+        return df, meta
+
+    def _save(self, ticker: str, freq: str, df: pd.DataFrame, meta: dict):
+        with self._lock:
+            self._memory[(ticker, freq)] = (df, meta)
+        parquet_path, meta_path = self._paths(ticker, freq)
+        try:
+            stored = df.copy()
+            stored.columns = [str(column) for column in stored.columns]
+            stored.to_parquet(parquet_path)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except Exception as e:
+            logger.warning(f"[FundamentalsCache] {ticker}/{freq} 캐시 저장 실패: {e}")
+
+    @staticmethod
+    def _latest_period(df: pd.DataFrame) -> Optional[str]:
+        if df is None or df.empty or len(df.columns) == 0:
+            return None
+        return pd.Timestamp(max(df.columns)).strftime("%Y-%m-%d")
+
+    def _valid_until(self, ticker: str, latest_period: Optional[str], previous: Optional[dict]) -> tuple[float, Optional[str]]:
+        """
+        새로 받은 데이터의 만료 시각과 기준이 된 실적 발표일.
+        """
+        now = time.time()
+        today = datetime.now().date()
+
+        # 직전 발표일이 지났는데 새 기간이 아직 반영되지 않은 경우 짧게 재확인
+        if previous and previous.get("next_earnings"):
+            reported = datetime.strptime(previous["next_earnings"], "%Y-%m-%d").date()
+            lagging = previous.get("latest_period") == latest_period
+            if reported <= today and lagging and (today - reported).days <= self.MAX_REPORT_LAG_DAYS:
+                return now + self.RETRY_SECONDS, previous["next_earnings"]
+
+        next_date = self.ticker_pool.next_earnings_date(ticker)
+        if next_date is None:
+            return now + self.DEFAULT_TTL_SECONDS, None
+        expires = datetime.combine(next_date + timedelta(days=1), datetime.min.time()).timestamp()
+        return min(max(expires, now + self.RETRY_SECONDS), now + self.MAX_TTL_SECONDS), next_date.strftime("%Y-%m-%d")
+
+    def needs_refresh(self, ticker: str, freq: str) -> bool:
+        entry = self._load(ticker.strip().upper(), freq)
+        return entry is None or entry[1].get("valid_until", 0) <= time.time()
+
+    def refresh(self, ticker: str, freq: str = "quarterly") -> pd.DataFrame:
+        """
+        Yahoo 에서 다시 받아 저장한다. 실패하면 기존 데이터를 반환한다.
+        """
+        ticker = ticker.strip().upper()
+        previous = self._load(ticker, freq)
+        try:
+            self.ticker_pool.invalidate(ticker, f"financials:{freq}")
+            df = self.ticker_pool.financials(ticker, freq=freq)
+        except Exception as e:
+            logger.warning(f"[FundamentalsCache] {ticker}/{freq} 갱신 실패: {e}")
+            return previous[0] if previous else pd.DataFrame()
+        if df is None:
+            df = pd.DataFrame()
+
+        latest_period = self._latest_period(df)
+        valid_until, next_earnings = self._valid_until(ticker, latest_period, previous[1] if previous else None)
+        meta = {
+            "fetched_at": time.time(),
+            "valid_until": valid_until,
+            "latest_period": latest_period,
+            "next_earnings": next_earnings
+        }
+        self._save(ticker, freq, df, meta)
+        return df
+
+    def get(self, ticker: str, freq: str = "quarterly") -> pd.DataFrame:
+        ticker = ticker.strip().upper()
+        entry = self._load(ticker, freq)
+        if entry is not None and entry[1].get("valid_until", 0) > time.time():
+            return entry[0]
+        return self.refresh(ticker, freq)
+
+    def cached(self, ticker: str, freq: str = "quarterly") -> pd.DataFrame:
+        """
+        만료 여부와 관계없이 디스크/메모리에 있는 데이터만 반환한다. (없으면 빈 DataFrame)
+        """
+        entry = self._load(ticker.strip().upper(), freq)
+        return entry[0] if entry is not None else pd.DataFrame()
+
+    def cached_tickers(self) -> list[str]:
+        """
+        디스크에 캐시된 종목 목록. (프리페처 감시 대상에 포함)
+        """
+        tickers = set()
+        for name in os.listdir(self.cache_dir):
+            stem, ext = os.path.splitext(name)
+            if ext == ".json" and "_" in stem:
+                tickers.add(stem.rsplit("_", 1)[0])
+        return sorted(tickers)
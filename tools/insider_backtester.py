@@ -0,0 +1,309 @@
+from datetime import timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_cache import OHLCVCache
+from tools.columnar_price_store import ColumnarPriceStore
+from tools.sec_insider_store import SECInsiderStore
+from tools.sec_insider_aggregator import SECInsiderAggregator
+from tools.sec_insider_cluster_detector import SECInsiderClusterDetector
+from tools.filing_records import serialize_columns
+
+
+class InsiderSignalBacktester:
+    """
+    로컬 내부자 스토어의 공시 신호를 캐시된 종가로 백테스트하는 엔진.
+
+    - 신호일은 공시가 시장에 알려진 날(장 마감 후 제출은 다음 날)이며, 그 이후 entry_delay 거래일 종가에 진입한다.
+      제출 시각 없이 날짜만 저장된 행(이전 버전 스토어, 접수 시각이 없는 XML)은 장 마감 후 공시를 구분할 수 없으므로
+      look-ahead 없이 안전한 최소 entry_delay 는 1 이다. entry_delay=0 은 제출 시각이 있는 데이터에서만 의미가 있다.
+    - 모든 거래의 보유 구간 가격 경로를 (거래 × 보유일) 행렬 하나로 모아
+      손절/익절 최초 도달일, 수익률, 최대 역행폭을 거래별 루프 없이 계산한다.
+    - 포트폴리오는 보유 중인 거래를 동일 비중으로 담는다고 보고, (날짜 × 종목) 보유 수 행렬을
+      진입/청산 지점의 누적합으로 만들어 일간 수익률과 낙폭을 계산한다. (같은 종목의 중복 신호 허용)
+    """
+
+    SIGNALS = ("cluster_buy", "insider_buy", "insider_sell")
+    PERIODS_PER_YEAR = 252
+    MAX_HOLDING_DAYS = 252
+
+    def __init__(
+        self,
+        store: SECInsiderStore,
+        cluster_detector: SECInsiderClusterDetector,
+        price_cache: OHLCVCache,
+        price_store: ColumnarPriceStore
+    ):
+        self.store = store
+        self.cluster_detector = cluster_detector
+        self.price_cache = price_cache
+        self.price_store = price_store
+
+    def signals(
+        self,
+        signal: str = "cluster_buy",
+        ticker: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        min_value: Optional[float] = None,
+        window_days: int = 14,
+        min_insiders: int = 3
+    ) -> pd.DataFrame:
+        """
+        신호 목록 (ticker, date, direction). direction 은 매수 신호 1, 매도 신호 -1.
+        """
+        if signal not in self.SIGNALS:
+            raise ValueError(f"signal 은 {self.SIGNALS} 중 하나여야 합니다.")
+
+        if signal == "cluster_buy":
+            events = self.cluster_detector.refresh(window_days, min_insiders)
+            rows = [
+                (event["ticker"], event.get("filed_date") or event["end_date"], event["value"])
+                for ticker_events in events.values()
+                for event in ticker_events
+            ]
+            df = pd.DataFrame(rows, columns=["ticker", "date", "value"])
+            df["date"] = pd.to_datetime(df["date"])
+            direction = 1
+        else:
+            frame = self.store.frame()
+            code = "P" if signal == "insider_buy" else "S"
+            trades = frame[(frame["transaction_code"] == code) & frame["ticker"].notna()]
+            df = (
+                trades.assign(date=SECInsiderAggregator.filing_days(trades["filedAt"]))
+                .groupby(["ticker", "date"], as_index=False)["value"].sum()
+            )
+            direction = 1 if signal == "insider_buy" else -1
+
+        df["ticker"] = df["ticker"].astype(str).str.strip().str.upper()
+        mask = df["date"].notna()
+        if ticker:
+            mask &= df["ticker"] == ticker.strip().upper()
+        if start_date:
+            mask &= df["date"] >= pd.Timestamp(start_date)
+        if end_date:
+            mask &= df["date"] <= pd.Timestamp(end_date)
+        if min_value is not None:
+            mask &= df["value"] >= min_value
+        return df.loc[mask, ["ticker", "date", "value"]].assign(direction=direction).sort_values("date").reset_index(drop=True)
+
+    @staticmethod
+    def exit_offsets(paths: np.ndarray, stop_loss: Optional[float], take_profit: Optional[float]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (거래 × 보유일) 누적 수익률 경로에서 청산 오프셋과 청산 사유를 구한다.
+        사유: 0 = 보유 기간 만료(또는 마지막 가격), 1 = 손절, 2 = 익절
+        """
+        horizon = paths.shape[1] - 1
+        available = np.isfinite(paths)
+        last = np.where(available.any(axis=1), horizon - np.argmax(available[:, ::-1], axis=1), 0)
+
+        stop_hit = paths <= -stop_loss if stop_loss else np.zeros(paths.shape, dtype=bool)
+        take_hit = paths >= take_profit if take_profit else np.zeros(paths.shape, dtype=bool)
+        stop_hit[:, 0] = take_hit[:, 0] = False
+        triggered = stop_hit | take_hit
+        first = np.where(triggered.any(axis=1), np.argmax(triggered, axis=1), horizon + 1)
+
+        exit_at = np.minimum(first, last)
+        rows = np.arange(len(paths))
+        reason = np.where(
+            first <= last,
+            np.where(stop_hit[rows, np.minimum(first, horizon)], 1, 2),
+            0
+        )
+        return exit_at, reason
+
+    def simulate(
+        self,
+        signals: pd.DataFrame,
+        closes: pd.DataFrame,
+        benchmark: Optional[str] = None,
+        holding_days: int = 20,
+        entry_delay: int = 1,
+        stop_loss: Optional[float] = None,
+        take_profit: Optional[float] = None
+    ) -> tuple[pd.DataFrame, pd.Series]:
+        """
+        종가 패널(날짜 × 종목)에서 모든 신호를 한 번에 시뮬레이션한다.
+
+        :return: (거래별 결과 DataFrame, 포트폴리오 일간 수익률 Series)
+        """
+        dates = closes.index
+        columns = {ticker: idx for idx, ticker in enumerate(closes.columns)}
+        signals = signals[signals["ticker"].isin(columns)]
+        prices = closes.to_numpy(dtype=float)
+        n_dates = len(dates)
+
+        col = signals["ticker"].map(columns).to_numpy(dtype=int)
+        day0 = np.searchsorted(dates.values, signals["date"].to_numpy(dtype="datetime64[ns]"), side="left")
+        entry = day0 + entry_delay
+        in_range = entry < n_dates
+        col, entry, direction = col[in_range], entry[in_range], signals["direction"].to_numpy()[in_range]
+        signals = signals[in_range]
+
+        offsets = np.arange(holding_days + 1)
+        idx = entry[:, None] + offsets[None, :]
+        path_prices = np.where(idx < n_dates, prices[np.minimum(idx, n_dates - 1), col[:, None]], np.nan)
+        entry_price = path_prices[:, 0]
+        tradable = np.isfinite(entry_price) & (entry_price > 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            paths = (path_prices / entry_price[:, None] - 1.0) * direction[:, None]
+
+        exit_offset, reason = self.exit_offsets(paths, stop_loss, take_profit)
+        rows = np.arange(len(paths))
+        trade_return = paths[rows, exit_offset]
+        held_paths = np.where(offsets[None, :] <= exit_offset[:, None], np.nan_to_num(paths, nan=np.inf), np.inf)
+        worst = held_paths.min(axis=1, initial=np.inf)
+        exit_index = entry + exit_offset
+
+        if benchmark in columns:
+            bench = prices[:, columns[benchmark]]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                bench_return = (bench[exit_index] / bench[entry] - 1.0) * direction
+        else:
+            bench_return = np.full(len(paths), np.nan)
+
+        trades = pd.DataFrame({
+            "ticker": signals["ticker"].to_numpy(),
+            "signal_date": signals["date"].to_numpy(),
+            "entry_date": dates[entry],
+            "exit_date": dates[exit_index],
+            "holding_days": exit_offset,
+            "return": trade_return,
+            "excess_return": trade_return - bench_return,
+            "max_adverse": np.minimum(worst, 0.0),
+            "exit_reason": np.array(["horizon", "stop_loss", "take_profit"])[reason],
+            "open": (exit_offset < holding_days) & (reason == 0)
+        })[tradable & (exit_offset > 0)].reset_index(drop=True)
+
+        # 보유 구간 (entry, exit] 의 종목별 보유 수를 진입/청산 지점 누적합으로 계산
+        keep = tradable & (exit_offset > 0)
+        signed = np.zeros((n_dates + 1, len(columns)))
+        held = np.zeros((n_dates + 1, len(columns)))
+        np.add.at(signed, (entry[keep] + 1, col[keep]), direction[keep])
+        np.add.at(signed, (exit_index[keep] + 1, col[keep]), -direction[keep])
+        np.add.at(held, (entry[keep] + 1, col[keep]), 1.0)
+        np.add.at(held, (exit_index[keep] + 1, col[keep]), -1.0)
+        signed, held = np.cumsum(signed, axis=0)[:n_dates], np.cumsum(held, axis=0)[:n_dates]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            daily = np.nan_to_num(prices[1:] / prices[:-1] - 1.0)
+        daily = np.vstack([np.zeros((1, len(columns))), daily])
+        exposure = held.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            portfolio = np.where(exposure > 0, (signed * daily).sum(axis=1) / exposure, 0.0)
+        active = np.flatnonzero(exposure > 0)
+        if active.size == 0:
+            return trades, pd.Series(dtype=float)
+        # 첫 진입 ~ 마지막 청산 구간만 성과 계산에 사용
+        span = slice(active[0], active[-1] + 1)
+        return trades, pd.Series(portfolio[span], index=dates[span])
+
+    @classmethod
+    def summarize(cls, trades: pd.DataFrame, portfolio: pd.Series) -> dict:
+        def _round(value, digits: int = 2):
+            return None if value is None or not np.isfinite(value) else round(float(value), digits)
+
+        returns = trades["return"].to_numpy(dtype=float)
+        excess = trades["excess_return"].to_numpy(dtype=float)
+        summary = {
+            "trades": int(len(trades)),
+            "open_trades": int(trades["open"].sum()),
+            "hit_rate_pct": _round((returns > 0).mean() * 100, 1) if len(returns) else None,
+            "avg_return_pct": _round(np.nanmean(returns) * 100) if len(returns) else None,
+            "median_return_pct": _round(np.nanmedian(returns) * 100) if len(returns) else None,
+            "avg_excess_pct": _round(np.nanmean(excess) * 100) if np.isfinite(excess).any() else None,
+            "excess_hit_rate_pct": _round((excess[np.isfinite(excess)] > 0).mean() * 100, 1) if np.isfinite(excess).any() else None,
+            "avg_holding_days": _round(trades["holding_days"].mean(), 1) if len(trades) else None,
+            "worst_adverse_pct": _round(trades["max_adverse"].min() * 100) if len(trades) else None,
+            "stop_loss_exits": int((trades["exit_reason"] == "stop_loss").sum()),
+            "take_profit_exits": int((trades["exit_reason"] == "take_profit").sum())
+        }
+
+        values = portfolio.to_numpy(dtype=float)
+        if len(values) > 1:
+            wealth = np.cumprod(1.0 + values)
+            drawdown = wealth / np.maximum.accumulate(wealth) - 1.0
+            volatility = values.std(ddof=1) * np.sqrt(cls.PERIODS_PER_YEAR)
+            summary.update({
+                "portfolio_total_return_pct": _round((wealth[-1] - 1.0) * 100),
+                "portfolio_annual_return_pct": _round((wealth[-1] ** (cls.PERIODS_PER_YEAR / len(values)) - 1.0) * 100),
+                "portfolio_volatility_pct": _round(volatility * 100),
+                "portfolio_sharpe": _round(values.mean() * cls.PERIODS_PER_YEAR / volatility) if volatility > 0 else None,
+                "portfolio_max_drawdown_pct": _round(drawdown.min() * 100)
+            })
+        return summary
+
+    def run(
+        self,
+        signal: str = "cluster_buy",
+        ticker: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        holding_days: int = 20,
+        entry_delay: int = 1,
+        stop_loss_pct: Optional[float] = None,
+        take_profit_pct: Optional[float] = None,
+        min_value: Optional[float] = None,
+        window_days: int = 14,
+        min_insiders: int = 3,
+        benchmark: Optional[str] = "SPY"
+    ) -> dict:
+        holding_days = max(1, min(int(holding_days), self.MAX_HOLDING_DAYS))
+        signals = self.signals(signal, ticker, start_date, end_date, min_value, window_days, min_insiders)
+        if signals.empty:
+            return {"summary": f"No {signal} signals in the local insider store for the given filters."}
+
+        benchmark = benchmark.strip().upper() if benchmark else None
+        start = signals["date"].min() - timedelta(days=10)
+        end = signals["date"].max() + timedelta(days=int((holding_days + entry_delay) * 7 / 5) + 14)
+        end = end.strftime("%Y-%m-%d") if end <= OHLCVCache._today() else None
+        symbols = list(dict.fromkeys(signals["ticker"])) + ([benchmark] if benchmark else [])
+        closes = self.price_store.closes(self.price_cache, symbols, start=start.strftime("%Y-%m-%d"), end=end)
+        if closes.empty:
+            return {"summary": "No cached prices for the signal tickers.", "missing": symbols}
+
+        trades, portfolio = self.simulate(
+            signals,
+            closes,
+            benchmark=benchmark,
+            holding_days=holding_days,
+            entry_delay=entry_delay,
+            stop_loss=stop_loss_pct / 100 if stop_loss_pct else None,
+            take_profit=take_profit_pct / 100 if take_profit_pct else None
+        )
+        summary = self.summarize(trades, portfolio)
+
+        by_year = trades.assign(year=trades["entry_date"].dt.year, win=trades["return"] > 0).groupby("year").agg(
+            trades=("return", "size"),
+            hit_rate=("win", "mean"),
+            avg_return=("return", "mean"),
+            avg_excess=("excess_return", "mean")
+        )
+        year_rows = [
+            (year, int(row.trades), round(row.hit_rate * 100, 1), round(row.avg_return * 100, 2),
+             None if pd.isna(row.avg_excess) else round(row.avg_excess * 100, 2))
+            for year, row in by_year.iterrows()
+        ]
+        missing = [symbol for symbol in symbols if symbol not in closes.columns]
+
+        result = {
+            "rules": {
+                "signal": signal,
+                "entry": f"close {entry_delay} trading day(s) after filing",
+                "holding_days": holding_days,
+                "stop_loss_pct": stop_loss_pct,
+                "take_profit_pct": take_profit_pct,
+                "benchmark": benchmark
+            },
+            "summary": summary,
+            "by_year": serialize_columns(
+                ["year", "trades", "hit_rate_pct", "avg_return_pct", "avg_excess_pct"],
+                year_rows,
+                title="Trades by entry year"
+            )
+        }
+        if missing:
+            result["missing_prices"] = len(missing)
+        return result
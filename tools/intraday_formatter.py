@@ -0,0 +1,235 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_formatter import PriceSeriesFormatter
+
+
+class IntradayBarFormatter:
+    """
+    분봉 OHLCV 를 세션(장 전/정규장/장 후)으로 나누고, 토큰 예산에 맞게 집계해 텍스트로 변환하는 클래스.
+
+    - 인덱스는 거래소 현지 시각(tz 제거)이라고 가정하고, 시각만으로 세션을 구분한다.
+    - 집계 구간은 매일 정규장 시작 시각에 맞춰 자르며, 정렬된 봉을 reduceat 로 한 번에 묶는다.
+    - 각 집계 봉에는 OHLC, 거래량과 함께 VWAP(전형가격 (H+L+C)/3 의 거래량 가중 평균)을 붙인다.
+    """
+
+    # 정규장 (시작 분, 종료 분) - 거래소 현지 시각 기준
+    REGULAR_HOURS = (9 * 60 + 30, 16 * 60)
+    MARKET_HOURS = {".KS": (9 * 60, 15 * 60 + 30), ".KQ": (9 * 60, 15 * 60 + 30)}
+
+    PRE, REGULAR, POST = 0, 1, 2
+    SESSION_LABELS = ("pre", "reg", "post")
+
+    # (집계 분 / "session" / "daily", 출력 라벨) - None 은 원본 그대로
+    RESAMPLE_STEPS = [
+        (None, "original"), (5, "5min"), (15, "15min"), (30, "30min"), (60, "hourly"),
+        ("session", "session"), ("daily", "daily")
+    ]
+
+    INTERVAL_MINUTES = {"1m": 1, "2m": 2, "5m": 5, "15m": 15, "30m": 30, "60m": 60, "90m": 90}
+
+    @staticmethod
+    def market_hours(ticker: Optional[str]) -> tuple[int, int]:
+        for suffix, hours in IntradayBarFormatter.MARKET_HOURS.items():
+            if ticker and ticker.upper().endswith(suffix):
+                return hours
+        return IntradayBarFormatter.REGULAR_HOURS
+
+    @staticmethod
+    def sessions(index: pd.DatetimeIndex, hours: tuple[int, int]) -> np.ndarray:
+        """
+        각 봉의 세션 코드 (PRE / REGULAR / POST).
+        """
+        minutes = index.hour.to_numpy() * 60 + index.minute.to_numpy()
+        codes = np.full(len(index), IntradayBarFormatter.REGULAR, dtype=np.int8)
+        codes[minutes < hours[0]] = IntradayBarFormatter.PRE
+        codes[minutes >= hours[1]] = IntradayBarFormatter.POST
+        return codes
+
+    @staticmethod
+    def aggregate(df: pd.DataFrame, keys: np.ndarray, sessions: np.ndarray) -> pd.DataFrame:
+        """
+        오름차순 keys 가 같은 연속 봉을 하나로 묶는다. (첫 봉의 시각을 라벨로 사용)
+        """
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)] - 1
+
+        opens = df["Open"].to_numpy(dtype=float)
+        highs = df["High"].to_numpy(dtype=float)
+        lows = df["Low"].to_numpy(dtype=float)
+        closes = df["Close"].to_numpy(dtype=float)
+        volumes = np.nan_to_num(df["Volume"].to_numpy(dtype=float)) if "Volume" in df.columns else np.zeros(len(df))
+        typical = (highs + lows + closes) / 3
+
+        volume = np.add.reduceat(volumes, starts)
+        traded = np.add.reduceat(np.nan_to_num(typical * volumes), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = np.where(volume > 0, traded / volume, closes[ends])
+
+        return pd.DataFrame({
+            "Open": opens[starts],
+            "High": np.fmax.reduceat(highs, starts),
+            "Low": np.fmin.reduceat(lows, starts),
+            "Close": closes[ends],
+            "Volume": volume,
+            "VWAP": vwap,
+            "Session": sessions[starts]
+        }, index=df.index[starts])
+
+    @staticmethod
+    def resample(df: pd.DataFrame, step, hours: tuple[int, int]) -> pd.DataFrame:
+        """
+        step(분) 단위 봉으로 집계한다. 구간은 매일 정규장 시작 시각 기준이며 세션 경계를 넘지 않는다.
+        step="session" 은 (날짜, 세션), step="daily" 는 날짜 단위로 묶는다.
+        """
+        if df.empty:
+            return df.assign(VWAP=pd.Series(dtype=float), Session=pd.Series(dtype=np.int8))
+
+        sessions = IntradayBarFormatter.sessions(df.index, hours)
+        days = df.index.values.astype("datetime64[D]").astype(np.int64)
+        if step is None:
+            keys = np.arange(len(df))
+        elif step == "daily":
+            keys = days
+        elif step == "session":
+            keys = days * 3 + sessions
+        else:
+            minutes = df.index.hour.to_numpy() * 60 + df.index.minute.to_numpy()
+            buckets = np.floor_divide(minutes - hours[0], int(step)) + 24 * 60
+            keys = (days * 3 + sessions) * 4 * 24 * 60 + buckets
+
+        result = IntradayBarFormatter.aggregate(df, keys, sessions)
+        if step == "daily":
+            result.index = result.index.normalize()
+        result.attrs["step"] = step
+        return result
+
+    @staticmethod
+    def to_text(df: pd.DataFrame, include_extended: bool) -> str:
+        """
+        'time|open|high|low|close|volume|vwap' 행 텍스트. 장 전/후 봉을 포함하면 세션 컬럼을 덧붙인다.
+        세션/일 단위로 집계된 봉(attrs["step"])은 날짜만 표시한다.
+        """
+        columns = "time|open|high|low|close|volume|vwap" + ("|session" if include_extended else "")
+        lines = [f"cols: {columns}"]
+        if df.empty:
+            return lines[0]
+
+        if df.attrs.get("step") in ("session", "daily"):
+            time_format = "%Y-%m-%d"
+        elif df.index[0].year == df.index[-1].year:
+            time_format = "%m-%d %H:%M"
+        else:
+            time_format = "%Y-%m-%d %H:%M"
+        times = df.index.strftime(time_format)
+        values = df[["Open", "High", "Low", "Close", "VWAP"]].to_numpy(dtype=float)
+        volumes = df["Volume"].to_numpy(dtype=float)
+        sessions = df["Session"].to_numpy()
+        for time, (o, h, l, c, vwap), v, session in zip(times, values, volumes, sessions):
+            line = f"{time}|{o:.2f}|{h:.2f}|{l:.2f}|{c:.2f}|{PriceSeriesFormatter._format_volume(v)}|{vwap:.2f}"
+            if include_extended:
+                line += f"|{IntradayBarFormatter.SESSION_LABELS[session]}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def summarize(df: pd.DataFrame, hours: tuple[int, int]) -> dict:
+        """
+        정규장 기준 기간 요약과 마지막 세션 OHLC/VWAP, 장 전/장 후 변동률.
+        """
+        sessions = IntradayBarFormatter.sessions(df.index, hours)
+        regular = df[sessions == IntradayBarFormatter.REGULAR]
+        if regular.empty:
+            return {}
+
+        summary = PriceSeriesFormatter.summarize(regular)
+        for key in ("start", "end", "high_date", "low_date"):
+            summary.pop(key, None)
+        high_idx = int(np.nanargmax(regular["High"].to_numpy(dtype=float)))
+        low_idx = int(np.nanargmin(regular["Low"].to_numpy(dtype=float)))
+        summary.update({
+            "start": regular.index[0].strftime("%Y-%m-%d %H:%M"),
+            "end": regular.index[-1].strftime("%Y-%m-%d %H:%M"),
+            "high_time": regular.index[high_idx].strftime("%Y-%m-%d %H:%M"),
+            "low_time": regular.index[low_idx].strftime("%Y-%m-%d %H:%M"),
+        })
+
+        by_session = IntradayBarFormatter.resample(df, "session", hours)
+        totals = IntradayBarFormatter.resample(regular, "daily", hours)
+        summary["sessions"] = int(len(totals))
+        volume = totals["Volume"].to_numpy(dtype=float)
+        if volume.sum() > 0:
+            summary["vwap"] = round(float((totals["VWAP"].to_numpy(dtype=float) * volume).sum() / volume.sum()), 2)
+
+        last_day = totals.index[-1]
+        last = totals.iloc[-1]
+        summary["last_session"] = {
+            "date": last_day.strftime("%Y-%m-%d"),
+            "open": round(float(last["Open"]), 2),
+            "high": round(float(last["High"]), 2),
+            "low": round(float(last["Low"]), 2),
+            "close": round(float(last["Close"]), 2),
+            "volume": PriceSeriesFormatter._format_volume(float(last["Volume"])),
+            "vwap": round(float(last["VWAP"]), 2),
+        }
+
+        # 가장 최근 날짜 기준 - 장 전: 직전 정규장 종가 대비, 장 후: 당일 정규장 종가 대비
+        days = by_session.index.normalize()
+        codes = by_session["Session"].to_numpy()
+        closes = by_session["Close"].to_numpy(dtype=float)
+        latest = days[-1]
+        regular_closes = totals["Close"].to_numpy(dtype=float)
+        before = np.searchsorted(totals.index.values, latest.to_datetime64(), side="left")
+        pre = np.flatnonzero((days == latest) & (codes == IntradayBarFormatter.PRE))
+        post = np.flatnonzero((days == latest) & (codes == IntradayBarFormatter.POST))
+        if len(pre) and before > 0:
+            summary["premarket_change_pct"] = round(float((closes[pre[0]] / regular_closes[before - 1] - 1) * 100), 2)
+        if len(post) and latest == last_day:
+            summary["after_hours_change_pct"] = round(float((closes[post[0]] / regular_closes[-1] - 1) * 100), 2)
+        return summary
+
+    @staticmethod
+    def format(
+        df: pd.DataFrame,
+        ticker: Optional[str] = None,
+        interval: str = "5m",
+        max_tokens: int = 1500,
+        include_extended: bool = False
+    ) -> dict:
+        """
+        토큰 예산(max_tokens) 안에 들어가는 가장 세밀한 집계 단위로 분봉을 직렬화한다.
+        원본 interval 보다 촘촘한 집계 단위는 건너뛴다.
+
+        Returns:
+            dict: {"ticker", "interval", "resolution", "summary", "bars"}
+        """
+        df = PriceSeriesFormatter.normalize(df, ticker)
+        hours = IntradayBarFormatter.market_hours(ticker)
+        result = {"ticker": ticker, "interval": interval, "resolution": None, "summary": {}, "bars": ""}
+        if df.empty:
+            return result
+
+        result["summary"] = IntradayBarFormatter.summarize(df, hours)
+        if not include_extended:
+            df = df[IntradayBarFormatter.sessions(df.index, hours) == IntradayBarFormatter.REGULAR]
+            if df.empty:
+                return result
+
+        source_minutes = IntradayBarFormatter.INTERVAL_MINUTES.get(interval, 1)
+        steps = [
+            (step, label) for step, label in IntradayBarFormatter.RESAMPLE_STEPS
+            if not isinstance(step, int) or step > source_minutes
+        ]
+        label, text, truncated = PriceSeriesFormatter._fit_to_budget(
+            df,
+            lambda frame, step: IntradayBarFormatter.resample(frame, step, hours),
+            lambda frame: IntradayBarFormatter.to_text(frame, include_extended),
+            max_tokens,
+            steps
+        )
+        result["resolution"], result["bars"] = label, text
+        if truncated:
+            result["truncated_rows"] = truncated
+        return result
@@ -1,18 +1,37 @@
 import os
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import (
     List, Annotated, Literal, Dict, Callable, TypeVar, Tuple, Type, Generic, Optional, Any
 )
 
-import yfinance as yf
+import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 from dotenv import load_dotenv
 from langchain.tools import tool
-from langchain_community.tools import DuckDuckGoSearchRun
 
 from field_definitions.sec_financial_fiedls_definitions import FinancialNecessaryFields
+from tools.price_formatter import PriceSeriesFormatter
+from tools.price_cache import OHLCVCache
+from tools.columnar_price_store import ColumnarPriceStore
+from tools.intraday_formatter import IntradayBarFormatter
+from tools.technical_indicators import TechnicalIndicatorEngine
+from tools.risk_metrics import RiskMetricsEngine
+from tools.ticker_pool import YFTickerPool
+from tools.fundamentals_cache import FundamentalsCache
+from tools.news_pipeline import NewsPipeline
+from tools.web_search_service import WebSearchService
+from tools.option_analytics import OptionChainAnalyzer
+from tools.event_study import EventStudyEngine
+from tools.universe_screener import UniverseScreener
+from tools.sec_insider_trade_tool import SECInsiderTradeAPI
+from tools.filing_records import serialize_columns
+from tools.fred_series_cache import FredSeriesCache
+from tools.fred_release_calendar import FredReleaseCalendar
+from tools.fred_panel import FredSeriesPanel
 
 
 # 환경 변수 로드
@@ -22,12 +41,49 @@ load_dotenv()
 class MarketDataTools:
     """주가 및 시장 데이터를 다루는 도구 클래스"""
 
+    price_cache = OHLCVCache()
+    price_store = ColumnarPriceStore()
+    ticker_pool = YFTickerPool()
+    news_pipeline = NewsPipeline(ticker_pool)
+    web_search = WebSearchService()
+    option_analyzer = OptionChainAnalyzer(ticker_pool)
+    indicator_engine = TechnicalIndicatorEngine()
+    risk_engine = RiskMetricsEngine(price_cache)
+    event_engine = EventStudyEngine(price_cache)
+    # 분봉 interval 별 캐시 (요청이 들어올 때 생성)
+    intraday_caches: Dict[str, OHLCVCache] = {}
+    _intraday_lock = threading.Lock()
+    # LLM 이 자주 쓰는 interval 표기 → yfinance 표기
+    INTERVAL_ALIASES = {
+        "1h": "60m", "60min": "60m", "1hr": "60m", "1min": "1m", "5min": "5m", "15min": "15m", "30min": "30m",
+        "d": "1d", "1day": "1d", "daily": "1d",
+        "1w": "1wk", "w": "1wk", "1week": "1wk", "weekly": "1wk",
+        "1mon": "1mo", "1month": "1mo", "monthly": "1mo", "3mon": "3mo", "quarterly": "3mo"
+    }
+
+    @staticmethod
+    def intraday_cache(interval: str) -> OHLCVCache:
+        with MarketDataTools._intraday_lock:
+            if interval not in MarketDataTools.intraday_caches:
+                MarketDataTools.intraday_caches[interval] = OHLCVCache(interval=interval)
+            return MarketDataTools.intraday_caches[interval]
 
     @staticmethod
     @tool
-    def get_stock_price(ticker: str, period: str = "1d", start: str = None, end: str = None) -> dict:
+    def get_stock_price(
+        ticker: str,
+        period: str = "1d",
+        start: str = None,
+        end: str = None,
+        max_tokens: int = 1500,
+        interval: str = "1d",
+        include_extended: bool = False
+    ) -> dict:
         """
         주어진 주식 티커에 대해 지정된 기간의 가격 데이터를 반환합니다.
+        가격은 로컬 캐시(OHLCVCache)에서 읽고, 캐시에 없는 구간만 새로 다운로드합니다. (수정주가 기준)
+        결과가 토큰 예산을 넘으면 더 큰 단위로 OHLC 집계하여 반환합니다.
+        (일봉: 주봉/월봉/분기봉, 분봉: 5분/15분/30분/1시간/세션/일 단위, 분봉 집계에는 VWAP 포함)
 
         Args:
             ticker (str): 다운로드할 주식 티커. 단일 문자열로 제공 (예: "AAPL").
@@ -37,12 +93,155 @@ class MarketDataTools:
                                 "period" 대신 사용할 수 있으며, 기본값은 None (99년 전부터).
             end (str, optional): 데이터 다운로드 종료 날짜(미포함). 형식: "YYYY-MM-DD". 예: "2023-01-01" (마지막 데이터는 "2022-12-31").
                                 "period" 대신 사용할 수 있으며, 기본값은 None (현재 날짜까지).
+            max_tokens (int, optional): 가격 행(bars)에 사용할 최대 토큰 수. 기본값 1500.
+            interval (str, optional): 봉 주기. "1d"(기본), "1wk", "1mo", "3mo" 또는 분봉 "1m", "2m", "5m", "15m", "30m", "60m", "90m".
+                                "1h", "1w" 같은 표기도 허용하며, 지원하지 않는 값이면 error 를 반환합니다.
+                                분봉은 최근 기간만 제공됩니다. (1m: 7일, 60m: 730일, 그 외: 60일)
+                                분봉에서 "1d", "5d" 같은 period 는 마지막 N 거래일(세션)을 의미합니다.
+            include_extended (bool, optional): 분봉에서 장 전/장 후 봉을 bars 에 포함할지 여부. 기본값 False.
+                                요약(summary)의 장 전/장 후 변동률은 이 값과 관계없이 계산됩니다.
+
+        Returns:
+            dict: ticker, resolution(집계 단위), summary(기간 요약 통계), bars("date|open|high|low|close|volume" 행 텍스트).
+                  분봉은 interval 이 추가되고, bars 가 "time|open|high|low|close|volume|vwap" 행 텍스트이며,
+                  summary 에 기간 VWAP, 마지막 세션 OHLC/VWAP, 장 전/장 후 변동률이 포함됩니다.
+        """
+        interval = (interval or "1d").strip().lower()
+        interval = MarketDataTools.INTERVAL_ALIASES.get(interval, interval)
+        if interval not in IntradayBarFormatter.INTERVAL_MINUTES and interval not in PriceSeriesFormatter.INTERVAL_RULES:
+            supported = [*PriceSeriesFormatter.INTERVAL_RULES, *IntradayBarFormatter.INTERVAL_MINUTES]
+            return {"error": f"지원하지 않는 interval 입니다: {interval} (가능: {', '.join(supported)})"}
+
+        if interval in IntradayBarFormatter.INTERVAL_MINUTES:
+            bars = MarketDataTools.intraday_cache(interval).get(ticker, period=period, start=start, end=end)
+            return IntradayBarFormatter.format(
+                bars, ticker=ticker, interval=interval, max_tokens=max_tokens, include_extended=include_extended
+            )
+        stock_info = MarketDataTools.price_cache.get(ticker, period=period, start=start, end=end)
+        return PriceSeriesFormatter.format(stock_info, ticker=ticker, max_tokens=max_tokens, interval=interval)
+
+    @staticmethod
+    @tool
+    def get_stock_prices(
+        tickers: List[str],
+        period: str = "6mo",
+        start: str = None,
+        end: str = None,
+        rebase: bool = False,
+        max_tokens: int = 1500
+    ) -> dict:
+        """
+        여러 주식 티커의 가격을 한 번에 조회하여 날짜 정렬된 종가 패널로 반환합니다.
+        종목 비교(예: "NVDA, AMD, INTC 6개월 비교")는 get_stock_price 를 여러 번 호출하지 말고 이 도구를 사용하세요.
+
+        Args:
+            tickers (List[str]): 주식 티커 목록 (예: ["NVDA", "AMD", "INTC"]).
+            period (str): 데이터를 가져올 기간. 유효한 값: "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max". 기본값 "6mo".
+            start (str, optional): 시작 날짜(포함). 형식: "YYYY-MM-DD". 지정하면 period 대신 사용.
+            end (str, optional): 종료 날짜(미포함). 형식: "YYYY-MM-DD". 기본값은 현재 날짜까지.
+            rebase (bool, optional): True 이면 종가 대신 시작일 대비 누적 수익률(%)을 출력. 기본값 False.
+            max_tokens (int, optional): 패널(bars)에 사용할 최대 토큰 수. 기본값 1500.
 
         Returns:
-            dict: 지정된 티커에 대한 주식 가격 데이터를 딕셔너리 형태로 반환.
+            dict: tickers, resolution(집계 단위), summary(종목별 수익률/변동성/평균 대비 상대 성과/순위),
+                  bars("date|TICKER1|TICKER2..." 종가 또는 누적 수익률 행 텍스트), missing(데이터가 없는 티커).
         """
-        stock_info = yf.download(ticker, period=period, start=start, end=end).to_dict()
-        return stock_info
+        frames = MarketDataTools.price_cache.get_many(tickers, period=period, start=start, end=end)
+        return PriceSeriesFormatter.format_panel(frames, max_tokens=max_tokens, rebase=rebase)
+
+    @staticmethod
+    @tool
+    def get_technical_indicators(tickers: List[str], end: str = None) -> dict:
+        """
+        여러 주식 티커의 최신 기술적 지표와 신호를 한 번에 계산하여 반환합니다. (일봉 기준)
+        지표: SMA(20/50/200), EMA(12/26), RSI(14), MACD(12,26,9), 볼린저 밴드(20, 2σ)
+        신호: rsi_signal(overbought/oversold/neutral), macd_signal_state(bullish_cross/bearish_cross/bullish/bearish),
+              trend(golden_cross/death_cross/uptrend/downtrend, SMA50 vs SMA200), bb_signal(above_upper/below_lower/inside)
+
+        Args:
+            tickers (List[str]): 주식 티커 목록 (예: ["AAPL", "MSFT"]).
+            end (str, optional): 기준일 다음 날짜(미포함). 형식: "YYYY-MM-DD". 기본값은 현재 날짜까지(최신 봉 기준).
+
+        Returns:
+            dict: indicators(종목별 최신 지표/신호 행 텍스트), missing(데이터가 없는 티커).
+        """
+        frames = MarketDataTools.price_cache.get_many(tickers, period="2y", end=end)
+        closes = PriceSeriesFormatter.align_closes(frames)
+        snapshots = MarketDataTools.indicator_engine.update(closes, keep_state=end is None)
+
+        result = {"indicators": ""}
+        if snapshots:
+            columns = ["ticker"] + list(next(iter(snapshots.values())).keys())
+            rows = [(ticker, *snapshot.values()) for ticker, snapshot in snapshots.items()]
+            result["indicators"] = serialize_columns(columns, rows, title="Technical indicators (daily)")
+        missing = [ticker for ticker in frames if ticker not in snapshots]
+        if missing:
+            result["missing"] = missing
+        return result
+
+    @staticmethod
+    @tool
+    def get_risk_metrics(
+        tickers: List[str],
+        benchmark: str = "SPY",
+        weights: Optional[List[float]] = None,
+        period: str = "1y",
+        start: str = None,
+        end: str = None,
+        risk_free_rate: float = 0.0
+    ) -> dict:
+        """
+        종목 또는 가중 포트폴리오의 위험/수익 지표를 벤치마크 대비로 계산합니다. (일간 수익률 기준, 연율화)
+        지표: 누적/연율 수익률, 연율 변동성, 샤프/소르티노 비율, 최대 낙폭(고점/저점 날짜), 베타, 벤치마크 상관계수.
+        종목이 2개 이상이면 종목 간 상관계수 행렬도 함께 반환합니다.
+
+        Args:
+            tickers (List[str]): 주식 티커 목록 (예: ["AAPL", "MSFT", "NVDA"]).
+            benchmark (str, optional): 벤치마크 티커. 기본값 "SPY" (한국 주식은 "^KS11" 권장).
+            weights (List[float], optional): tickers 와 같은 순서의 포트폴리오 비중. 지정하면 PORTFOLIO 행을 추가 (합이 1이 아니면 정규화).
+            period (str): 기간. 유효한 값: "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max". 기본값 "1y".
+            start (str, optional): 시작 날짜(포함). 형식: "YYYY-MM-DD". 지정하면 period 대신 사용.
+            end (str, optional): 종료 날짜(미포함). 형식: "YYYY-MM-DD". 기본값은 현재 날짜까지.
+            risk_free_rate (float, optional): 연 무위험수익률 (예: 0.04 = 4%). 기본값 0.
+
+        Returns:
+            dict: window(기간/벤치마크), metrics(종목별 지표 행 텍스트), correlation(상관계수 행렬 텍스트), missing(데이터가 없는 티커).
+        """
+        try:
+            return MarketDataTools.risk_engine.analyze(
+                tickers, benchmark=benchmark, weights=weights, period=period,
+                start=start, end=end, risk_free_rate=risk_free_rate
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    @tool
+    def get_option_chain_summary(
+        ticker: str,
+        max_expirations: int = 3,
+        expiration: str = None,
+        risk_free_rate: float = 0.04
+    ) -> dict:
+        """
+        주어진 티커의 옵션 체인을 조회하여 만기별 요약 지표를 반환합니다. (원본 체인은 반환하지 않음)
+        모든 행사가의 내재변동성과 그릭스를 Black-Scholes 로 계산한 뒤 요약합니다.
+
+        Args:
+            ticker (str): 주식 티커 (예: "AAPL").
+            max_expirations (int, optional): 가까운 만기부터 요약할 만기 수. 기본값 3.
+            expiration (str, optional): 특정 만기만 요약. 형식: "YYYY-MM-DD".
+            risk_free_rate (float, optional): 연 무위험수익률. 기본값 0.04.
+
+        Returns:
+            dict: spot(현재가),
+                  expirations(만기별 atm_iv_pct, implied_move_pct(ATM 스트래들/현재가), skew_25d_pct(25델타 풋 IV - 콜 IV),
+                              put_call_oi, put_call_volume, max_pain, call_oi_walls/put_oi_walls(OI 상위 행사가와 비중)),
+                  iv_surface(머니니스 K/S 격자별 OTM 내재변동성 %).
+        """
+        return MarketDataTools.option_analyzer.analyze(
+            ticker, max_expirations=max_expirations, expiration=expiration, risk_free_rate=risk_free_rate
+        )
 
 
 
@@ -51,43 +250,42 @@ class MarketDataTools:
     def get_websearch_tool(
         query: Annotated[str, "Search query"]
     ) -> Annotated[str, "Web search result from DuckDuckGo"]:
-        """웹 검색을 수행하고 결과를 반환합니다."""
-        tool = DuckDuckGoSearchRun()
-        return tool.invoke(query)
+        """웹 검색을 수행하고 결과를 반환합니다. 같은 질의는 잠시 캐시되며, 검색이 지연되면 이전 결과나 빈 결과를 반환합니다."""
+        return WebSearchService.to_text(MarketDataTools.web_search.search(query))
 
     @staticmethod
     @tool
-    def get_stock_news(ticker: Annotated[str, "Stock ticker symbol"]) -> Annotated[List[Dict[str, str]], "List of stock news details"]:
+    def get_stock_news(
+        ticker: Annotated[str, "Stock ticker symbol"],
+        max_tokens: Annotated[int, "Token budget for the digest"] = 800
+    ) -> Annotated[List[Dict[str, str]], "List of stock news details"]:
         """
-        Retrieves the latest news related to the given stock ticker.
+        Retrieves a deduplicated digest of the latest news related to the given stock ticker, newest first.
+        Near-identical stories from different publishers are merged into one entry.
 
         Returns:
             - A list of dictionaries, each containing:
                 - title (str): The title of the news article.
-                - description (str): A brief description of the news content.
+                - summary (str): A shortened summary of the news content.
                 - pubDate (str): The publication date of the news article.
                 - url (str): The URL to the full news article.
+                - sources (str): Publishers that reported the story.
+                - duplicates (int, optional): Number of merged near-duplicate articles.
         """
-        stock = yf.Ticker(ticker)
-        news = stock.news if stock.news else []
-        
-        news_data = []
-        
-        for item in news:
-            if 'content' in item:
-                content = item['content']
-                news_item = {
-                    "title": content.get("title", "No Title Available"),
-                    "summary": content.get("summary", "No summary Available"),
-                    "pubDate": content.get("pubDate", "No Date Available"),
-                    "url": content.get("canonicalUrl", {}).get("url", "No URL Available")
-                }
-                news_data.append(news_item)
-
-        return news_data
+        return MarketDataTools.news_pipeline.ticker_digest(ticker, max_tokens=max_tokens)
 class FinancialDataTools:
     """기업 재무 데이터를 다루는 도구 클래스"""
 
+    ticker_pool = MarketDataTools.ticker_pool
+    fundamentals_cache = FundamentalsCache(ticker_pool)
+    screener = UniverseScreener(
+        MarketDataTools.price_cache,
+        MarketDataTools.price_store,
+        fundamentals_cache,
+        SECInsiderTradeAPI.insider_store,
+        ticker_pool
+    )
+
     @staticmethod
     def filter_income_statement_info(financial_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -135,11 +333,47 @@ class FinancialDataTools:
         Returns:
             pd.DataFrame: 지정된 주기(freq)에 따라 필터링된 손익계산서 데이터.
         """
-        company_info = yf.Ticker(ticker)
-        financial_info = company_info.get_financials(freq=freq)
+        financial_info = FinancialDataTools.fundamentals_cache.get(ticker, freq=freq)
         filtered_financial_info = FinancialDataTools.filter_income_statement_info(financial_info)
         return filtered_financial_info
     
+    @staticmethod
+    @tool
+    def screen_stocks(
+        expression: str,
+        sort_by: Optional[str] = None,
+        ascending: bool = False,
+        limit: int = 20,
+        columns: Optional[List[str]] = None
+    ) -> dict:
+        """
+        로컬에 캐시된 전체 종목(가격, 손익계산서, 내부자 거래)을 조건식으로 한 번에 걸러내는 스크리너 도구.
+        "PER 20 미만 기술주 중 최근 한 달 내부자 매수가 있는 종목" 같은 여러 종목 조건 검색에 사용한다.
+
+        Args:
+            expression (str): 파이썬 스타일 조건식. and/or/not, 비교 연산, in [...] 목록, 사칙연산 사용 가능. 문자열은 대소문자 무시.
+                예: "sector == 'technology' and country == 'united states' and pe < 20 and insider_buy_value_30d_musd > 0"
+                사용 가능한 컬럼:
+                    sector, industry, country, close, ret_1m_pct, ret_3m_pct, ret_12m_pct, from_52w_high_pct,
+                    volatility_3m_pct, dollar_volume_20d_musd, market_cap_musd, revenue_ttm_musd, net_income_ttm_musd,
+                    eps_ttm, pe, revenue_growth_pct, operating_margin_pct, net_margin_pct,
+                    insider_buy_value_30d_musd, insider_sell_value_30d_musd, insider_buyers_30d, insider_net_value_90d_musd
+                (_musd 는 백만 USD, _pct 는 %, pe 는 적자면 비어 있음)
+            sort_by (str, optional): 정렬 기준 컬럼 (예: "market_cap_musd")
+            ascending (bool, optional): 오름차순 여부. 기본값 False (내림차순)
+            limit (int, optional): 반환할 최대 종목 수. 기본값 20
+            columns (List[str], optional): 결과에 추가로 표시할 컬럼
+
+        Returns:
+            dict: 전체 종목 수, 조건을 만족한 종목 수, 스냅샷 시각, 상위 종목 표
+        """
+        try:
+            return FinancialDataTools.screener.screen(
+                expression, sort_by=sort_by, ascending=ascending, limit=limit, columns=columns
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
     @staticmethod
     @tool
     def get_financial_event_filings(ticker: str) -> dict:
@@ -157,8 +391,7 @@ class FinancialDataTools:
         target_types = {'10-K', '10-Q', '8-K', '10-K/A', '10-Q/A', '8-K/A', '20-F', '6-K'}
 
         # SEC 제출 자료 가져오기
-        company_info = yf.Ticker(ticker)
-        sec_filings = company_info.get_sec_filings()
+        sec_filings = FinancialDataTools.ticker_pool.sec_filings(ticker)
 
         # 리스트에서 대상 유형만 필터링
         filtered_filings = [filing for filing in sec_filings if filing.get('type') in target_types]
@@ -203,13 +436,22 @@ class EconomicDataTools:
     """거시 경제 데이터 수집 도구 모음음"""
     
     FRED_API_KEY = os.getenv("FRED_API_KEY")
+    fred_cache = FredSeriesCache(FRED_API_KEY)
+    release_calendar = FredReleaseCalendar(fred_cache)
+    series_panel = FredSeriesPanel(fred_cache, release_calendar)
 
     @staticmethod
     def get_fred_data(series_id: str, observation_start: str, 
                       observation_end: str, limit: int, sort_order: str = "desc", units: str = None) -> List[Dict]:
         """
         FRED API에서 특정 경제 데이터를 가져오는 공통 메서드.
+        원계열(units 미지정)은 로컬 시리즈 캐시(FredSeriesCache)에서 읽고, 새 관측치만 받아 온다.
         """
+        if not units:
+            return EconomicDataTools.fred_cache.observations(
+                series_id, observation_start, observation_end, limit=limit, sort_order=sort_order
+            )
+
         base_url = "https://api.stlouisfed.org/fred/series/observations"
         params = {
             "api_key": EconomicDataTools.FRED_API_KEY,
@@ -231,18 +473,81 @@ class EconomicDataTools:
     def get_fred_release_dates(release_id: int, limit: int) -> List[str]:
         """
         FRED API에서 특정 Release ID에 대한 발표 일정을 가져오는 공통 메서드.
+        로컬 발표 일정 인덱스(FredReleaseCalendar)에서 오늘까지의 발표일을 최신순으로 반환한다.
         """
-        release_url = "https://api.stlouisfed.org/fred/release/dates"
-        params = {
-            "api_key": EconomicDataTools.FRED_API_KEY,
-            "file_type": "json",
-            "release_id": release_id,
-            "sort_order": "desc",
-            "limit": limit
-        }
-        response = requests.get(release_url, params=params)
+        return EconomicDataTools.release_calendar.past_dates(release_id, limit)
 
-        return [release["date"] for release in response.json().get("release_dates", [])] if response.status_code == 200 else []
+    @staticmethod
+    def percent_change(values: np.ndarray, periods: int) -> np.ndarray:
+        """
+        periods 칸 앞 값 대비 변화율(%). 앞쪽 periods 칸과 결측 구간은 NaN. (FRED units="pch"/"pc1" 과 같은 정의)
+        """
+        change = np.full(len(values), np.nan)
+        if len(values) > periods:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                change[periods:] = (values[periods:] / values[:-periods] - 1) * 100
+        return change
+
+    @staticmethod
+    def get_fred_level_changes(
+        series_id: str,
+        observation_start: str,
+        observation_end: str,
+        limit: int,
+        periods_per_year: int = 12
+    ) -> List[Dict]:
+        """
+        수준(level) 시계열을 한 번만 받아 전년 대비(YoY) / 전기 대비(MoM) 변화율을 로컬에서 계산한다.
+        YoY 계산을 위해 observation_start 보다 1년 앞에서부터 받으며, 결과는 구간 안의 최신순 limit 개다.
+
+        Returns:
+            list: [{"date", "value", "yoy", "mom"}, ...] - 변화율은 FRED 와 같은 문자열 (계산 불가 시 ".")
+        """
+        lookback_start = (pd.Timestamp(observation_start) - pd.DateOffset(years=1, months=1)).strftime("%Y-%m-%d")
+        observations = EconomicDataTools.get_fred_data(
+            series_id, lookback_start, observation_end, limit=100000, sort_order="asc"
+        )
+        if not observations:
+            return []
+
+        dates = np.array([entry["date"] for entry in observations])
+        values = pd.to_numeric(pd.Series([entry["value"] for entry in observations]), errors="coerce").to_numpy(dtype=float)
+        yoy = EconomicDataTools.percent_change(values, periods_per_year)
+        mom = EconomicDataTools.percent_change(values, 1)
+
+        # ISO 날짜 문자열은 사전순 = 시간순
+        first = int(np.searchsorted(dates, observation_start, side="left"))
+        selected = np.arange(first, len(dates))[-limit:][::-1] if limit > 0 else np.array([], dtype=int)
+        return [
+            {
+                "date": observations[i]["date"],
+                "value": observations[i]["value"],
+                "yoy": "." if np.isnan(yoy[i]) else f"{yoy[i]:.5f}",
+                "mom": "." if np.isnan(mom[i]) else f"{mom[i]:.5f}"
+            }
+            for i in selected
+        ]
+
+    @staticmethod
+    def get_fred_changes_with_releases(
+        series_id: str,
+        release_id: int,
+        observation_start: str,
+        observation_end: str,
+        limit: int
+    ) -> tuple[List[Dict], List[str]]:
+        """
+        변화율 포함 시계열과 각 관측치의 실제 발표일.
+        시계열 동기화와 발표 일정 갱신(만료 시)은 서로 독립적이므로 동시에 진행한다.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            levels = executor.submit(
+                EconomicDataTools.get_fred_level_changes, series_id, observation_start, observation_end, limit
+            )
+            executor.submit(EconomicDataTools.release_calendar.dates, release_id).result()
+            observations = levels.result()
+        release_dates = EconomicDataTools.release_calendar.align(release_id, [entry["date"] for entry in observations])
+        return observations, release_dates
 
     @staticmethod
     @tool
@@ -257,23 +562,19 @@ class EconomicDataTools:
         CORE_CPI_ID = "CPILFESL"
         RELEASE_ID = 10
 
-        core_cpi = EconomicDataTools.get_fred_data(CORE_CPI_ID, observation_start, observation_end, limit)
-        core_cpi_yoy = EconomicDataTools.get_fred_data(CORE_CPI_ID, observation_start, observation_end, limit, units="pc1")
-        core_cpi_mom = EconomicDataTools.get_fred_data(CORE_CPI_ID, observation_start, observation_end, limit, units="pch")
-        release_dates = EconomicDataTools.get_fred_release_dates(RELEASE_ID, limit)
+        core_cpi, release_dates = EconomicDataTools.get_fred_changes_with_releases(
+            CORE_CPI_ID, RELEASE_ID, observation_start, observation_end, limit
+        )
 
-        if not core_cpi or not core_cpi_yoy or not core_cpi_mom:
+        if not core_cpi:
             return []
 
-        while len(release_dates) < len(core_cpi):
-            release_dates.append("N/A")
-
         return [
             {
                 "date": core_cpi[i]["date"],
                 "core_cpi": core_cpi[i]["value"],
-                "core_cpi_yoy": core_cpi_yoy[i]["value"],
-                "core_cpi_mom": core_cpi_mom[i]["value"],
+                "core_cpi_yoy": core_cpi[i]["yoy"],
+                "core_cpi_mom": core_cpi[i]["mom"],
                 "release_date": release_dates[i]
             }
             for i in range(len(core_cpi))
@@ -292,23 +593,19 @@ class EconomicDataTools:
         CORE_PCE_ID = "PCEPILFE"
         RELEASE_ID = 54
 
-        core_pce = EconomicDataTools.get_fred_data(CORE_PCE_ID, observation_start, observation_end, limit)
-        core_pce_yoy = EconomicDataTools.get_fred_data(CORE_PCE_ID, observation_start, observation_end, limit, units="pc1")
-        core_pce_mom = EconomicDataTools.get_fred_data(CORE_PCE_ID, observation_start, observation_end, limit, units="pch")
-        release_dates = EconomicDataTools.get_fred_release_dates(RELEASE_ID, limit)
+        core_pce, release_dates = EconomicDataTools.get_fred_changes_with_releases(
+            CORE_PCE_ID, RELEASE_ID, observation_start, observation_end, limit
+        )
 
-        if not core_pce or not core_pce_yoy or not core_pce_mom:
+        if not core_pce:
             return []
 
-        while len(release_dates) < len(core_pce):
-            release_dates.append("N/A")
-
         return [
             {
                 "date": core_pce[i]["date"],
                 "core_pce": core_pce[i]["value"],
-                "core_pce_yoy": core_pce_yoy[i]["value"],
-                "core_pce_mom": core_pce_mom[i]["value"],
+                "core_pce_yoy": core_pce[i]["yoy"],
+                "core_pce_mom": core_pce[i]["mom"],
                 "release_date": release_dates[i]
             }
             for i in range(len(core_pce))
@@ -322,17 +619,19 @@ class EconomicDataTools:
         limit: Annotated[int, "Maximum number of results to return"]  = 10 
     ) -> Annotated[List[Dict], "List of personal income data entries"]:
         """
-        Retrieves U.S. Personal Income data from FRED API within the specified date range, including month-over-month percentage change.
+        Retrieves U.S. Personal Income data from FRED API within the specified date range, including month-over-month percentage change and the release date of each observation.
         """
         PERSONAL_INCOME_ID = "PI"
+        RELEASE_ID = 54
         personal_income = EconomicDataTools.get_fred_data(PERSONAL_INCOME_ID, observation_start, observation_end, limit, sort_order="asc")
 
         if not personal_income:
             return []
 
+        release_dates = EconomicDataTools.release_calendar.align(RELEASE_ID, [entry["date"] for entry in personal_income])
         prev_value = None
         formatted_data = []
-        for entry in personal_income:
+        for entry, release_date in zip(personal_income, release_dates):
             date = entry["date"]
             value = float(entry["value"])
             if prev_value is not None:
@@ -343,7 +642,8 @@ class EconomicDataTools:
             formatted_data.append({
                 "date": date,
                 "personal_income": f"{value:,.0f}",
-                "mom_change": change_symbol
+                "mom_change": change_symbol,
+                "release_date": release_date
             })
             prev_value = value
 
@@ -381,20 +681,23 @@ class EconomicDataTools:
         limit: Annotated[int, "Maximum number of results to return"]  = 10  
     ) -> Annotated[List[Dict], "List of unemployment rate data entries"]:
         """
-        Retrieves U.S. Unemployment Rate data from FRED API within the specified date range.
+        Retrieves U.S. Unemployment Rate data (with the release date of each observation) from FRED API within the specified date range.
         """
         UNEMPLOYMENT_ID = "UNRATE"
+        RELEASE_ID = 50
         unemployment_data = EconomicDataTools.get_fred_data(UNEMPLOYMENT_ID, observation_start, observation_end, limit, sort_order="desc")
 
         if not unemployment_data:
             return []
 
+        release_dates = EconomicDataTools.release_calendar.align(RELEASE_ID, [entry["date"] for entry in unemployment_data])
         return [
             {
                 "date": entry["date"],
-                "unemployment_rate": f"{float(entry['value']):.1f}%"
+                "unemployment_rate": f"{float(entry['value']):.1f}%",
+                "release_date": release_date
             }
-            for entry in unemployment_data
+            for entry, release_date in zip(unemployment_data, release_dates)
         ]
     
     @staticmethod
@@ -405,18 +708,63 @@ class EconomicDataTools:
         limit: Annotated[int, "Maximum number of results to return"]  = 10  
     ) -> Annotated[List[Dict], "List of jobless claims data entries"]:
         """
-        Retrieves U.S. Initial Jobless Claims data from FRED API within the specified date range.
+        Retrieves U.S. Initial Jobless Claims data (with the release date of each observation) from FRED API within the specified date range.
         """
         JOBLESS_CLAIMS_ID = "ICSA"
+        RELEASE_ID = 180
         jobless_claims = EconomicDataTools.get_fred_data(JOBLESS_CLAIMS_ID, observation_start, observation_end, limit, sort_order="desc")
 
         if not jobless_claims:
             return []
 
+        release_dates = EconomicDataTools.release_calendar.align(
+            RELEASE_ID, [entry["date"] for entry in jobless_claims], frequency="W"
+        )
         return [
             {
                 "date": entry["date"],
-                "jobless_claims": f"{int(float(entry['value'])):,}"
+                "jobless_claims": f"{int(float(entry['value'])):,}",
+                "release_date": release_date
             }
-            for entry in jobless_claims
-        ]
\ No newline at end of file
+            for entry, release_date in zip(jobless_claims, release_dates)
+        ]
+
+    @staticmethod
+    @tool
+    def get_fred_series_table(
+        series: Annotated[List[str], "FRED series IDs or aliases, e.g. ['core_cpi', 'unemployment', 'jobless_claims', 'DGS10']"],
+        observation_start: Annotated[str, "Start date for observations (YYYY-MM-DD)"],
+        observation_end: Annotated[Optional[str], "End date for observations (YYYY-MM-DD), default: latest"] = None,
+        frequency: Annotated[Optional[str], "Common frequency: D, W, BW, M, Q, SA, A. Default: the coarsest of the requested series"] = None,
+        aggregation: Annotated[str, "How finer series are aggregated to the common frequency: 'avg' (period mean) or 'eop' (last value)"] = "avg",
+        transform: Annotated[str, "'level', 'yoy' (% vs. one year earlier), 'mom' (% vs. previous period) or 'diff' (change vs. previous period)"] = "level",
+        limit: Annotated[int, "Maximum number of most recent rows to return"] = 24
+    ) -> dict:
+        """
+        Retrieves several FRED series in one call (fetched concurrently through the local FRED cache) and aligns them
+        on a common frequency into one compact table, newest first. Prefer this over calling several single-indicator tools.
+        Aliases: core_cpi, cpi, core_pce, pce, personal_income, unemployment, payrolls, jobless_claims, mortgage_30y,
+        fed_funds, treasury_2y, treasury_10y, real_gdp, retail_sales, industrial_production. Any other value is treated as a FRED series ID.
+        """
+        try:
+            table, info, missing = EconomicDataTools.series_panel.build(
+                series, observation_start, observation_end,
+                frequency=frequency, aggregation=aggregation, transform=transform
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+
+        result = {"series": info}
+        if missing:
+            result["missing"] = missing
+        if table.empty:
+            result["table"] = ""
+            return result
+
+        result.update({
+            "frequency": table.attrs.get("frequency"),
+            "aggregation": aggregation,
+            "transform": transform,
+            "table": EconomicDataTools.series_panel.format(table, limit=limit)
+        })
+        return result
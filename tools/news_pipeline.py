@@ -0,0 +1,155 @@
+import re
+import zlib
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.ticker_pool import YFTickerPool
+from utils.token_budget import estimate_tokens
+
+
+class MinHashDeduplicator:
+    """
+    단어 shingle MinHash + LSH 밴딩으로 거의 같은 기사(제목+요약)를 묶는 클래스.
+
+    서명(NUM_PERM 개 최소 해시)을 BANDS 개 밴드로 나눠 같은 버킷에 들어간 쌍만 후보로 보고,
+    추정 Jaccard 유사도가 THRESHOLD 이상이면 같은 기사로 묶는다.
+    """
+
+    NUM_PERM = 64
+    BANDS = 16
+    SHINGLE_SIZE = 3
+    THRESHOLD = 0.5
+    _PRIME = (1 << 31) - 1
+    _WORD = re.compile(r"[0-9a-z가-힣]+")
+
+    def __init__(self, seed: int = 7):
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, self._PRIME, self.NUM_PERM, dtype=np.uint64)
+        self._b = rng.integers(0, self._PRIME, self.NUM_PERM, dtype=np.uint64)
+
+    def shingles(self, text: str) -> set[str]:
+        words = self._WORD.findall((text or "").lower())
+        if len(words) < self.SHINGLE_SIZE:
+            return set(words)
+        return {" ".join(words[i:i + self.SHINGLE_SIZE]) for i in range(len(words) - self.SHINGLE_SIZE + 1)}
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self.shingles(text)
+        if not shingles:
+            return np.full(self.NUM_PERM, self._PRIME, dtype=np.uint64)
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        # (a * h + b) mod p 를 순열 × shingle 행렬로 한 번에 계산
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % self._PRIME).min(axis=1)
+
+    def cluster(self, texts: list[str]) -> list[int]:
+        """
+        각 텍스트가 속한 묶음의 대표 인덱스(묶음 내 가장 앞 인덱스)를 반환한다.
+        """
+        if not texts:
+            return []
+        signatures = np.vstack([self.signature(text) for text in texts])
+        rows = self.NUM_PERM // self.BANDS
+        parent = list(range(len(texts)))
+
+        def _find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for band in range(self.BANDS):
+            buckets: dict[bytes, int] = {}
+            for idx, key in enumerate(signatures[:, band * rows:(band + 1) * rows]):
+                key = key.tobytes()
+                other = buckets.setdefault(key, idx)
+                if other == idx:
+                    continue
+                a, b = _find(other), _find(idx)
+                if a != b and np.mean(signatures[other] == signatures[idx]) >= self.THRESHOLD:
+                    parent[max(a, b)] = min(a, b)
+        return [_find(i) for i in range(len(texts))]
+
+
+class NewsPipeline:
+    """
+    종목 뉴스 피드를 정규화 → 중복 제거 → 최신순 토큰 예산 다이제스트로 만드는 파이프라인.
+    피드 자체는 YFTickerPool 의 뉴스 TTL 캐시를 통해 가져온다.
+    """
+
+    SUMMARY_CHARS = 240
+
+    def __init__(self, ticker_pool: YFTickerPool, deduplicator: Optional[MinHashDeduplicator] = None):
+        self.ticker_pool = ticker_pool
+        self.deduplicator = deduplicator or MinHashDeduplicator()
+
+    @staticmethod
+    def normalize_yahoo(items: Iterable[dict]) -> list[dict]:
+        news = []
+        for item in items or []:
+            content = item.get("content")
+            if not content:
+                continue
+            news.append({
+                "title": content.get("title") or "No Title Available",
+                "summary": content.get("summary") or "",
+                "pubDate": content.get("pubDate") or "",
+                "url": ((content.get("canonicalUrl") or {}).get("url")) or "No URL Available",
+                "source": ((content.get("provider") or {}).get("displayName")) or "Yahoo Finance"
+            })
+        return news
+
+    @staticmethod
+    def _published(item: dict) -> pd.Timestamp:
+        published = pd.to_datetime(item.get("pubDate") or None, utc=True, errors="coerce")
+        return pd.Timestamp.min.tz_localize("UTC") if pd.isna(published) else published
+
+    def dedupe(self, items: list[dict]) -> list[dict]:
+        """
+        거의 같은 기사를 하나로 묶는다. 묶음의 대표는 가장 최근 기사이며,
+        함께 보도한 다른 출처 수를 'duplicates' 로 남긴다.
+        """
+        if not items:
+            return []
+        items = sorted(items, key=self._published, reverse=True)
+        roots = self.deduplicator.cluster([f"{item.get('title', '')} {item.get('summary', '')}" for item in items])
+
+        groups: dict[int, dict] = {}
+        for item, root in zip(items, roots):
+            if root not in groups:
+                groups[root] = dict(item, duplicates=0, sources=[item.get("source")])
+            else:
+                group = groups[root]
+                group["duplicates"] += 1
+                if item.get("source") not in group["sources"]:
+                    group["sources"].append(item.get("source"))
+        return list(groups.values())
+
+    def digest(self, items: list[dict], max_tokens: int = 800) -> list[dict]:
+        """
+        중복 제거된 기사를 최신순으로 토큰 예산(max_tokens) 안에서 채운다. 요약은 SUMMARY_CHARS 로 자른다.
+        """
+        digest, used = [], 0
+        for item in self.dedupe(items):
+            summary = item.get("summary") or ""
+            if len(summary) > self.SUMMARY_CHARS:
+                summary = summary[:self.SUMMARY_CHARS].rsplit(" ", 1)[0] + "…"
+            entry = {
+                "title": item.get("title"),
+                "summary": summary,
+                "pubDate": item.get("pubDate"),
+                "url": item.get("url"),
+                "sources": ", ".join(source for source in item.get("sources", []) if source)
+            }
+            if item.get("duplicates"):
+                entry["duplicates"] = item["duplicates"]
+            cost = estimate_tokens(str(entry))
+            if digest and used + cost > max_tokens:
+                break
+            digest.append(entry)
+            used += cost
+        return digest
+
+    def ticker_digest(self, ticker: str, max_tokens: int = 800) -> list[dict]:
+        return self.digest(self.normalize_yahoo(self.ticker_pool.news(ticker)), max_tokens=max_tokens)
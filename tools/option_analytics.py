@@ -0,0 +1,253 @@
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+from tools.ticker_pool import YFTickerPool
+from tools.filing_records import serialize_columns
+
+
+class BlackScholes:
+    """
+    배열 입력을 받는 Black-Scholes 가격/그릭스/내재변동성 계산. (모든 행사가를 한 번에 계산)
+    """
+
+    IV_LOW, IV_HIGH, IV_ITERATIONS = 1e-4, 5.0, 60
+
+    @staticmethod
+    def _d1_d2(S, K, T, r, sigma):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vol_t = sigma * np.sqrt(T)
+            d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / vol_t
+        return d1, d1 - vol_t
+
+    @staticmethod
+    def price(S, K, T, r, sigma, is_call):
+        d1, d2 = BlackScholes._d1_d2(S, K, T, r, sigma)
+        discount = K * np.exp(-r * T)
+        call = S * ndtr(d1) - discount * ndtr(d2)
+        put = discount * ndtr(-d2) - S * ndtr(-d1)
+        return np.where(is_call, call, put)
+
+    @staticmethod
+    def greeks(S, K, T, r, sigma, is_call) -> dict[str, np.ndarray]:
+        """
+        delta, gamma, vega(변동성 1%p 당), theta(1일 당)
+        """
+        d1, d2 = BlackScholes._d1_d2(S, K, T, r, sigma)
+        pdf = np.exp(-0.5 * d1 ** 2) / np.sqrt(2 * np.pi)
+        discount = np.exp(-r * T)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gamma = pdf / (S * sigma * np.sqrt(T))
+            decay = -S * pdf * sigma / (2 * np.sqrt(T))
+        call_theta = decay - r * K * discount * ndtr(d2)
+        put_theta = decay + r * K * discount * ndtr(-d2)
+        return {
+            "delta": np.where(is_call, ndtr(d1), ndtr(d1) - 1.0),
+            "gamma": gamma,
+            "vega": S * pdf * np.sqrt(T) / 100.0,
+            "theta": np.where(is_call, call_theta, put_theta) / 365.0
+        }
+
+    @staticmethod
+    def implied_vol(price, S, K, T, r, is_call) -> np.ndarray:
+        """
+        이분법으로 모든 옵션의 내재변동성을 동시에 구한다.
+        가격이 무차익 범위(내재가치 ~ 기초자산/행사가 현재가치)를 벗어나면 NaN.
+        """
+        price = np.asarray(price, dtype=float)
+        discount = K * np.exp(-r * T)
+        lower = np.where(is_call, np.maximum(S - discount, 0.0), np.maximum(discount - S, 0.0))
+        upper = np.where(is_call, S, discount)
+        valid = np.isfinite(price) & (price > lower) & (price < upper)
+
+        low = np.full(price.shape, BlackScholes.IV_LOW)
+        high = np.full(price.shape, BlackScholes.IV_HIGH)
+        for _ in range(BlackScholes.IV_ITERATIONS):
+            mid = 0.5 * (low + high)
+            too_high = BlackScholes.price(S, K, T, r, mid, is_call) > price
+            high = np.where(too_high, mid, high)
+            low = np.where(too_high, low, mid)
+        iv = 0.5 * (low + high)
+        return np.where(valid & (iv < BlackScholes.IV_HIGH * 0.999), iv, np.nan)
+
+
+class OptionChainAnalyzer:
+    """
+    yfinance 옵션 체인으로 만기별 그릭스/내재변동성을 계산하고, 원본 체인 대신 요약 지표만 반환하는 클래스.
+
+    요약: ATM IV, 예상 변동폭(ATM 스트래들), 25델타 스큐, 풋/콜 비율, max pain, 미결제약정(OI) 집중 행사가,
+          머니니스(K/S) 격자별 OTM 내재변동성 곡면.
+    """
+
+    MONEYNESS_GRID = (0.8, 0.9, 0.95, 1.0, 1.05, 1.1, 1.2)
+    TOP_STRIKES = 3
+    CHAIN_COLUMNS = ["strike", "bid", "ask", "lastPrice", "volume", "openInterest"]
+
+    def __init__(self, ticker_pool: YFTickerPool):
+        self.ticker_pool = ticker_pool
+
+    @staticmethod
+    def _years_to_expiry(expiration: str) -> float:
+        # 만기일 장 마감(미 동부 16:00)을 대략 하루의 끝으로 보고, 최소 반나절
+        expiry = datetime.strptime(expiration, "%Y-%m-%d").replace(hour=16)
+        return max((expiry - datetime.now()).total_seconds() / 86400.0, 0.5) / 365.0
+
+    def chain_frame(self, ticker: str, expiration: str, spot: float, risk_free_rate: float) -> pd.DataFrame:
+        """
+        만기 1개의 콜/풋을 한 프레임으로 합치고 내재변동성과 그릭스를 계산한다.
+        """
+        chain = self.ticker_pool.option_chain(ticker, expiration)
+        frames = []
+        for is_call, side in ((True, chain.calls), (False, chain.puts)):
+            if side is None or side.empty:
+                continue
+            frame = side.reindex(columns=self.CHAIN_COLUMNS).copy()
+            frame["is_call"] = is_call
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        df[["volume", "openInterest"]] = df[["volume", "openInterest"]].fillna(0)
+        bid, ask = df["bid"].to_numpy(dtype=float), df["ask"].to_numpy(dtype=float)
+        quoted = (bid > 0) & (ask > 0)
+        df["mid"] = np.where(quoted, 0.5 * (bid + ask), df["lastPrice"].to_numpy(dtype=float))
+
+        T = self._years_to_expiry(expiration)
+        K = df["strike"].to_numpy(dtype=float)
+        is_call = df["is_call"].to_numpy(dtype=bool)
+        iv = BlackScholes.implied_vol(df["mid"].to_numpy(dtype=float), spot, K, T, risk_free_rate, is_call)
+        df["iv"] = iv
+        for name, values in BlackScholes.greeks(spot, K, T, risk_free_rate, iv, is_call).items():
+            df[name] = values
+        df.attrs["years"] = T
+        return df
+
+    @staticmethod
+    def max_pain(df: pd.DataFrame) -> Optional[float]:
+        """
+        만기 시 옵션 매수자 총 지급액이 가장 작은 행사가. (행사가 × 행사가 행렬로 계산)
+        """
+        strikes = np.unique(df["strike"].to_numpy(dtype=float))
+        if strikes.size == 0:
+            return None
+        calls, puts = df[df["is_call"]], df[~df["is_call"]]
+        call_k, call_oi = calls["strike"].to_numpy(dtype=float), calls["openInterest"].to_numpy(dtype=float)
+        put_k, put_oi = puts["strike"].to_numpy(dtype=float), puts["openInterest"].to_numpy(dtype=float)
+        payout = (
+            (np.maximum(strikes[:, None] - call_k[None, :], 0.0) * call_oi[None, :]).sum(axis=1)
+            + (np.maximum(put_k[None, :] - strikes[:, None], 0.0) * put_oi[None, :]).sum(axis=1)
+        )
+        return float(strikes[np.argmin(payout)])
+
+    @staticmethod
+    def _interp(x: np.ndarray, y: np.ndarray, at: float) -> Optional[float]:
+        valid = np.isfinite(x) & np.isfinite(y)
+        if valid.sum() < 2:
+            return None
+        order = np.argsort(x[valid])
+        xs, ys = x[valid][order], y[valid][order]
+        if at < xs[0] or at > xs[-1]:
+            return None
+        return float(np.interp(at, xs, ys))
+
+    @staticmethod
+    def _top_strikes(side: pd.DataFrame, count: int) -> str:
+        total = side["openInterest"].sum()
+        if total <= 0:
+            return ""
+        top = side.nlargest(count, "openInterest")
+        return ", ".join(f"{k:g}({oi / total:.0%})" for k, oi in zip(top["strike"], top["openInterest"]))
+
+    def summarize(self, df: pd.DataFrame, spot: float) -> dict:
+        calls, puts = df[df["is_call"]], df[~df["is_call"]]
+        _interp = self._interp
+
+        atm = [
+            _interp(side["strike"].to_numpy(dtype=float), side["iv"].to_numpy(dtype=float), spot)
+            for side in (calls, puts)
+        ]
+        atm = [value for value in atm if value is not None]
+
+        nearest = df.loc[(df["strike"] - spot).abs() == (df["strike"] - spot).abs().min()]
+        straddle = nearest.groupby("is_call")["mid"].first()
+        implied_move = straddle.sum() / spot * 100 if len(straddle) == 2 else None
+
+        call_25 = _interp(calls["delta"].to_numpy(dtype=float), calls["iv"].to_numpy(dtype=float), 0.25)
+        put_25 = _interp(puts["delta"].to_numpy(dtype=float), puts["iv"].to_numpy(dtype=float), -0.25)
+
+        call_oi, put_oi = calls["openInterest"].sum(), puts["openInterest"].sum()
+        call_vol, put_vol = calls["volume"].sum(), puts["volume"].sum()
+
+        def _round(value, digits: int = 2):
+            return None if value is None or not np.isfinite(value) else round(float(value), digits)
+
+        return {
+            "atm_iv_pct": _round(np.mean(atm) * 100) if atm else None,
+            "implied_move_pct": _round(implied_move),
+            "skew_25d_pct": _round((put_25 - call_25) * 100) if call_25 is not None and put_25 is not None else None,
+            "put_call_oi": _round(put_oi / call_oi) if call_oi else None,
+            "put_call_volume": _round(put_vol / call_vol) if call_vol else None,
+            "max_pain": self.max_pain(df),
+            "call_oi_walls": self._top_strikes(calls, self.TOP_STRIKES),
+            "put_oi_walls": self._top_strikes(puts, self.TOP_STRIKES)
+        }
+
+    def surface(self, df: pd.DataFrame, spot: float) -> list[Optional[float]]:
+        """
+        머니니스 격자별 OTM 옵션 내재변동성(%). (K < S 는 풋, K >= S 는 콜)
+        """
+        otm = df[(df["is_call"] & (df["strike"] >= spot)) | (~df["is_call"] & (df["strike"] < spot))]
+        moneyness = otm["strike"].to_numpy(dtype=float) / spot
+        iv = otm["iv"].to_numpy(dtype=float)
+        values = []
+        for point in self.MONEYNESS_GRID:
+            value = self._interp(moneyness, iv, point)
+            values.append(None if value is None else round(value * 100, 1))
+        return values
+
+    def analyze(
+        self,
+        ticker: str,
+        max_expirations: int = 3,
+        expiration: Optional[str] = None,
+        risk_free_rate: float = 0.04
+    ) -> dict:
+        ticker = ticker.strip().upper()
+        expirations = self.ticker_pool.option_expirations(ticker)
+        if not expirations:
+            return {"ticker": ticker, "error": "옵션 체인이 없는 종목입니다."}
+        if expiration:
+            if expiration not in expirations:
+                return {"ticker": ticker, "error": f"만기 {expiration} 이 없습니다.", "available": list(expirations[:12])}
+            targets = [expiration]
+        else:
+            targets = list(expirations[:max_expirations])
+
+        spot = self.ticker_pool.spot(ticker)
+        summary_rows, surface_rows = [], []
+        summary_columns = None
+        for target in targets:
+            df = self.chain_frame(ticker, target, spot, risk_free_rate)
+            if df.empty:
+                continue
+            days = round(df.attrs["years"] * 365, 1)
+            summary = self.summarize(df, spot)
+            summary_columns = summary_columns or ["expiration", "days"] + list(summary.keys())
+            summary_rows.append((target, days, *summary.values()))
+            surface_rows.append((target, *self.surface(df, spot)))
+
+        return {
+            "ticker": ticker,
+            "spot": round(spot, 2),
+            "expirations": serialize_columns(summary_columns or [], summary_rows, title=f"{ticker} option chain summary"),
+            "iv_surface": serialize_columns(
+                ["expiration"] + [f"m{point:g}" for point in self.MONEYNESS_GRID],
+                surface_rows,
+                title="OTM implied volatility % by moneyness (K/S)"
+            ),
+            "more_expirations": len(expirations) - len(targets)
+        }
@@ -0,0 +1,401 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from tools.price_formatter import PriceSeriesFormatter
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class OHLCVCache:
+    """
+    종목별 OHLCV 를 로컬 Parquet 파일로 보관하는 증분 가격 캐시.
+
+    - 종목마다 이미 받아 둔 날짜 구간(covered)을 메타 파일에 기록하고, 요청 구간 중 빠진 부분만 Yahoo 에서 받는다.
+    - 수정주가(auto_adjust) 기준으로 저장하며, 새로 받은 데이터와 기존 데이터의 겹치는 구간 종가가 다르면
+      분할/배당으로 과거 수정주가가 바뀐 것으로 보고 전체 구간을 다시 받는다.
+    - 오늘이 포함된 열린 구간은 장중 갱신을 위해 TAIL_TTL_SECONDS 동안만 캐시를 그대로 쓴다.
+    - 봉 주기(interval)마다 별도 디렉토리에 저장한다. 분봉은 Yahoo 가 제공하는 최근 기간(INTRADAY_LOOKBACK_DAYS)
+      안으로 요청 구간을 자르고, 장 전/후(prepost) 봉까지 받아 두며, 수정주가 비교는 하지 않는다.
+    """
+
+    INTERVAL = "1d"
+    TAIL_TTL_SECONDS = 15 * 60
+    INTRADAY_TAIL_TTL_SECONDS = 60
+    # Yahoo 분봉 제공 기간(일)
+    INTRADAY_LOOKBACK_DAYS = {"1m": 7, "2m": 59, "5m": 59, "15m": 59, "30m": 59, "60m": 729, "90m": 59}
+    # 수정주가 변경 감지용 겹침 구간(일)과 허용 오차
+    OVERLAP_DAYS = 7
+    ADJUSTMENT_TOLERANCE = 1e-4
+    MAX_START = "1900-01-01"
+
+    PERIOD_OFFSETS = {
+        "1mo": pd.DateOffset(months=1),
+        "3mo": pd.DateOffset(months=3),
+        "6mo": pd.DateOffset(months=6),
+        "1y": pd.DateOffset(years=1),
+        "2y": pd.DateOffset(years=2),
+        "5y": pd.DateOffset(years=5),
+        "10y": pd.DateOffset(years=10),
+    }
+
+    def __init__(self, cache_dir: Optional[str] = None, interval: Optional[str] = None):
+        self.interval = interval or self.INTERVAL
+        if self.interval != self.INTERVAL and self.interval not in self.INTRADAY_LOOKBACK_DAYS:
+            raise ValueError(f"지원하지 않는 interval 입니다: {self.interval}")
+        self.is_intraday = self.interval in self.INTRADAY_LOOKBACK_DAYS
+        self.tail_ttl = self.INTRADAY_TAIL_TTL_SECONDS if self.is_intraday else self.TAIL_TTL_SECONDS
+        self.cache_dir = cache_dir or os.path.dirname(data_path("prices", self.interval, "_"))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # 메모리 캐시: ticker -> (DataFrame, meta)
+        self._memory: dict[str, tuple[pd.DataFrame, dict]] = {}
+
+    def _lock_for(self, ticker: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(ticker, threading.Lock())
+
+    def _paths(self, ticker: str) -> tuple[str, str]:
+        safe = ticker.upper().replace("/", "_").replace("^", "_IDX_")
+        base = os.path.join(self.cache_dir, safe)
+        return f"{base}.parquet", f"{base}.json"
+
+    @staticmethod
+    def _today() -> pd.Timestamp:
+        return pd.Timestamp(datetime.now().date())
+
+    @staticmethod
+    def resolve_range(period: Optional[str], start: Optional[str], end: Optional[str]) -> tuple[pd.Timestamp, pd.Timestamp, Optional[int]]:
+        """
+        period/start/end 를 [start, end) 날짜 구간으로 변환한다.
+        "1d", "5d" 같은 거래일 기준 기간은 넉넉한 달력 구간과 함께 마지막 N개 봉 수(tail)를 반환한다.
+        """
+        today = OHLCVCache._today()
+        end_ts = pd.Timestamp(end) if end else today + timedelta(days=1)
+
+        if start:
+            return pd.Timestamp(start), end_ts, None
+
+        period = (period or "1mo").lower()
+        if period.endswith("d") and period[:-1].isdigit():
+            days = int(period[:-1])
+            return end_ts - timedelta(days=days * 7 // 5 + 10), end_ts, days
+        if period == "ytd":
+            return pd.Timestamp(year=end_ts.year, month=1, day=1), end_ts, None
+        if period == "max":
+            return pd.Timestamp(OHLCVCache.MAX_START), end_ts, None
+        if period in OHLCVCache.PERIOD_OFFSETS:
+            return end_ts - OHLCVCache.PERIOD_OFFSETS[period], end_ts, None
+        raise ValueError(f"지원하지 않는 period 입니다: {period}")
+
+    @staticmethod
+    def _missing_ranges(covered: list, start: pd.Timestamp, end: pd.Timestamp) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        [start, end) 중 covered 구간들에 포함되지 않는 부분 구간 목록.
+        """
+        gaps = []
+        cursor = start
+        for c_start, c_end in sorted((pd.Timestamp(s), pd.Timestamp(e)) for s, e in covered):
+            if c_end <= cursor:
+                continue
+            if c_start >= end:
+                break
+            if c_start > cursor:
+                gaps.append((cursor, min(c_start, end)))
+            cursor = max(cursor, c_end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    @staticmethod
+    def _merge_ranges(covered: list, new_start: pd.Timestamp, new_end: pd.Timestamp) -> list[list[str]]:
+        ranges = sorted([(pd.Timestamp(s), pd.Timestamp(e)) for s, e in covered] + [(new_start, new_end)])
+        merged = []
+        for s, e in ranges:
+            if merged and s <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], e)
+            else:
+                merged.append([s, e])
+        return [[s.strftime("%Y-%m-%d"), e.strftime("%Y-%m-%d")] for s, e in merged]
+
+    def _load(self, ticker: str) -> tuple[pd.DataFrame, dict]:
+        if ticker in self._memory:
+            return self._memory[ticker]
+
+        parquet_path, meta_path = self._paths(ticker)
+        df = pd.DataFrame(columns=PriceSeriesFormatter.OHLCV_COLUMNS, dtype=float)
+        meta = {"covered": [], "tail_fetched_at": 0.0}
+        if os.path.exists(parquet_path) and os.path.exists(meta_path):
+            try:
+                df = pd.read_parquet(parquet_path)
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except Exception as e:
+                logger.warning(f"[OHLCVCache] {ticker} 캐시 로드 실패, 새로 받습니다: {e}")
+                df = pd.DataFrame(columns=PriceSeriesFormatter.OHLCV_COLUMNS, dtype=float)
+                meta = {"covered": [], "tail_fetched_at": 0.0}
+
+        self._memory[ticker] = (df, meta)
+        return df, meta
+
+    def _save(self, ticker: str, df: pd.DataFrame, meta: dict):
+        self._memory[ticker] = (df, meta)
+        parquet_path, meta_path = self._paths(ticker)
+        try:
+            df.to_parquet(parquet_path)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except Exception as e:
+            logger.warning(f"[OHLCVCache] {ticker} 캐시 저장 실패: {e}")
+
+    def cached(self, ticker: str) -> pd.DataFrame:
+        """
+        네트워크 조회 없이 캐시에 있는 OHLCV 전체를 반환한다.
+        """
+        ticker = ticker.strip().upper()
+        with self._lock_for(ticker):
+            return self._load(ticker)[0]
+
+    def cached_tickers(self) -> list[str]:
+        tickers = set()
+        for name in os.listdir(self.cache_dir):
+            stem, ext = os.path.splitext(name)
+            if ext == ".json":
+                tickers.add(stem.replace("_IDX_", "^"))
+        return sorted(tickers)
+
+    def _download(self, ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        raw = yf.download(
+            ticker,
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            interval=self.interval,
+            auto_adjust=True,
+            prepost=self.is_intraday,
+            progress=False
+        )
+        return PriceSeriesFormatter.normalize(raw, ticker)
+
+    @staticmethod
+    def _adjustment_changed(cached: pd.DataFrame, fresh: pd.DataFrame, covered: list) -> bool:
+        """
+        겹치는 날짜의 수정 종가가 달라졌는지 확인한다. (분할/배당 반영 여부)
+        장이 끝난 봉(covered 구간 안)만 비교한다. 오늘 봉은 장중에 종가가 계속 바뀐다.
+        """
+        common = cached.index.intersection(fresh.index)
+        closed = np.zeros(len(common), dtype=bool)
+        for range_start, range_end in covered:
+            closed |= (common >= pd.Timestamp(range_start)) & (common < pd.Timestamp(range_end))
+        common = common[closed]
+        if common.empty:
+            return False
+        old = cached.loc[common, "Close"].to_numpy(dtype=float)
+        new = fresh.loc[common, "Close"].to_numpy(dtype=float)
+        valid = ~(np.isnan(old) | np.isnan(new)) & (old != 0)
+        if not valid.any():
+            return False
+        return bool(np.max(np.abs(new[valid] / old[valid] - 1)) > OHLCVCache.ADJUSTMENT_TOLERANCE)
+
+    def _pending_gaps(self, meta: dict, start: pd.Timestamp, end: pd.Timestamp) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        [start, end) 중 새로 받아야 하는 구간 목록.
+        오늘 봉은 장중에 바뀌므로 covered 에 넣지 않고 TTL 로만 관리한다.
+        """
+        today = self._today()
+        gaps = self._missing_ranges(meta["covered"], start, end)
+        if time.time() - meta.get("tail_fetched_at", 0.0) < self.tail_ttl:
+            gaps = [(s, min(e, today)) for s, e in gaps if s < today]
+        return gaps
+
+    def _fetch_window(self, gap_start: pd.Timestamp, gap_end: pd.Timestamp, has_data: bool) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        기존 데이터와 겹치도록 앞뒤로 조금 넓힌 다운로드 구간. (수정주가 변경 확인용)
+        """
+        if not has_data or self.is_intraday:
+            return gap_start, gap_end
+        overlap = timedelta(days=self.OVERLAP_DAYS)
+        fetch_end = min(gap_end + overlap, max(gap_end, self._today() + timedelta(days=1)))
+        return gap_start - overlap, fetch_end
+
+    def _fill(
+        self,
+        ticker: str,
+        df: pd.DataFrame,
+        meta: dict,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        prefetched: Optional[tuple[pd.DataFrame, pd.Timestamp, pd.Timestamp]] = None
+    ) -> tuple[pd.DataFrame, dict]:
+        """
+        [start, end) 중 빠진 구간을 받아 캐시에 합친다.
+        prefetched=(frame, window_start, window_end) 가 빠진 구간을 덮으면 다운로드 대신 잘라서 쓴다.
+        """
+        today = self._today()
+        covered = meta["covered"]
+        gaps = self._pending_gaps(meta, start, end)
+        if not gaps:
+            return df, meta
+
+        frames = []
+        for gap_start, gap_end in gaps:
+            fetch_start, fetch_end = self._fetch_window(gap_start, gap_end, not df.empty)
+            if prefetched is not None and prefetched[1] <= fetch_start and fetch_end <= prefetched[2]:
+                fresh = self.slice(prefetched[0], fetch_start, fetch_end)
+            else:
+                fresh = self._download(ticker, fetch_start, fetch_end)
+            if not df.empty and not self.is_intraday and self._adjustment_changed(df, fresh, covered):
+                logger.info(f"[OHLCVCache] {ticker} 수정주가 변경 감지 → 전체 구간 재수집")
+                full_start = min([pd.Timestamp(s) for s, _ in covered] + [start])
+                full_end = max([pd.Timestamp(e) for _, e in covered] + [end])
+                df = self._download(ticker, full_start, full_end)
+                covered = self._merge_ranges([], full_start, min(full_end, today))
+                frames = []
+                break
+            frames.append(fresh)
+
+        if frames:
+            df = pd.concat(([df] if not df.empty else []) + frames)
+            df = df[~df.index.duplicated(keep="last")].sort_index()
+            for gap_start, gap_end in gaps:
+                covered = self._merge_ranges(covered, gap_start, min(gap_end, today))
+                covered = [c for c in covered if c[0] < c[1]]
+
+        if end > today:
+            meta["tail_fetched_at"] = time.time()
+        meta["covered"] = covered
+        self._save(ticker, df, meta)
+        return df, meta
+
+    @staticmethod
+    def slice(
+        df: pd.DataFrame,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        tail: Optional[int] = None,
+        by_session: bool = False
+    ) -> pd.DataFrame:
+        """
+        정렬된 인덱스에서 [start, end) 구간을 searchsorted 로 잘라낸다.
+        by_session=True 이면 tail 을 봉 수가 아니라 마지막 N 거래일(세션)로 본다. (분봉)
+        """
+        index = df.index.values
+        lo = np.searchsorted(index, np.datetime64(start), side="left")
+        hi = np.searchsorted(index, np.datetime64(end), side="left")
+        result = df.iloc[lo:hi]
+        if not tail:
+            return result
+        if by_session and not result.empty:
+            days = result.index.values.astype("datetime64[D]")
+            sessions = np.unique(days)
+            return result.iloc[np.searchsorted(days, sessions[-tail:][0], side="left"):]
+        return result.iloc[-tail:]
+
+    def resolve(self, period: Optional[str], start: Optional[str], end: Optional[str]) -> tuple[pd.Timestamp, pd.Timestamp, Optional[int]]:
+        """
+        resolve_range 에 분봉 제공 기간 제한을 적용한다.
+        """
+        range_start, range_end, tail = self.resolve_range(period, start, end)
+        if self.is_intraday:
+            earliest = self._today() - timedelta(days=self.INTRADAY_LOOKBACK_DAYS[self.interval])
+            range_start = max(range_start, earliest)
+            range_end = max(range_end, range_start)
+        return range_start, range_end, tail
+
+    def get(
+        self,
+        ticker: str,
+        period: Optional[str] = "1mo",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        prefetched: Optional[tuple[pd.DataFrame, pd.Timestamp, pd.Timestamp]] = None
+    ) -> pd.DataFrame:
+        """
+        요청 구간의 OHLCV 를 반환한다. 캐시에 없는 구간만 새로 받는다.
+        """
+        ticker = ticker.strip().upper()
+        range_start, range_end, tail = self.resolve(period, start, end)
+        with self._lock_for(ticker):
+            df, meta = self._load(ticker)
+            try:
+                df, meta = self._fill(ticker, df, meta, range_start, range_end, prefetched=prefetched)
+            except Exception as e:
+                logger.warning(f"[OHLCVCache] {ticker} 가격 수집 실패, 캐시 데이터만 반환합니다: {e}")
+            return self.slice(df, range_start, range_end, tail, by_session=self.is_intraday)
+
+    def _download_many(self, tickers: list[str], start: pd.Timestamp, end: pd.Timestamp) -> dict[str, pd.DataFrame]:
+        """
+        여러 종목을 yfinance 멀티 티커(스레드) 다운로드 한 번으로 받아 종목별로 나눈다.
+        데이터가 없는 종목은 결과에서 빠지며, 개별 다운로드로 다시 시도된다.
+        """
+        raw = yf.download(
+            tickers,
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            interval=self.interval,
+            auto_adjust=True,
+            prepost=self.is_intraday,
+            progress=False,
+            threads=True,
+            group_by="column"
+        )
+        if raw is None or raw.empty or not isinstance(raw.columns, pd.MultiIndex):
+            return {}
+
+        available = set(raw.columns.get_level_values(-1))
+        frames = {}
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+            frame = PriceSeriesFormatter.normalize(raw, ticker)
+            if not frame.empty:
+                frames[ticker] = frame
+        return frames
+
+    def get_many(
+        self,
+        tickers: list[str],
+        period: Optional[str] = "1mo",
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> dict[str, pd.DataFrame]:
+        """
+        여러 종목의 OHLCV 를 반환한다.
+        캐시에 빠진 구간이 있는 종목들은 합친 구간을 한 번에 받은 뒤 종목별 캐시에 나눠 넣는다.
+        """
+        tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+        range_start, range_end, _ = self.resolve(period, start, end)
+
+        windows = []
+        pending = []
+        for ticker in tickers:
+            with self._lock_for(ticker):
+                df, meta = self._load(ticker)
+                gaps = self._pending_gaps(meta, range_start, range_end)
+            if gaps:
+                pending.append(ticker)
+                windows.extend(self._fetch_window(s, e, not df.empty) for s, e in gaps)
+
+        prefetched = {}
+        if len(pending) > 1:
+            window_start = min(s for s, _ in windows)
+            window_end = max(e for _, e in windows)
+            try:
+                frames = self._download_many(pending, window_start, window_end)
+                prefetched = {t: (frame, window_start, window_end) for t, frame in frames.items()}
+            except Exception as e:
+                logger.warning(f"[OHLCVCache] 일괄 다운로드 실패, 종목별로 받습니다: {e}")
+
+        return {
+            ticker: self.get(ticker, period=period, start=start, end=end, prefetched=prefetched.get(ticker))
+            for ticker in tickers
+        }
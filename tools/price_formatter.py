@@ -0,0 +1,265 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.token_budget import estimate_tokens, CHARS_PER_TOKEN
+
+
+class PriceSeriesFormatter:
+    """
+    yf.download 결과(OHLCV DataFrame)를 토큰 예산에 맞는 짧은 컬럼형 텍스트로 변환하는 클래스.
+
+    일봉이 예산을 넘으면 주봉 → 월봉 → 분기봉 순으로 OHLC 집계하여 행 수를 줄이고,
+    전체 기간 요약 통계는 집계 단위와 무관하게 원본 데이터로 계산한다.
+    """
+
+    OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+    # (resample 규칙, 출력 라벨) - None 은 원본 그대로
+    RESAMPLE_STEPS = [(None, "original"), ("W-FRI", "weekly"), ("ME", "monthly"), ("QE", "quarterly")]
+
+    AGGREGATION = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+    # 주/월/분기 interval 요청은 일봉 캐시를 해당 단위부터 집계해서 제공한다
+    INTERVAL_RULES = {"1d": None, "1wk": "W-FRI", "1mo": "ME", "3mo": "QE"}
+
+    @staticmethod
+    def normalize(df: pd.DataFrame, ticker: Optional[str] = None) -> pd.DataFrame:
+        """
+        (Price, Ticker) MultiIndex 컬럼을 단일 종목 OHLCV 컬럼으로 평탄화한다.
+        """
+        if df is None or df.empty:
+            return pd.DataFrame(columns=PriceSeriesFormatter.OHLCV_COLUMNS)
+
+        if isinstance(df.columns, pd.MultiIndex):
+            tickers = df.columns.get_level_values(-1)
+            if ticker is not None and ticker in set(tickers):
+                df = df.xs(ticker, axis=1, level=-1)
+            else:
+                df = df.droplevel(-1, axis=1)
+
+        columns = [column for column in PriceSeriesFormatter.OHLCV_COLUMNS if column in df.columns]
+        df = df[columns].dropna(how="all")
+        if getattr(df.index, "tz", None) is not None:
+            df.index = df.index.tz_localize(None)
+        return df.sort_index()
+
+    @staticmethod
+    def resample(df: pd.DataFrame, rule: Optional[str]) -> pd.DataFrame:
+        if rule is None or df.empty:
+            return df
+        aggregation = {k: v for k, v in PriceSeriesFormatter.AGGREGATION.items() if k in df.columns}
+        resampled = df.resample(rule).agg(aggregation).dropna(subset=["Close"])
+        # 기간 라벨 대신 실제 마지막 거래일을 표시
+        last_dates = df.index.to_series().resample(rule).max()
+        resampled.index = pd.DatetimeIndex(last_dates.reindex(resampled.index))
+        return resampled
+
+    @staticmethod
+    def _format_volume(volume: float) -> str:
+        if volume is None or np.isnan(volume):
+            return ""
+        for unit, size in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
+            if abs(volume) >= size:
+                return f"{volume / size:.1f}{unit}"
+        return f"{volume:.0f}"
+
+    @staticmethod
+    def to_text(df: pd.DataFrame) -> str:
+        """
+        OHLCV DataFrame 을 'date|open|high|low|close|volume' 행 텍스트로 변환한다.
+        """
+        lines = ["cols: date|open|high|low|close|volume"]
+        dates = df.index.strftime("%Y-%m-%d")
+        prices = df.reindex(columns=["Open", "High", "Low", "Close"]).to_numpy(dtype=float)
+        volumes = df["Volume"].to_numpy(dtype=float) if "Volume" in df.columns else np.full(len(df), np.nan)
+        for date, (o, h, l, c), v in zip(dates, prices, volumes):
+            lines.append(f"{date}|{o:.2f}|{h:.2f}|{l:.2f}|{c:.2f}|{PriceSeriesFormatter._format_volume(v)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def summarize(df: pd.DataFrame) -> dict:
+        """
+        전체 기간 요약 통계 (원본 해상도 기준).
+        """
+        if df.empty:
+            return {}
+
+        close = df["Close"].to_numpy(dtype=float)
+        returns = np.diff(close) / close[:-1] if len(close) > 1 else np.array([])
+        high_idx = int(np.nanargmax(df["High"].to_numpy(dtype=float)))
+        low_idx = int(np.nanargmin(df["Low"].to_numpy(dtype=float)))
+
+        summary = {
+            "start": df.index[0].strftime("%Y-%m-%d"),
+            "end": df.index[-1].strftime("%Y-%m-%d"),
+            "bars": int(len(df)),
+            "first_close": round(float(close[0]), 2),
+            "last_close": round(float(close[-1]), 2),
+            "change_pct": round(float((close[-1] / close[0] - 1) * 100), 2),
+            "high": round(float(df["High"].iloc[high_idx]), 2),
+            "high_date": df.index[high_idx].strftime("%Y-%m-%d"),
+            "low": round(float(df["Low"].iloc[low_idx]), 2),
+            "low_date": df.index[low_idx].strftime("%Y-%m-%d"),
+        }
+        if len(returns) > 1:
+            summary["volatility_pct_per_bar"] = round(float(np.nanstd(returns, ddof=1) * 100), 3)
+        if "Volume" in df.columns:
+            summary["avg_volume"] = PriceSeriesFormatter._format_volume(float(df["Volume"].mean()))
+        return summary
+
+    @staticmethod
+    def _fit_to_budget(
+        df: pd.DataFrame,
+        resampler,
+        renderer,
+        max_tokens: int,
+        steps: Optional[list[tuple[Optional[str], str]]] = None
+    ) -> tuple[str, str, int]:
+        """
+        steps(기본 RESAMPLE_STEPS) 순서로 집계하며 max_tokens 안에 들어가는 첫 텍스트를 찾는다.
+
+        Returns:
+            tuple: (집계 단위 라벨, 텍스트, 잘린 행 수)
+        """
+        label, text = None, ""
+        for rule, label in steps or PriceSeriesFormatter.RESAMPLE_STEPS:
+            text = renderer(resampler(df, rule))
+            if estimate_tokens(text) <= max_tokens:
+                return label, text, 0
+
+        # 가장 큰 집계 단위로도 넘치면 최근 구간만 남긴다
+        lines = text.split("\n")
+        header, rows = lines[0], lines[1:]
+        keep = max(1, max_tokens * CHARS_PER_TOKEN // max(1, len(lines[-1]) + 1) - 1)
+        return label, "\n".join([header] + rows[-keep:]), len(rows) - min(keep, len(rows))
+
+    @staticmethod
+    def format(df: pd.DataFrame, ticker: Optional[str] = None, max_tokens: int = 1500, interval: str = "1d") -> dict:
+        """
+        토큰 예산(max_tokens) 안에 들어가는 가장 세밀한 집계 단위로 가격 데이터를 직렬화한다.
+        interval 이 "1wk"/"1mo"/"3mo" 이면 일봉을 그 단위 이상으로만 집계한다.
+
+        Returns:
+            dict: {"ticker", "resolution", "summary", "bars"}
+        """
+        if interval not in PriceSeriesFormatter.INTERVAL_RULES:
+            raise ValueError(f"지원하지 않는 interval 입니다: {interval}")
+        rules = [rule for rule, _ in PriceSeriesFormatter.RESAMPLE_STEPS]
+        steps = PriceSeriesFormatter.RESAMPLE_STEPS[rules.index(PriceSeriesFormatter.INTERVAL_RULES[interval]):]
+
+        df = PriceSeriesFormatter.normalize(df, ticker)
+        result = {"ticker": ticker, "resolution": None, "summary": PriceSeriesFormatter.summarize(df), "bars": ""}
+        if df.empty:
+            return result
+
+        label, text, truncated = PriceSeriesFormatter._fit_to_budget(
+            df, PriceSeriesFormatter.resample, PriceSeriesFormatter.to_text, max_tokens, steps
+        )
+        result["resolution"], result["bars"] = label, text
+        if truncated:
+            result["truncated_rows"] = truncated
+        return result
+
+    @staticmethod
+    def align_closes(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        종목별 OHLCV 에서 종가만 모아 날짜 합집합 기준으로 정렬한다.
+        휴장일이 다른 시장이 섞여도 비교할 수 있도록 앞 값으로 채운다.
+        """
+        closes = {ticker: df["Close"] for ticker, df in frames.items() if not df.empty and "Close" in df.columns}
+        if not closes:
+            return pd.DataFrame()
+        return pd.concat(closes, axis=1).sort_index().ffill()
+
+    @staticmethod
+    def resample_last(df: pd.DataFrame, rule: Optional[str]) -> pd.DataFrame:
+        if rule is None or df.empty:
+            return df
+        resampled = df.resample(rule).last().dropna(how="all")
+        last_dates = df.index.to_series().resample(rule).max()
+        resampled.index = pd.DatetimeIndex(last_dates.reindex(resampled.index))
+        return resampled
+
+    @staticmethod
+    def panel_to_text(df: pd.DataFrame, decimals: int = 2) -> str:
+        """
+        날짜 × 종목 패널을 'date|TICKER1|TICKER2...' 행 텍스트로 변환한다.
+        """
+        lines = ["cols: date|" + "|".join(str(column) for column in df.columns)]
+        dates = df.index.strftime("%Y-%m-%d")
+        values = df.to_numpy(dtype=float)
+        for date, row in zip(dates, values):
+            lines.append(date + "|" + "|".join("" if np.isnan(v) else f"{v:.{decimals}f}" for v in row))
+        return "\n".join(lines)
+
+    @staticmethod
+    def summarize_panel(closes: pd.DataFrame) -> dict:
+        """
+        종목별 기간 수익률, 변동성, 동일가중 평균 대비 상대 성과.
+        """
+        if closes.empty:
+            return {}
+
+        values = closes.to_numpy(dtype=float)
+        first = closes.bfill().iloc[0].to_numpy(dtype=float)
+        last = values[-1]
+        change = (last / first - 1) * 100
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = np.diff(values, axis=0) / values[:-1]
+        volatility = np.nanstd(returns, axis=0, ddof=1) * 100 if len(returns) > 1 else np.full(len(first), np.nan)
+        average = float(np.nanmean(change))
+        order = (-np.nan_to_num(change, nan=-np.inf)).argsort().argsort() + 1
+
+        summary = {
+            "start": closes.index[0].strftime("%Y-%m-%d"),
+            "end": closes.index[-1].strftime("%Y-%m-%d"),
+            "bars": int(len(closes)),
+            "average_change_pct": round(average, 2),
+            "tickers": {}
+        }
+        for idx, ticker in enumerate(closes.columns):
+            summary["tickers"][ticker] = {
+                "first_close": round(float(first[idx]), 2),
+                "last_close": round(float(last[idx]), 2),
+                "change_pct": round(float(change[idx]), 2),
+                "relative_to_average_pct": round(float(change[idx] - average), 2),
+                "volatility_pct_per_bar": round(float(volatility[idx]), 3),
+                "rank": int(order[idx])
+            }
+        return summary
+
+    @staticmethod
+    def format_panel(frames: dict[str, pd.DataFrame], max_tokens: int = 1500, rebase: bool = False) -> dict:
+        """
+        여러 종목의 가격을 날짜 정렬된 종가 패널 하나로 직렬화한다.
+        rebase=True 이면 종가 대신 시작일 대비 누적 수익률(%)을 출력한다.
+
+        Returns:
+            dict: {"tickers", "resolution", "summary", "bars"[, "missing"]}
+        """
+        closes = PriceSeriesFormatter.align_closes(frames)
+        result = {
+            "tickers": list(closes.columns),
+            "resolution": None,
+            "summary": PriceSeriesFormatter.summarize_panel(closes),
+            "bars": ""
+        }
+        missing = [ticker for ticker in frames if ticker not in closes.columns]
+        if missing:
+            result["missing"] = missing
+        if closes.empty:
+            return result
+
+        panel = (closes / closes.bfill().iloc[0] - 1) * 100 if rebase else closes
+        label, text, truncated = PriceSeriesFormatter._fit_to_budget(
+            panel,
+            PriceSeriesFormatter.resample_last,
+            lambda df: PriceSeriesFormatter.panel_to_text(df, decimals=1 if rebase else 2),
+            max_tokens
+        )
+        result["resolution"], result["bars"] = label, text
+        if truncated:
+            result["truncated_rows"] = truncated
+        return result
@@ -0,0 +1,200 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_cache import OHLCVCache
+from tools.price_formatter import PriceSeriesFormatter
+from tools.filing_records import serialize_columns
+
+
+class RiskMetricsEngine:
+    """
+    캐시된 일봉 종가로 변동성, 베타, 최대 낙폭, 샤프 비율, 상관관계를 계산하는 엔진.
+
+    - 종목/포트폴리오/벤치마크의 일간 수익률을 (날짜 × 열) 행렬 하나로 두고 열 축으로 벡터화하여 계산한다.
+    - 상관관계와 베타는 결측이 있는 열끼리도 쌍별(pairwise)로 겹치는 날만 쓰도록 행렬곱으로 계산한다.
+    - 결과는 (종목, 비중, 벤치마크, 기간, 기준일, 무위험수익률) 단위로 메모이즈한다.
+    """
+
+    PERIODS_PER_YEAR = 252
+    PORTFOLIO = "PORTFOLIO"
+    MEMO_SIZE = 128
+
+    def __init__(self, price_cache: OHLCVCache):
+        self.price_cache = price_cache
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def pairwise_moments(returns: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        결측(NaN)을 포함한 수익률 행렬(T × N)의 쌍별 공분산/분산.
+
+        Returns:
+            tuple: (count[i, j], cov[i, j], var[i, j])
+                   var[i, j] 는 i, j 가 모두 있는 날만으로 계산한 i 의 분산
+        """
+        mask = (~np.isnan(returns)).astype(float)
+        x = np.where(mask > 0, returns, 0.0)
+        count = mask.T @ mask
+        sum_x = x.T @ mask                # [i, j]: j 가 있는 날의 i 합
+        sum_xx = (x * x).T @ mask
+        sum_xy = x.T @ x
+        with np.errstate(invalid="ignore", divide="ignore"):
+            dof = np.where(count > 1, count - 1, np.nan)
+            cov = (sum_xy - sum_x * sum_x.T / count) / dof
+            var = (sum_xx - sum_x * sum_x / count) / dof
+        return count, cov, var
+
+    @staticmethod
+    def max_drawdown(returns: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        열별 최대 낙폭과 고점/저점 행 위치. 결측 구간은 수익률 0 으로 본다.
+        """
+        wealth = np.cumprod(1.0 + np.nan_to_num(returns), axis=0)
+        running_max = np.maximum.accumulate(wealth, axis=0)
+        drawdown = wealth / running_max - 1.0
+        trough = np.argmin(drawdown, axis=0)
+        before_trough = np.arange(len(wealth))[:, None] <= trough[None, :]
+        peak = np.argmax(np.where(before_trough, wealth, -np.inf), axis=0)
+        return drawdown.min(axis=0), peak, trough
+
+    def compute(
+        self,
+        closes: pd.DataFrame,
+        benchmark: Optional[str] = None,
+        weights: Optional[dict[str, float]] = None,
+        risk_free_rate: float = 0.0
+    ) -> dict:
+        """
+        종가 패널(날짜 × 종목)에서 열별 위험/수익 지표를 계산한다.
+        weights 가 있으면 일간 리밸런싱 포트폴리오 열을 추가한다.
+        """
+        returns = closes.pct_change(fill_method=None).iloc[1:]
+        held = [ticker for ticker in (weights or {}) if ticker in returns.columns]
+        if held:
+            w = np.array([weights[ticker] for ticker in held], dtype=float)
+            w = w / w.sum()
+            # 보유 종목 중 하나라도 값이 없는 날은 포트폴리오 수익률도 없음
+            returns[self.PORTFOLIO] = returns[held].to_numpy(dtype=float) @ w
+
+        columns = list(returns.columns)
+        values = returns.to_numpy(dtype=float)
+        dates = returns.index
+        periods = self.PERIODS_PER_YEAR
+
+        count = (~np.isnan(values)).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+            total = np.nanprod(1.0 + values, axis=0) - 1.0
+            annual_return = (1.0 + total) ** (periods / count) - 1.0
+            annual_vol = std * np.sqrt(periods)
+            excess = mean * periods - risk_free_rate
+            sharpe = excess / annual_vol
+            downside = np.sqrt(np.nanmean(np.minimum(values, 0.0) ** 2, axis=0)) * np.sqrt(periods)
+            sortino = excess / downside
+        drawdown, peak, trough = self.max_drawdown(values)
+
+        _, cov, var = self.pairwise_moments(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = cov / np.sqrt(var * var.T)
+        b = columns.index(benchmark) if benchmark in columns else None
+
+        def _round(value, digits: int = 2):
+            return None if value is None or not np.isfinite(value) else round(float(value), digits)
+
+        metrics = {}
+        for idx, column in enumerate(columns):
+            metrics[column] = {
+                "bars": int(count[idx]),
+                "total_return_pct": _round(total[idx] * 100),
+                "annual_return_pct": _round(annual_return[idx] * 100),
+                "annual_volatility_pct": _round(annual_vol[idx] * 100),
+                "sharpe": _round(sharpe[idx]),
+                "sortino": _round(sortino[idx]),
+                "max_drawdown_pct": _round(drawdown[idx] * 100),
+                "drawdown_peak": dates[peak[idx]].strftime("%Y-%m-%d") if len(dates) else None,
+                "drawdown_trough": dates[trough[idx]].strftime("%Y-%m-%d") if len(dates) else None,
+                "beta": _round(cov[idx, b] / var[b, idx], 3) if b is not None and column != benchmark else None,
+                "correlation_to_benchmark": _round(corr[idx, b], 3) if b is not None and column != benchmark else None
+            }
+
+        tickers = [column for column in columns if column not in (benchmark, self.PORTFOLIO)]
+        picks = [columns.index(ticker) for ticker in tickers]
+        return {
+            "start": closes.index[0].strftime("%Y-%m-%d") if len(closes) else None,
+            "end": closes.index[-1].strftime("%Y-%m-%d") if len(closes) else None,
+            "benchmark": benchmark if b is not None else None,
+            "metrics": metrics,
+            "correlation": pd.DataFrame(corr[np.ix_(picks, picks)], index=tickers, columns=tickers)
+        }
+
+    @staticmethod
+    def correlation_to_text(corr: pd.DataFrame) -> str:
+        lines = ["cols: ticker|" + "|".join(corr.columns)]
+        for ticker, row in zip(corr.index, corr.to_numpy(dtype=float)):
+            lines.append(ticker + "|" + "|".join("" if np.isnan(v) else f"{v:.2f}" for v in row))
+        return "\n".join(lines)
+
+    def analyze(
+        self,
+        tickers: list[str],
+        benchmark: Optional[str] = "SPY",
+        weights: Optional[list[float]] = None,
+        period: str = "1y",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        risk_free_rate: float = 0.0
+    ) -> dict:
+        """
+        가격 캐시에서 종가를 읽어 지표를 계산하고, 결과를 토큰 절약형 텍스트로 반환한다.
+        """
+        tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+        benchmark = benchmark.strip().upper() if benchmark else None
+        if weights is not None and len(weights) != len(tickers):
+            raise ValueError("weights 는 tickers 와 길이가 같아야 합니다.")
+
+        key = (
+            tuple(tickers), benchmark, tuple(weights) if weights else None, period, start,
+            end or datetime.now().strftime("%Y-%m-%d"), risk_free_rate
+        )
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+
+        symbols = tickers + ([benchmark] if benchmark and benchmark not in tickers else [])
+        frames = self.price_cache.get_many(symbols, period=period, start=start, end=end)
+        closes = PriceSeriesFormatter.align_closes(frames)
+        if closes.empty:
+            return {"metrics": "", "missing": symbols}
+
+        weight_map = dict(zip(tickers, weights)) if weights else None
+        computed = self.compute(closes, benchmark=benchmark, weights=weight_map, risk_free_rate=risk_free_rate)
+
+        metric_rows = computed["metrics"]
+        columns = ["ticker"] + list(next(iter(metric_rows.values())).keys())
+        result = {
+            "window": {"start": computed["start"], "end": computed["end"], "benchmark": computed["benchmark"]},
+            "metrics": serialize_columns(
+                columns,
+                [(ticker, *row.values()) for ticker, row in metric_rows.items()],
+                title="Risk/return metrics (daily returns, annualized)"
+            )
+        }
+        if len(computed["correlation"]) > 1:
+            result["correlation"] = self.correlation_to_text(computed["correlation"])
+        missing = [symbol for symbol in symbols if symbol not in closes.columns]
+        if missing:
+            result["missing"] = missing
+
+        with self._lock:
+            self._memo[key] = result
+            while len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return result
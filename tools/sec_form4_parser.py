@@ -0,0 +1,286 @@
+import os
+import re
+import glob
+import itertools
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
+from tools.sec_insider_store import SECInsiderStore
+from utils.logger import logger
+
+
+class _XMLSectionReader:
+    """
+    EDGAR 전체 제출 파일(.txt)에서 <XML> ... </XML> 구간만 흘려보내는 파일 객체.
+    SGML 헤더의 접수번호/접수 시각(없으면 제출일)도 함께 읽어 둔다.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self._in_xml = False
+        self._done = False
+        self.header: dict = {}
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._done:
+            line = self._f.readline()
+            if not line:
+                self._done = True
+                break
+            stripped = line.strip()
+            if not self._in_xml:
+                if stripped.startswith(b"ACCESSION NUMBER:"):
+                    self.header["accessionNo"] = stripped.split(b":", 1)[1].strip().decode()
+                elif stripped.startswith(b"FILED AS OF DATE:") and "filedAt" not in self.header:
+                    date = stripped.split(b":", 1)[1].strip().decode()
+                    self.header["filedAt"] = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
+                elif stripped.startswith(b"<ACCEPTANCE-DATETIME>"):
+                    # 접수 시각 (미 동부, YYYYMMDDHHMMSS) - 장 마감 후 공시 판별을 위해 날짜보다 우선한다
+                    accepted = stripped[len(b"<ACCEPTANCE-DATETIME>"):].strip().decode()
+                    self.header["filedAt"] = (
+                        f"{accepted[:4]}-{accepted[4:6]}-{accepted[6:8]}T{accepted[8:10]}:{accepted[10:12]}:{accepted[12:14]}"
+                    )
+                elif stripped.upper() == b"<XML>":
+                    self._in_xml = True
+                continue
+            if stripped.upper() == b"</XML>":
+                # Form 4 는 제출 파일당 ownershipDocument 하나만 포함
+                self._done = True
+                break
+            return line
+        return b""
+
+
+class SECForm4Parser:
+    """
+    EDGAR 원본 Form 4 XML 을 스트리밍 방식(iterparse)으로 파싱하는 클래스.
+
+    SECInsiderTradeAPI.filter_response 와 동일한 레코드 형태를 반환하므로
+    sec-api.io 호출 없이 로컬 파일/미러에서 내부자 스토어를 채울 수 있다.
+    """
+
+    FILE_PATTERNS = ("*.xml", "*.txt")
+    ACCESSION_PATTERN = re.compile(r"(\d{10})-?(\d{2})-?(\d{6})")
+
+    @staticmethod
+    def _text(elem: Optional[ET.Element], path: str) -> Optional[str]:
+        """
+        path 아래 텍스트를 반환한다. Form 4 는 대부분 <value> 로 한 번 더 감싸져 있다.
+        """
+        if elem is None:
+            return None
+        node = elem.find(path)
+        if node is None:
+            return None
+        value = node.find("value")
+        text = (value.text if value is not None else node.text) or ""
+        text = text.strip()
+        return text or None
+
+    @staticmethod
+    def _number(text: Optional[str]):
+        if text is None:
+            return None
+        try:
+            number = float(text.replace(",", ""))
+        except ValueError:
+            return None
+        return int(number) if number.is_integer() else number
+
+    @staticmethod
+    def _flag(text: Optional[str]) -> bool:
+        return (text or "").strip().lower() in ("1", "true")
+
+    @staticmethod
+    def _date(text: Optional[str]) -> Optional[str]:
+        # "2024-01-02-05:00" 처럼 타임존이 붙는 경우가 있어 날짜만 사용
+        return text[:10] if text else None
+
+    @staticmethod
+    def _accession_from_path(path: str) -> Optional[str]:
+        match = SECForm4Parser.ACCESSION_PATTERN.search(path.replace(os.sep, "/"))
+        if not match:
+            return None
+        return "-".join(match.groups())
+
+    @staticmethod
+    def _non_derivative(elem: ET.Element) -> dict:
+        _text, _number = SECForm4Parser._text, SECForm4Parser._number
+        price = _number(_text(elem, "transactionAmounts/transactionPricePerShare"))
+        return {
+            "transactionDate": SECForm4Parser._date(_text(elem, "transactionDate")),
+            "securityTitle": _text(elem, "securityTitle"),
+            "shares": _number(_text(elem, "transactionAmounts/transactionShares")) or 0,
+            "pricePerShare": price if price else None,
+            "transaction_code": _text(elem, "transactionCoding/transactionCode"),
+            "acquiredDisposedCode": _text(elem, "transactionAmounts/transactionAcquiredDisposedCode"),
+            "sharesOwnedAfter": _number(_text(elem, "postTransactionAmounts/sharesOwnedFollowingTransaction")) or 0
+        }
+
+    @staticmethod
+    def _derivative(elem: ET.Element) -> dict:
+        _text, _number = SECForm4Parser._text, SECForm4Parser._number
+        return {
+            "transactionDate": SECForm4Parser._date(_text(elem, "transactionDate")),
+            "securityTitle": _text(elem, "securityTitle"),
+            "conversionOrExercisePrice": _number(_text(elem, "conversionOrExercisePrice")),
+            "shares": _number(_text(elem, "transactionAmounts/transactionShares")) or 0,
+            "transaction_code": _text(elem, "transactionCoding/transactionCode"),
+            "expirationDate": SECForm4Parser._date(_text(elem, "expirationDate"))
+        }
+
+    @staticmethod
+    def parse_stream(source, accession_no: Optional[str] = None, filed_at: Optional[str] = None) -> Optional[dict]:
+        """
+        ownershipDocument XML 스트림 하나를 filter_response 레코드 하나로 변환한다.
+        거래 요소는 처리 직후 비워서 문서 크기와 무관하게 메모리 사용량을 제한한다.
+        """
+        record = {
+            "accessionNo": accession_no,
+            "filedAt": filed_at or "",
+            "periodOfReport": None,
+            "documentType": None,
+            "issuer": {"name": None, "tradingSymbol": None},
+            "reportingOwner": {
+                "name": None,
+                "relationship": {
+                    "isDirector": False,
+                    "isOfficer": False,
+                    "officerTitle": "",
+                    "isTenPercentOwner": False
+                }
+            },
+            "nonDerivativeTransactions": [],
+            "derivativeTransactions": [],
+            "footnotes": []
+        }
+
+        root = None
+        stack = []
+        owner_seen = False
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                stack.append(elem)
+                continue
+            stack.pop()
+
+            tag = elem.tag
+            if tag == "documentType":
+                record["documentType"] = (elem.text or "").strip() or None
+            elif tag == "periodOfReport":
+                record["periodOfReport"] = SECForm4Parser._date((elem.text or "").strip())
+            elif tag == "issuer":
+                record["issuer"] = {
+                    "name": SECForm4Parser._text(elem, "issuerName"),
+                    "tradingSymbol": SECForm4Parser._text(elem, "issuerTradingSymbol")
+                }
+            elif tag == "reportingOwner":
+                # 공동 보고자가 여러 명이면 첫 번째 보고자를 사용 (sec-api 응답과 동일)
+                if not owner_seen:
+                    relationship = elem.find("reportingOwnerRelationship")
+                    record["reportingOwner"] = {
+                        "name": SECForm4Parser._text(elem, "reportingOwnerId/rptOwnerName"),
+                        "relationship": {
+                            "isDirector": SECForm4Parser._flag(SECForm4Parser._text(relationship, "isDirector")),
+                            "isOfficer": SECForm4Parser._flag(SECForm4Parser._text(relationship, "isOfficer")),
+                            "officerTitle": SECForm4Parser._text(relationship, "officerTitle") or "",
+                            "isTenPercentOwner": SECForm4Parser._flag(SECForm4Parser._text(relationship, "isTenPercentOwner"))
+                        }
+                    }
+                    owner_seen = True
+            elif tag == "nonDerivativeTransaction":
+                record["nonDerivativeTransactions"].append(SECForm4Parser._non_derivative(elem))
+            elif tag == "derivativeTransaction":
+                record["derivativeTransactions"].append(SECForm4Parser._derivative(elem))
+            elif tag == "footnote":
+                record["footnotes"].append("".join(elem.itertext()).strip())
+            else:
+                continue
+
+            # 처리가 끝난 하위 트리를 부모에서 떼어내 메모리 해제
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+        if root is None or root.tag != "ownershipDocument":
+            return None
+        return record
+
+    @staticmethod
+    def parse_file(path: str) -> Optional[dict]:
+        """
+        Form 4 XML 파일(.xml) 또는 EDGAR 전체 제출 파일(.txt)을 파싱한다.
+        """
+        try:
+            with open(path, "rb") as f:
+                if path.lower().endswith(".txt"):
+                    reader = _XMLSectionReader(f)
+                    record = SECForm4Parser.parse_stream(reader)
+                    if record is None:
+                        return None
+                    record["accessionNo"] = reader.header.get("accessionNo") or SECForm4Parser._accession_from_path(path)
+                    record["filedAt"] = reader.header.get("filedAt", "")
+                    return record
+                return SECForm4Parser.parse_stream(f, accession_no=SECForm4Parser._accession_from_path(path))
+        except (ET.ParseError, OSError) as e:
+            logger.warning(f"[SECForm4Parser] 파싱 실패 ({path}): {e}")
+            return None
+
+    @staticmethod
+    def iter_files(directory: str) -> Iterator[str]:
+        for pattern in SECForm4Parser.FILE_PATTERNS:
+            yield from glob.iglob(os.path.join(directory, "**", pattern), recursive=True)
+
+    @staticmethod
+    def parse_files(paths: list[str]) -> list[dict]:
+        return [record for record in map(SECForm4Parser.parse_file, paths) if record is not None]
+
+    @staticmethod
+    def parse_directory(directory: str, max_workers: Optional[int] = None, chunksize: int = 32) -> Iterator[dict]:
+        """
+        디렉토리 하위의 Form 4 파일을 프로세스 풀로 병렬 파싱한다.
+        chunksize 개씩 묶어 제출하되 진행 중인 묶음은 워커 수 * 4 개로 제한하고,
+        결과를 하나 소비할 때마다 다음 묶음을 제출하므로 메모리 사용량이 디렉토리 크기와 무관하다.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            window = (max_workers or os.cpu_count() or 1) * 4
+            files = SECForm4Parser.iter_files(directory)
+            chunks = iter(lambda: list(itertools.islice(files, chunksize)), [])
+            pending = deque(executor.submit(SECForm4Parser.parse_files, chunk) for chunk in itertools.islice(chunks, window))
+            while pending:
+                records = pending.popleft().result()
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(executor.submit(SECForm4Parser.parse_files, next_chunk))
+                for record in records:
+                    if record["documentType"] in ("4", "4/A"):
+                        yield record
+
+    @staticmethod
+    def ingest_directory(
+        directory: str,
+        store: SECInsiderStore,
+        batch_size: int = 500,
+        max_workers: Optional[int] = None
+    ) -> int:
+        """
+        디렉토리의 Form 4 파일을 파싱하여 내부자 스토어에 batch_size 단위로 저장한다.
+
+        :return: 새로 저장된 거래 행 수
+        """
+        added = 0
+        batch = []
+        for record in SECForm4Parser.parse_directory(directory, max_workers=max_workers):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                added += store.ingest(batch)
+                batch = []
+        if batch:
+            added += store.ingest(batch)
+
+        logger.info(f"[SECForm4Parser] {directory} 에서 거래 {added}건 저장")
+        return added
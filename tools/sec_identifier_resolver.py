@@ -0,0 +1,299 @@
+import os
+import re
+import json
+import time
+import threading
+from typing import Optional
+
+import pandas as pd
+import requests
+
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class SECIdentifierResolver:
+    """
+    로컬 SEC 매핑 파일(company_tickers.json, CUSIP 매핑 CSV)을 기반으로
+    ticker / CIK / 회사명 / CUSIP 을 상호 변환하는 식별자 해석기.
+
+    LLM 이 ticker 자리에 회사명을 넣거나, issuer_name 자리에 ticker 를 넣는 경우가 잦아
+    build_query 전에 입력값을 가능한 모든 식별자로 정규화한다.
+
+    - company_tickers.json 은 SEC_COMPANY_TICKERS_FILE 로 지정하지 않으면 SEC 에서 받아
+      data/sec/ 아래에 보관하고, REFRESH_SECONDS 가 지나면 다시 받는다. (실패하면 보관본 사용)
+    - CUSIP 매핑은 공개 원본이 없어 선택 사항이다. (SEC_CUSIP_MAP_FILE, 기본 data/sec/cusip_map.csv)
+    """
+
+    COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+    REFRESH_SECONDS = 7 * 24 * 60 * 60
+    REQUEST_TIMEOUT = 15
+
+    # 회사명 비교 시 무시할 법인 형태 접미사
+    NAME_SUFFIXES = {
+        "INC", "INCORPORATED", "CORP", "CORPORATION", "CO", "COMPANY", "LTD", "LIMITED",
+        "PLC", "LLC", "LP", "NV", "SA", "AG", "SE", "THE", "HOLDINGS", "HOLDING", "GROUP",
+        "CLASS", "A", "B", "C", "COM", "NEW", "DE"
+    }
+
+    def __init__(
+        self,
+        company_tickers_file: Optional[str] = None,
+        cusip_map_file: Optional[str] = None
+    ):
+        company_tickers_file = company_tickers_file or os.getenv("SEC_COMPANY_TICKERS_FILE")
+        # 직접 지정한 파일은 그대로 쓰고, 기본 경로만 SEC 에서 받아 갱신한다
+        self.download_company_tickers = company_tickers_file is None
+        self.company_tickers_file = company_tickers_file or data_path("sec", "company_tickers.json")
+        self.cusip_map_file = cusip_map_file or os.getenv("SEC_CUSIP_MAP_FILE") or data_path("sec", "cusip_map.csv")
+
+        # 식별자별 인덱스: 모든 값은 내부 엔트리 id(int)를 가리킨다
+        self._entries: list[dict] = []
+        self._by_ticker: dict[str, int] = {}
+        self._by_cik: dict[str, int] = {}
+        self._by_cusip: dict[str, int] = {}
+        self._by_name: dict[str, int] = {}
+
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_ticker(ticker: str) -> str:
+        return ticker.strip().upper().replace(".", "-")
+
+    @staticmethod
+    def normalize_cik(cik) -> Optional[str]:
+        digits = re.sub(r"\D", "", str(cik))
+        return digits.lstrip("0") or None
+
+    @staticmethod
+    def normalize_cusip(cusip: str) -> str:
+        return re.sub(r"[^0-9A-Z]", "", cusip.upper())
+
+    @classmethod
+    def normalize_name(cls, name: str) -> str:
+        """
+        회사명을 비교용 키로 변환 ("Tesla, Inc." -> "TESLA").
+        """
+        tokens = re.sub(r"[^0-9A-Z ]", " ", name.upper().replace("&", " AND ")).split()
+        core = [token for token in tokens if token not in cls.NAME_SUFFIXES]
+        return " ".join(core or tokens)
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._load_company_tickers()
+            self._load_cusip_map()
+            self._loaded = True
+
+    def _add_entry(self, ticker=None, cik=None, name=None, cusip=None) -> int:
+        """
+        기존 엔트리와 식별자가 겹치면 병합하고, 아니면 새 엔트리를 추가한다.
+        엔트리는 ticker(주식 클래스) 단위이며, 같은 CIK 의 다른 클래스(GOOG/GOOGL, BRK-A/BRK-B)는
+        별도 엔트리로 두고 CIK 인덱스는 먼저 나온(대표) 클래스를 가리킨다.
+        """
+        ticker = self.normalize_ticker(ticker) if ticker else None
+        cik = self.normalize_cik(cik) if cik else None
+        cusip = self.normalize_cusip(cusip) if cusip else None
+
+        def compatible(candidate: Optional[int]) -> bool:
+            # ticker 가 다른 엔트리에는 병합하지 않는다
+            return candidate is not None and (not ticker or self._entries[candidate]["ticker"] in (None, ticker))
+
+        idx = None
+        if ticker in self._by_ticker:
+            idx = self._by_ticker[ticker]
+        elif compatible(self._by_cusip.get(cusip)):
+            idx = self._by_cusip[cusip]
+        elif compatible(self._by_cik.get(cik)):
+            idx = self._by_cik[cik]
+
+        if idx is None:
+            idx = len(self._entries)
+            self._entries.append({"ticker": None, "cik": None, "name": None, "cusip": None})
+
+        entry = self._entries[idx]
+        for key, value in (("ticker", ticker), ("cik", cik), ("name", name), ("cusip", cusip)):
+            if value and not entry[key]:
+                entry[key] = value
+
+        if ticker:
+            self._by_ticker.setdefault(ticker, idx)
+        if cik:
+            self._by_cik.setdefault(cik, idx)
+        if cusip:
+            self._by_cusip.setdefault(cusip, idx)
+            # 13F 등에서는 앞 6자리(발행사 코드)만 쓰이는 경우가 있다
+            self._by_cusip.setdefault(cusip[:6], idx)
+        if name:
+            self._by_name.setdefault(self.normalize_name(name), idx)
+        return idx
+
+    def _download_company_tickers(self):
+        """
+        SEC company_tickers.json 을 받아 임시 파일에 쓴 뒤 교체한다. (SEC 는 User-Agent 에 연락처를 요구)
+        """
+        try:
+            response = requests.get(
+                self.COMPANY_TICKERS_URL,
+                headers={"User-Agent": os.getenv("SEC_USER_AGENT", "FinBrain research")},
+                timeout=self.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            response.json()
+        except Exception as e:
+            logger.warning(f"[SECIdentifierResolver] company_tickers.json 다운로드 실패: {e}")
+            return
+        tmp_path = f"{self.company_tickers_file}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(response.content)
+        os.replace(tmp_path, self.company_tickers_file)
+        logger.info(f"[SECIdentifierResolver] company_tickers.json 갱신: {self.company_tickers_file}")
+
+    def _load_company_tickers(self):
+        """
+        SEC company_tickers.json 로드.
+        형식: {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}, ...}
+        """
+        if self.download_company_tickers and (
+            not os.path.exists(self.company_tickers_file)
+            or time.time() - os.path.getmtime(self.company_tickers_file) >= self.REFRESH_SECONDS
+        ):
+            self._download_company_tickers()
+
+        if not os.path.exists(self.company_tickers_file):
+            logger.warning(f"[SECIdentifierResolver] SEC 티커 매핑 파일이 존재하지 않습니다: {self.company_tickers_file}")
+            return
+
+        try:
+            with open(self.company_tickers_file, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[SECIdentifierResolver] SEC 티커 매핑 파일 로드 실패: {e}")
+            return
+
+        # company_tickers_exchange.json 형식({"fields": [...], "data": [[...]]})도 허용
+        if "fields" in raw and "data" in raw:
+            fields = raw["fields"]
+            rows = [dict(zip(fields, row)) for row in raw["data"]]
+        else:
+            rows = raw.values()
+
+        for row in rows:
+            self._add_entry(
+                ticker=row.get("ticker"),
+                cik=row.get("cik_str", row.get("cik")),
+                name=row.get("title", row.get("name"))
+            )
+
+    def _load_cusip_map(self):
+        """
+        CUSIP 매핑 CSV 로드. cusip 컬럼과 ticker/cik/name 중 하나 이상이 필요하다.
+        """
+        if not os.path.exists(self.cusip_map_file):
+            return
+
+        try:
+            df = pd.read_csv(self.cusip_map_file, dtype=str)
+        except Exception as e:
+            logger.warning(f"[SECIdentifierResolver] CUSIP 매핑 파일 로드 실패: {e}")
+            return
+
+        df.columns = [column.strip().lower() for column in df.columns]
+        if "cusip" not in df.columns:
+            logger.warning(f"[SECIdentifierResolver] CUSIP 매핑 파일에 cusip 컬럼이 없습니다: {self.cusip_map_file}")
+            return
+
+        df = df.where(df.notna(), None)
+        for row in df.to_dict(orient="records"):
+            self._add_entry(
+                ticker=row.get("ticker"),
+                cik=row.get("cik"),
+                name=row.get("name") or row.get("issuer_name"),
+                cusip=row.get("cusip")
+            )
+
+    def _lookup(self, value) -> Optional[int]:
+        """
+        어떤 식별자인지 모르는 값을 모든 인덱스에서 찾아본다.
+        """
+        if value is None:
+            return None
+        text = str(value).strip()
+        if not text:
+            return None
+
+        ticker = self.normalize_ticker(text)
+        if ticker in self._by_ticker:
+            return self._by_ticker[ticker]
+
+        if text.replace("-", "").isdigit():
+            cik = self.normalize_cik(text)
+            if cik in self._by_cik:
+                return self._by_cik[cik]
+
+        cusip = self.normalize_cusip(text)
+        if len(cusip) in (6, 8, 9) and cusip in self._by_cusip:
+            return self._by_cusip[cusip]
+
+        return self._by_name.get(self.normalize_name(text))
+
+    def resolve(
+        self,
+        ticker: Optional[str] = None,
+        cik: Optional[str] = None,
+        issuer_name: Optional[str] = None,
+        cusip: Optional[str] = None
+    ) -> dict:
+        """
+        입력된 식별자 중 하나라도 매핑되면 ticker/cik/name/cusip 전체를 채워서 반환한다.
+        매핑에 실패한 항목은 입력값을 그대로 유지한다.
+
+        Returns:
+            dict: {"ticker", "cik", "name", "cusip", "resolved"} 형태
+        """
+        self._ensure_loaded()
+
+        # 명시된 자리의 값을 먼저 확인하고, 실패하면 자리와 무관하게 전체 인덱스를 조회
+        idx = None
+        for value, index in (
+            (ticker, self._by_ticker), (cusip, self._by_cusip), (cik, self._by_cik)
+        ):
+            if value is None:
+                continue
+            if index is self._by_ticker:
+                key = self.normalize_ticker(value)
+            elif index is self._by_cusip:
+                key = self.normalize_cusip(value)
+            else:
+                key = self.normalize_cik(value)
+            if key in index:
+                idx = index[key]
+                break
+
+        if idx is None:
+            for value in (ticker, cusip, cik, issuer_name):
+                idx = self._lookup(value)
+                if idx is not None:
+                    break
+
+        if idx is None:
+            return {
+                "ticker": ticker.strip().upper() if ticker else None,
+                "cik": cik,
+                "name": issuer_name,
+                "cusip": cusip,
+                "resolved": False
+            }
+
+        entry = self._entries[idx]
+        return {
+            "ticker": entry["ticker"] or (ticker.strip().upper() if ticker else None),
+            "cik": entry["cik"] or cik,
+            "name": entry["name"] or issuer_name,
+            "cusip": entry["cusip"] or cusip,
+            "resolved": True
+        }
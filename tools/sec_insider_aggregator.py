@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+
+
+class SECInsiderAggregator:
+    """
+    SECInsiderTradeAPI.filter_response 결과(공시별 중첩 거래 목록)를
+    컬럼형 DataFrame 으로 펼치고 순매수/거래대금 등을 집계하는 클래스.
+
+    LLM 이 공시를 하나씩 읽으며 직접 합산하지 않도록, 집계 결과만 요약해서 돌려준다.
+    """
+
+    # 장내 매수 / 장내 매도 코드 (매수·매도 비율 계산 기준)
+    BUY_CODE = "P"
+    SELL_CODE = "S"
+
+    # acquiredDisposedCode 가 없을 때 처분(-)으로 볼 거래 코드
+    DISPOSE_CODES = {"S", "D", "F", "G", "U"}
+
+    COLUMNS = [
+        "accessionNo", "filedAt", "ticker", "issuer", "owner",
+        "isDirector", "isOfficer", "officerTitle", "isTenPercentOwner",
+        "transactionDate", "transaction_code", "acquiredDisposedCode",
+        "shares", "pricePerShare", "sharesOwnedAfter"
+    ]
+
+    @staticmethod
+    def to_frame(filings: list[dict]) -> pd.DataFrame:
+        """
+        공시 목록의 비파생상품 거래를 거래 1건 = 1행인 DataFrame 으로 펼친다.
+
+        :param filings: SECInsiderTradeAPI.filter_response 결과
+        :return: 컬럼형 DataFrame (value, signed_shares 파생 컬럼 포함)
+        """
+        rows = []
+        for filing in filings or []:
+            issuer = filing.get("issuer") or {}
+            owner = filing.get("reportingOwner") or {}
+            relationship = owner.get("relationship") or {}
+            for trans in filing.get("nonDerivativeTransactions", []):
+                rows.append((
+                    filing.get("accessionNo"),
+                    filing.get("filedAt"),
+                    issuer.get("tradingSymbol"),
+                    issuer.get("name"),
+                    owner.get("name"),
+                    bool(relationship.get("isDirector")),
+                    bool(relationship.get("isOfficer")),
+                    relationship.get("officerTitle") or "",
+                    bool(relationship.get("isTenPercentOwner")),
+                    trans.get("transactionDate"),
+                    trans.get("transaction_code"),
+                    trans.get("acquiredDisposedCode"),
+                    trans.get("shares"),
+                    trans.get("pricePerShare"),
+                    trans.get("sharesOwnedAfter"),
+                ))
+
+        df = pd.DataFrame.from_records(rows, columns=SECInsiderAggregator.COLUMNS)
+        return SECInsiderAggregator.prepare_frame(df)
+
+    @staticmethod
+    def prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        타입 변환 및 파생 컬럼(value, signed_shares) 계산.
+        """
+        df = df.copy()
+        df["filedAt"] = SECInsiderAggregator.filed_timestamps(df["filedAt"])
+        df["transactionDate"] = pd.to_datetime(df["transactionDate"], errors="coerce")
+        # 거래일이 비어 있으면 제출일로 대체
+        df["transactionDate"] = df["transactionDate"].fillna(df["filedAt"])
+
+        for col in ["shares", "pricePerShare", "sharesOwnedAfter"]:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        df["shares"] = df["shares"].fillna(0.0)
+
+        codes = df["transaction_code"].fillna("").to_numpy(dtype=object)
+        ad_codes = df["acquiredDisposedCode"].fillna("").to_numpy(dtype=object)
+
+        # A/D 코드가 있으면 그대로, 없으면 거래 코드로 방향을 추정
+        disposed = np.where(
+            ad_codes == "D", True,
+            np.where(ad_codes == "A", False, np.isin(codes, list(SECInsiderAggregator.DISPOSE_CODES)))
+        )
+        shares = df["shares"].to_numpy(dtype=float)
+        df["signed_shares"] = np.where(disposed, -shares, shares)
+        df["value"] = shares * df["pricePerShare"].fillna(0.0).to_numpy(dtype=float)
+        return df.sort_values("transactionDate", kind="stable").reset_index(drop=True)
+
+    @staticmethod
+    def filed_timestamps(filed_at) -> pd.Series:
+        """
+        제출 시각을 미 동부 현지 시각(tz 없음)으로 통일한다.
+        오프셋이 붙은 ISO 시각(sec-api: "2024-05-01T18:30:00-04:00")은 동부 시간으로 변환하고,
+        날짜만 있거나 오프셋이 없는 값은 이미 동부 기준으로 본다. (날짜만 있으면 00:00)
+        """
+        filed_at = pd.Series(filed_at)
+        if pd.api.types.is_datetime64_any_dtype(filed_at):
+            if filed_at.dt.tz is None:
+                return filed_at
+            return filed_at.dt.tz_convert("America/New_York").dt.tz_localize(None)
+
+        text = filed_at.astype("string").str.strip()
+        aware = (text.str.len() > 10) & text.str.contains(r"(?:Z|[+-]\d{2}:?\d{2})$", na=False)
+        result = pd.to_datetime(text.where(~aware), errors="coerce", format="mixed")
+        if aware.any():
+            converted = pd.to_datetime(text[aware], utc=True, errors="coerce", format="ISO8601")
+            result[aware] = converted.dt.tz_convert("America/New_York").dt.tz_localize(None)
+        return result
+
+    @staticmethod
+    def filing_days(filed_at: pd.Series) -> pd.Series:
+        """
+        제출 시각을 시장이 공시를 알 수 있는 날짜로 바꾼다.
+        장 마감(미 동부 16:00) 이후 제출된 공시는 다음 날로 본다.
+        제출 시각 없이 날짜만 있는 값은 그 날짜 그대로이므로, 장 마감 후 공시인지 구분할 수 없다.
+        """
+        filed = SECInsiderAggregator.filed_timestamps(filed_at)
+        return filed.dt.normalize() + pd.to_timedelta((filed.dt.hour >= 16).astype(int), unit="D")
+
+    @staticmethod
+    def summarize(df: pd.DataFrame, top_owners: int = 10) -> dict:
+        """
+        펼쳐진 거래 DataFrame 을 집계하여 요약 dict 를 반환한다.
+
+        :param df: to_frame 결과
+        :param top_owners: 거래대금 기준 상위 내부자 수
+        :return: 전체 합계, 월별 합계, 내부자별 합계, 거래 코드별 건수
+        """
+        if df.empty:
+            return {}
+
+        is_buy = (df["transaction_code"] == SECInsiderAggregator.BUY_CODE).to_numpy()
+        is_sell = (df["transaction_code"] == SECInsiderAggregator.SELL_CODE).to_numpy()
+        shares = df["shares"].to_numpy(dtype=float)
+        value = df["value"].to_numpy(dtype=float)
+
+        df = df.assign(
+            buy_shares=np.where(is_buy, shares, 0.0),
+            sell_shares=np.where(is_sell, shares, 0.0),
+            buy_value=np.where(is_buy, value, 0.0),
+            sell_value=np.where(is_sell, value, 0.0),
+            month=df["transactionDate"].dt.to_period("M").astype(str)
+        )
+
+        sum_cols = ["signed_shares", "buy_shares", "sell_shares", "buy_value", "sell_value"]
+        buy_value = float(df["buy_value"].sum())
+        sell_value = float(df["sell_value"].sum())
+
+        totals = {
+            "filings": int(df["accessionNo"].nunique()),
+            "transactions": int(len(df)),
+            "period": f"{df['transactionDate'].min():%Y-%m-%d} ~ {df['transactionDate'].max():%Y-%m-%d}",
+            "net_shares": float(df["signed_shares"].sum()),
+            "buy_shares": float(df["buy_shares"].sum()),
+            "sell_shares": float(df["sell_shares"].sum()),
+            "buy_value": round(buy_value, 2),
+            "sell_value": round(sell_value, 2),
+            "net_value": round(buy_value - sell_value, 2),
+            "buy_sell_ratio": round(buy_value / sell_value, 3) if sell_value else None,
+        }
+
+        by_month = (
+            df.groupby("month", sort=True)[sum_cols].sum()
+            .rename(columns={"signed_shares": "net_shares"})
+            .round(2)
+        )
+
+        by_owner = (
+            df.groupby("owner", sort=False)
+            .agg(
+                role=("officerTitle", "first"),
+                is_director=("isDirector", "max"),
+                net_shares=("signed_shares", "sum"),
+                buy_value=("buy_value", "sum"),
+                sell_value=("sell_value", "sum"),
+                last_date=("transactionDate", "max"),
+                shares_owned_after=("sharesOwnedAfter", "last"),
+            )
+        )
+        by_owner["gross_value"] = by_owner["buy_value"] + by_owner["sell_value"]
+        by_owner = by_owner.sort_values("gross_value", ascending=False).head(top_owners)
+        by_owner["last_date"] = by_owner["last_date"].dt.strftime("%Y-%m-%d")
+        by_owner = by_owner.drop(columns="gross_value").round(2)
+
+        by_owner_month = (
+            df.groupby(["owner", "month"], sort=True)["signed_shares"].sum()
+            .loc[lambda s: s != 0]
+        )
+
+        return {
+            "totals": totals,
+            "by_month": by_month.reset_index().to_dict(orient="records"),
+            "by_owner": by_owner.reset_index().to_dict(orient="records"),
+            "by_owner_month": [
+                {"owner": owner, "month": month, "net_shares": float(net)}
+                for (owner, month), net in by_owner_month.items()
+                if owner in by_owner.index
+            ],
+            "transaction_codes": df["transaction_code"].value_counts().to_dict(),
+        }
@@ -0,0 +1,134 @@
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.sec_insider_store import SECInsiderStore
+from tools.sec_insider_aggregator import SECInsiderAggregator
+
+
+class SECInsiderClusterDetector:
+    """
+    동일 발행사의 내부자 여러 명이 짧은 기간 안에 장내 매수(P)한 '클러스터 매수'를 탐지하는 클래스.
+
+    로컬 내부자 스토어를 (종목, 거래일) 순으로 정렬한 뒤 윈도우 스캔으로 이벤트를 만든다.
+    스토어에 새 공시가 들어오면 해당 종목만 다시 스캔한다.
+    """
+
+    BUY_CODE = "P"
+
+    def __init__(self, store: SECInsiderStore):
+        self.store = store
+        self._lock = threading.Lock()
+        # (window_days, min_insiders) -> {"seq": 마지막 스캔 시점, "events": {ticker: [event, ...]}}
+        self._cache: dict[tuple[int, int], dict] = {}
+
+    @staticmethod
+    def _scan_issuer(group: pd.DataFrame, window_days: int, min_insiders: int) -> list[dict]:
+        """
+        한 종목의 매수 거래(거래일 오름차순)에서 클러스터 이벤트를 찾는다.
+
+        각 거래일을 시작점으로 window_days 윈도우를 잡고, 서로 다른 내부자 수가
+        min_insiders 이상인 윈도우들을 겹치는 것끼리 합쳐 하나의 이벤트로 만든다.
+        """
+        days = group["transactionDate"].to_numpy(dtype="datetime64[D]")
+        owners = group["owner"].to_numpy(dtype=object)
+        n = len(days)
+        if n < min_insiders:
+            return []
+
+        # 각 시작점의 윈도우 끝 인덱스 (미포함)
+        window_end = np.searchsorted(days, days + np.timedelta64(window_days, "D"), side="right")
+
+        qualifying = np.zeros(n, dtype=bool)
+        for i in range(n):
+            if window_end[i] - i >= min_insiders:
+                qualifying[i] = len(set(owners[i:window_end[i]])) >= min_insiders
+
+        # 자격을 갖춘 윈도우 중 겹치는 구간 병합
+        spans = []
+        for i in np.flatnonzero(qualifying):
+            start, end = int(i), int(window_end[i])
+            if spans and start < spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+
+        shares = group["shares"].to_numpy(dtype=float)
+        value = group["value"].to_numpy(dtype=float)
+        # 클러스터가 시장에 모두 알려진 날 = 구간 내 마지막 공시일 (백테스트 진입 기준)
+        filed = SECInsiderAggregator.filing_days(group["filedAt"])
+        events = []
+        for start, end in spans:
+            participants = pd.unique(owners[start:end])
+            known = filed.iloc[start:end].max()
+            events.append({
+                "ticker": group["ticker"].iat[start],
+                "issuer": group["issuer"].iat[start],
+                "start_date": str(days[start]),
+                "end_date": str(days[end - 1]),
+                "filed_date": known.strftime("%Y-%m-%d") if pd.notna(known) else None,
+                "insiders": int(len(participants)),
+                "participants": [str(name) for name in participants[:5]],
+                "transactions": int(end - start),
+                "shares": float(shares[start:end].sum()),
+                "value": round(float(value[start:end].sum()), 2),
+            })
+        return events
+
+    def refresh(self, window_days: int = 14, min_insiders: int = 3) -> dict[str, list[dict]]:
+        """
+        마지막 스캔 이후 ingest 된 종목만 다시 스캔하여 이벤트 캐시를 갱신한다.
+        """
+        key = (window_days, min_insiders)
+        with self._lock:
+            state = self._cache.get(key)
+            current_seq = self.store.seq
+            if state is not None and state["seq"] == current_seq:
+                return state["events"]
+
+            frame = self.store.frame()
+            buys = frame[(frame["transaction_code"] == self.BUY_CODE) & frame["ticker"].notna()]
+            if state is None:
+                state = {"seq": 0, "events": {}}
+            else:
+                dirty = self.store.tickers_changed_since(state["seq"])
+                buys = buys[buys["ticker"].isin(dirty)]
+
+            buys = buys.sort_values(["ticker", "transactionDate"], kind="stable")
+            for ticker, group in buys.groupby("ticker", sort=False):
+                state["events"][ticker] = self._scan_issuer(group, window_days, min_insiders)
+
+            state["seq"] = current_seq
+            self._cache[key] = state
+            return state["events"]
+
+    def detect(
+        self,
+        ticker: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        window_days: int = 14,
+        min_insiders: int = 3,
+        min_value: Optional[float] = None,
+        limit: int = 20
+    ) -> list[dict]:
+        """
+        조건에 맞는 클러스터 매수 이벤트를 최신순으로 반환한다.
+        """
+        events_by_ticker = self.refresh(window_days, min_insiders)
+        if ticker:
+            events = list(events_by_ticker.get(ticker.upper(), []))
+        else:
+            events = [event for events in events_by_ticker.values() for event in events]
+
+        if start_date:
+            events = [e for e in events if e["end_date"] >= start_date]
+        if end_date:
+            events = [e for e in events if e["start_date"] <= end_date]
+        if min_value is not None:
+            events = [e for e in events if e["value"] >= min_value]
+
+        events.sort(key=lambda e: e["end_date"], reverse=True)
+        return events[:limit]
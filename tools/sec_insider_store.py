@@ -0,0 +1,169 @@
+import os
+import re
+import glob
+import fcntl
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import pandas as pd
+
+from tools.sec_insider_aggregator import SECInsiderAggregator
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class SECInsiderStore:
+    """
+    Form 4 비파생상품 거래를 로컬 Parquet 파트 파일로 누적 저장하는 스토어.
+
+    - ingest 할 때마다 새 파트 파일(part-000001.parquet ...)을 추가하므로 기존 파일을 다시 쓰지 않는다.
+    - 각 행에는 ingest 순번(ingest_seq)이 기록되어, 이후 ingest 된 종목만 골라 재계산할 수 있다.
+    - 순번 할당과 파일 쓰기는 파일 락(flock) 안에서 하며, 그 사이 다른 프로세스가 추가한 파트를 먼저 읽어 들인다.
+    """
+
+    # 동일 거래 판별 키 (같은 공시가 여러 번 조회되어도 한 번만 저장)
+    DEDUP_KEYS = ["accessionNo", "owner", "transactionDate", "transaction_code", "shares", "pricePerShare"]
+    MAX_PARTS = 64
+
+    def __init__(self, store_dir: Optional[str] = None):
+        self.store_dir = store_dir or os.path.dirname(data_path("sec_insider", "part"))
+        os.makedirs(self.store_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._frame: Optional[pd.DataFrame] = None
+        self._seq = 0
+
+    @property
+    def seq(self) -> int:
+        self._ensure_loaded()
+        return self._seq
+
+    def _part_files(self) -> list[str]:
+        return sorted(glob.glob(os.path.join(self.store_dir, "part-*.parquet")))
+
+    @staticmethod
+    def _part_seq(path: str) -> int:
+        match = re.match(r"part-(\d+)", os.path.basename(path))
+        return int(match.group(1)) if match else 0
+
+    @contextmanager
+    def _file_lock(self):
+        """
+        프로세스 간 쓰기 락 (uvicorn 워커 여러 개가 같은 store_dir 을 쓴다).
+        """
+        with open(os.path.join(self.store_dir, ".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _merge_new_parts_locked(self):
+        """
+        마지막으로 본 순번 이후 다른 프로세스가 쓴 파트 파일을 메모리 프레임에 합친다.
+        """
+        parts = []
+        for path in self._part_files():
+            if self._part_seq(path) <= self._seq:
+                continue
+            try:
+                parts.append(pd.read_parquet(path))
+            except Exception as e:
+                logger.warning(f"[SECInsiderStore] 파트 파일 로드 실패 ({path}): {e}")
+        if not parts:
+            return
+        frame = pd.concat([self._frame, *parts], ignore_index=True)
+        self._frame = frame.drop_duplicates(subset=self.DEDUP_KEYS, keep="first").reset_index(drop=True)
+        self._seq = max(self._seq, int(self._frame["ingest_seq"].max()))
+
+    def _ensure_loaded(self):
+        if self._frame is not None:
+            return
+        with self._lock:
+            if self._frame is not None:
+                return
+            parts = []
+            for path in self._part_files():
+                try:
+                    parts.append(pd.read_parquet(path))
+                except Exception as e:
+                    logger.warning(f"[SECInsiderStore] 파트 파일 로드 실패 ({path}): {e}")
+
+            if parts:
+                frame = pd.concat(parts, ignore_index=True)
+                frame = frame.drop_duplicates(subset=self.DEDUP_KEYS, keep="first")
+                self._seq = int(frame["ingest_seq"].max())
+            else:
+                frame = SECInsiderAggregator.to_frame([]).assign(ingest_seq=pd.Series(dtype="int64"))
+            self._frame = frame.reset_index(drop=True)
+
+    def frame(self) -> pd.DataFrame:
+        """
+        저장된 전체 거래 DataFrame (읽기 전용으로 사용할 것).
+        """
+        self._ensure_loaded()
+        return self._frame
+
+    def ingest(self, filings: list[dict]) -> int:
+        """
+        filter_response 형식의 공시 목록을 저장한다.
+
+        :return: 새로 추가된 거래 행 수
+        """
+        if not filings:
+            return 0
+        return self.ingest_frame(SECInsiderAggregator.to_frame(filings))
+
+    def ingest_frame(self, new_rows: pd.DataFrame) -> int:
+        """
+        SECInsiderAggregator.to_frame 형식의 DataFrame 을 저장한다.
+        """
+        if new_rows.empty:
+            return 0
+
+        self._ensure_loaded()
+        with self._lock, self._file_lock():
+            self._merge_new_parts_locked()
+            new_rows = new_rows.drop_duplicates(subset=self.DEDUP_KEYS)
+            existing = self._frame.set_index(self.DEDUP_KEYS).index
+            is_new = ~new_rows.set_index(self.DEDUP_KEYS).index.isin(existing)
+            new_rows = new_rows[is_new]
+            if new_rows.empty:
+                return 0
+
+            # 다른 프로세스의 빈 파트/병합 파일 번호와도 겹치지 않도록 디스크 기준으로 다음 순번을 잡는다
+            self._seq = max([self._seq, *map(self._part_seq, self._part_files())]) + 1
+            new_rows = new_rows.assign(ingest_seq=self._seq)
+            path = os.path.join(self.store_dir, f"part-{self._seq:06d}.parquet")
+            try:
+                new_rows.to_parquet(path, index=False)
+            except Exception as e:
+                logger.warning(f"[SECInsiderStore] 파트 파일 저장 실패 ({path}): {e}")
+
+            self._frame = pd.concat([self._frame, new_rows], ignore_index=True)
+            if len(self._part_files()) > self.MAX_PARTS:
+                self._compact_locked()
+
+            return len(new_rows)
+
+    def _compact_locked(self):
+        """
+        파트 파일을 하나로 합친다. (ingest_seq 는 유지)
+        """
+        old_parts = self._part_files()
+        path = os.path.join(self.store_dir, f"part-{self._seq:06d}-compact.parquet")
+        try:
+            self._frame.to_parquet(path, index=False)
+        except Exception as e:
+            logger.warning(f"[SECInsiderStore] 파트 파일 병합 실패: {e}")
+            return
+        for old in old_parts:
+            os.remove(old)
+
+    def tickers_changed_since(self, seq: int) -> set[str]:
+        """
+        seq 이후 ingest 된 거래가 있는 종목 목록.
+        """
+        frame = self.frame()
+        return set(frame.loc[frame["ingest_seq"] > seq, "ticker"].dropna().unique())
@@ -5,6 +5,9 @@ import os
 from typing import Optional
 from langchain.tools import tool
 from datetime import datetime, timedelta
+
+from tools.sec_identifier_resolver import SECIdentifierResolver
+from tools.sec_insider_store import SECInsiderStore
 class SECBaseAPI:
     """
     SEC API의 공통 로직을 처리하는 기반 클래스.
@@ -13,6 +16,8 @@ class SECBaseAPI:
     SEC_INSIDER_TRADE_API_URL = "https://api.sec-api.io/insider-trading"
     SEC_13D_13G_API_URL = "https://api.sec-api.io/form-13d-13g"
     SEC_13F_HOLDINGS_API_URL = "https://api.sec-api.io/form-13f/holdings"
+    SEC_PAGE_SIZE = 5
+    identifier_resolver = SECIdentifierResolver()
     @staticmethod
     def _fetch_sec_data(api_url: str, query: str, from_value: int = 0) -> dict:
         """
@@ -31,7 +36,7 @@ class SECBaseAPI:
         payload = {
             "query": query,
             "from": from_value,
-            "size": 5,
+            "size": SECBaseAPI.SEC_PAGE_SIZE,
             "sort": [{"filedAt": {"order": "desc"}}] # 최신 데이터 우선 정렬
         }
 
@@ -81,6 +86,8 @@ class SECInsiderTradeAPI(SECBaseAPI):
     """
     SEC 내부자 거래 API 클래스.
     """
+    # 조회된 Form 4 거래를 누적하는 로컬 스토어 (클러스터 탐지 등에서 사용)
+    insider_store = SECInsiderStore()
 
     @staticmethod
     def build_query(
@@ -130,7 +137,7 @@ class SECInsiderTradeAPI(SECBaseAPI):
         for transaction in response_data.get("transactions", []):
             filtered_transaction = {
                 "accessionNo": transaction.get("accessionNo", None),
-                "filedAt": transaction.get("filedAt", "")[:10], 
+                "filedAt": transaction.get("filedAt", ""),  # 제출 시각 (ISO 8601, 오프셋 포함) - 장 마감 후 공시 판별에 사용
                 "periodOfReport": transaction.get("periodOfReport", None),
                 "documentType": transaction.get("documentType", None),
                 "issuer": {
@@ -159,6 +166,7 @@ class SECInsiderTradeAPI(SECBaseAPI):
                     "shares": trans.get("amounts", {}).get("shares", 0),
                     "pricePerShare": trans.get("amounts", {}).get("pricePerShare", None) if trans.get("amounts", {}).get("pricePerShare", 0) != 0 else None,
                     "transaction_code": trans.get("coding", {}).get("code", None), 
+                    "acquiredDisposedCode": trans.get("amounts", {}).get("acquiredDisposedCode", None),
                     "sharesOwnedAfter": trans.get("postTransactionAmounts", {}).get("sharesOwnedFollowingTransaction", 0)
                 })
 
@@ -204,10 +212,50 @@ class SECInsiderTradeAPI(SECBaseAPI):
         """
         reference_date, start_date, end_date = SECBaseAPI.resolve_date_range(reference_date, start_date, end_date)
 
+        # 회사명/CIK 가 ticker 로 들어온 경우에도 거래 심볼로 정규화
+        if ticker:
+            ticker = SECBaseAPI.identifier_resolver.resolve(ticker=ticker)["ticker"]
+
         query = SECInsiderTradeAPI.build_query(ticker, owner, transaction_type, start_date, end_date)
         raw_data = SECBaseAPI._fetch_sec_data(SECBaseAPI.SEC_INSIDER_TRADE_API_URL, query, from_value)
-        
-        return SECInsiderTradeAPI.filter_response(raw_data) if raw_data else None
+        if not raw_data:
+            return None
+
+        filtered = SECInsiderTradeAPI.filter_response(raw_data)
+        SECInsiderTradeAPI.insider_store.ingest(filtered)
+        return filtered
+
+    @staticmethod
+    def _fetch_filings_pages(
+        ticker: str = None,
+        owner: str = None,
+        transaction_type: str = None,
+        start_date: str = None,
+        end_date: str = None,
+        reference_date: str = None,
+        max_pages: int = 4
+    ) -> list:
+        """
+        여러 페이지의 내부자 거래 공시를 이어서 조회한다. (집계용)
+        마지막 페이지가 페이지 크기보다 작으면 중단한다.
+        """
+        filings = []
+        for page in range(max_pages):
+            result = SECInsiderTradeAPI._fetch_filings_core(
+                ticker=ticker,
+                owner=owner,
+                transaction_type=transaction_type,
+                start_date=start_date,
+                end_date=end_date,
+                from_value=page * SECBaseAPI.SEC_PAGE_SIZE,
+                reference_date=reference_date
+            )
+            if not result:
+                break
+            filings.extend(result)
+            if len(result) < SECBaseAPI.SEC_PAGE_SIZE:
+                break
+        return filings
 
 
 class SEC13D13GAPI(SECBaseAPI):
@@ -223,7 +271,8 @@ class SEC13D13GAPI(SECBaseAPI):
         end_date: Optional[str] = None,
         min_percent: Optional[float] = None,
         form_type: Optional[str] = None,
-        cik: Optional[str] = None
+        cik: Optional[str] = None,
+        cusip: Optional[str] = None
     ) -> str:
         """
         사용자가 입력한 간단한 파라미터를 Lucene Query 형식으로 변환하는 함수
@@ -235,10 +284,13 @@ class SEC13D13GAPI(SECBaseAPI):
         :param min_percent: 최소 지분율 (예: 5% 이상이면 5 입력)
         :param form_type: 보고서 유형 (예: 13D, 13G, 13D/A 등)
         :param cik: 특정 기업 CIK (발행 기업 검색)
+        :param cusip: 발행 기업 CUSIP (지정 시 issuer_name 대신 사용)
         :return: Lucene Query 형식의 문자열
         """
         conditions = []
-        if issuer_name: 
+        if cusip:
+            conditions.append(f"cusip:{cusip}")
+        elif issuer_name: 
             conditions.append(f"nameOfIssuer:\"{issuer_name}\"")  
         if owner:
             conditions.append(f"owners.name:\"{owner}\"")
@@ -269,7 +321,7 @@ class SEC13D13GAPI(SECBaseAPI):
             filtered_filing = {
                 "accessionNo": filing.get("accessionNo"),
                 "formType": filing.get("formType"),
-                "filedAt": filing.get("filedAt")[:10],  # YYYY-MM-DD 형식으로 저장
+                "filedAt": filing.get("filedAt"),  # 제출 시각 (ISO 8601, 오프셋 포함) - 장 마감 후 공시 판별에 사용
                 "nameOfIssuer": filing.get("nameOfIssuer"),
                 "cusip": filing.get("cusip"),
                 "eventDate": filing.get("eventDate"),
@@ -351,7 +403,14 @@ class SEC13D13GAPI(SECBaseAPI):
         """
         reference_date, start_date, end_date = SECBaseAPI.resolve_date_range(reference_date, start_date, end_date)
 
-        query = SEC13D13GAPI.build_query(issuer_name, owner, start_date, end_date, min_percent, form_type, cik)
+        # 회사명 표기 차이로 검색이 비는 것을 막기 위해 가능하면 CUSIP 으로 조회
+        cusip = None
+        if issuer_name:
+            identifiers = SECBaseAPI.identifier_resolver.resolve(issuer_name=issuer_name)
+            issuer_name = identifiers["name"]
+            cusip = identifiers["cusip"]
+
+        query = SEC13D13GAPI.build_query(issuer_name, owner, start_date, end_date, min_percent, form_type, cik, cusip)
         raw_data = SECBaseAPI._fetch_sec_data(SECBaseAPI.SEC_13D_13G_API_URL, query, from_value)
         # return raw_data
         return SEC13D13GAPI.filter_response(raw_data) if raw_data else None
@@ -510,6 +569,15 @@ class SEC13FHoldingsAPI(SECBaseAPI):
         """
         
         reference_date, start_date, end_date = SECBaseAPI.resolve_date_range(reference_date, start_date, end_date)
+
+        # 보유 종목 식별자는 가장 확실한 하나만 사용 (조건이 AND 로 결합되므로)
+        if ticker or cusip or issuer_name:
+            identifiers = SECBaseAPI.identifier_resolver.resolve(ticker=ticker, issuer_name=issuer_name, cusip=cusip)
+            if identifiers["cusip"]:
+                ticker, cusip, issuer_name = None, identifiers["cusip"], None
+            elif identifiers["ticker"]:
+                ticker, cusip, issuer_name = identifiers["ticker"], None, None
+
         query = SEC13FHoldingsAPI.build_query(
             cik, company_name, issuer_name, ticker, 
             cusip, start_date, end_date, min_value, 
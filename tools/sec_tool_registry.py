@@ -1,12 +1,22 @@
 from typing import Optional
 from langchain.tools import tool
 from tools.sec_insider_trade_tool import SECInsiderTradeAPI, SEC13D13GAPI, SEC13FHoldingsAPI  # 당신이 만든 클래스 위치 기준
+from tools.sec_insider_aggregator import SECInsiderAggregator
+from tools.sec_insider_cluster_detector import SECInsiderClusterDetector
+from tools.filing_records import InsiderTransactionRecord, OwnershipFilingRecord, InstitutionalHoldingRecord
+from tools.event_study import EventStudyEngine
+from tools.insider_backtester import InsiderSignalBacktester
+from tools.market_data_tool import MarketDataTools
 from datetime import datetime, timedelta
 
 class SecToolRegistry:
     insider_api = SECInsiderTradeAPI()
     form13d13g_api = SEC13D13GAPI()
     form13f_api = SEC13FHoldingsAPI()
+    cluster_detector = SECInsiderClusterDetector(SECInsiderTradeAPI.insider_store)
+    backtester = InsiderSignalBacktester(
+        SECInsiderTradeAPI.insider_store, cluster_detector, MarketDataTools.price_cache, MarketDataTools.price_store
+    )
 
     @staticmethod
     @tool
@@ -23,7 +33,7 @@ class SecToolRegistry:
         내부자 주식 매매(Form 3, 4, 5) 내역을 조회하는 도구
 
         Args:
-            ticker (str, optional): 기업 티커 (예: TSLA)
+            ticker (str, optional): 기업 티커 (예: TSLA). 회사명이나 CIK 를 넣어도 티커로 변환됨
             owner (str, optional): 내부자 이름
             transaction_type (str, optional): 거래 유형 (예: P, S 등)
             start_date (str, optional): 조회 시작일 ("YYYY-MM-DD")
@@ -32,7 +42,7 @@ class SecToolRegistry:
             reference_date (str, optional): 현재 시간
 
         Returns:
-            dict: 내부자 거래 내역이 담긴 JSON 응답
+            dict: 내부자 거래 내역 (공통 값은 common 줄, 나머지는 '|' 구분 행으로 요약된 텍스트)
         """
 
         result = SecToolRegistry.insider_api._fetch_filings_core(
@@ -48,7 +58,107 @@ class SecToolRegistry:
         if not result or len(result) == 0:
             return {"message": f"No SEC filings found for {ticker or owner} between {start_date} and {end_date}."}
         
-        return {"message": result}
+        return {"message": InsiderTransactionRecord.serialize(InsiderTransactionRecord.from_filtered(result))}
+
+    @staticmethod
+    @tool
+    def get_insider_activity_summary_tool(
+        ticker: Optional[str] = None,
+        owner: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        reference_date: Optional[str] = None,
+        max_pages: int = 4
+    ) -> dict:
+        """
+        내부자 거래(Form 4) 내역을 집계하여 요약하는 도구
+        순매수 주식 수, 거래대금(주식 수 × 주당 가격), 매수/매도 비율, 월별·내부자별 합계를 반환한다.
+        개별 공시 원문이 아니라 합계가 필요한 질문에는 이 도구를 사용할 것
+
+        Args:
+            ticker (str, optional): 기업 티커 (예: TSLA)
+            owner (str, optional): 내부자 이름
+            start_date (str, optional): 조회 시작일 ("YYYY-MM-DD")
+            end_date (str, optional): 조회 종료일 ("YYYY-MM-DD")
+            reference_date (str, optional): 현재 시간
+            max_pages (int, optional): 조회할 최대 페이지 수 (페이지당 5건)
+
+        Returns:
+            dict: 내부자 거래 집계 요약
+        """
+        filings = SecToolRegistry.insider_api._fetch_filings_pages(
+            ticker=ticker,
+            owner=owner,
+            start_date=start_date,
+            end_date=end_date,
+            reference_date=reference_date,
+            max_pages=max_pages
+        )
+
+        summary = SECInsiderAggregator.summarize(SECInsiderAggregator.to_frame(filings))
+        if not summary:
+            return {"message": f"No SEC filings found for {ticker or owner} between {start_date} and {end_date}."}
+
+        return {"message": summary}
+
+    @staticmethod
+    @tool
+    def get_insider_cluster_buying_tool(
+        ticker: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        reference_date: Optional[str] = None,
+        window_days: int = 14,
+        min_insiders: int = 3,
+        min_value: Optional[float] = None,
+        limit: int = 20
+    ) -> dict:
+        """
+        동일 기업의 내부자 여러 명이 짧은 기간 안에 장내 매수(P)한 '클러스터 매수' 이벤트를 조회하는 도구
+        ticker 를 지정하지 않으면 로컬에 저장된 전체 종목에서 탐지한다.
+
+        Args:
+            ticker (str, optional): 기업 티커 (예: TSLA)
+            start_date (str, optional): 조회 시작일 ("YYYY-MM-DD")
+            end_date (str, optional): 조회 종료일 ("YYYY-MM-DD")
+            reference_date (str, optional): 현재 시간
+            window_days (int, optional): 클러스터로 볼 기간(일). 기본값 14
+            min_insiders (int, optional): 클러스터로 볼 최소 내부자 수. 기본값 3
+            min_value (float, optional): 최소 합산 매수 금액 (USD)
+            limit (int, optional): 최대 결과 수
+
+        Returns:
+            dict: 클러스터 이벤트 목록 (기간, 참여 내부자 수, 합산 주식 수/금액)
+        """
+        reference_date, start_date, end_date = SecToolRegistry.insider_api.resolve_date_range(
+            reference_date, start_date, end_date, default_days=90
+        )
+
+        # 지정 종목은 장내 매수 공시를 먼저 받아 로컬 스토어에 반영
+        if ticker:
+            SecToolRegistry.insider_api._fetch_filings_pages(
+                ticker=ticker,
+                transaction_type=SECInsiderClusterDetector.BUY_CODE,
+                start_date=start_date,
+                end_date=end_date,
+                reference_date=reference_date
+            )
+            ticker = SecToolRegistry.insider_api.identifier_resolver.resolve(ticker=ticker)["ticker"]
+
+        events = SecToolRegistry.cluster_detector.detect(
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            window_days=window_days,
+            min_insiders=min_insiders,
+            min_value=min_value,
+            limit=limit
+        )
+
+        if not events:
+            return {"message": f"No insider cluster buying found for {ticker or 'any ticker'} between {start_date} and {end_date}."}
+
+        return {"message": events}
 
     @staticmethod
     @tool
@@ -80,7 +190,7 @@ class SecToolRegistry:
         Returns:
             dict: SEC API에서 반환된 JSON 데이터. 성공 시 13D/13G 데이터가 포함된 딕셔너리, 실패 시 None.
         """
-        result = SecToolRegistry.insider_api._fetch_filings_core(
+        result = SecToolRegistry.form13d13g_api._fetch_filings_core(
             issuer_name=issuer_name,
             owner=owner,
             start_date=start_date,
@@ -95,7 +205,7 @@ class SecToolRegistry:
         if not result or len(result) == 0:
             return {"message": f"No SEC filings found for {issuer_name or owner} between {start_date} and {end_date}."}
         
-        return {"message": result}
+        return {"message": OwnershipFilingRecord.serialize(OwnershipFilingRecord.from_filtered(result))}
     
     @staticmethod
     @tool
@@ -156,4 +266,149 @@ class SecToolRegistry:
         if not result or len(result) == 0:
             return {"message": f"No SEC filings found for {cik or company_name} between {start_date} and {end_date}."}
         
-        return {"message": result}
\ No newline at end of file
+        return {"message": InstitutionalHoldingRecord.serialize(InstitutionalHoldingRecord.from_filtered(result), max_rows=100)}
+
+    @staticmethod
+    @tool
+    def get_filing_event_study_tool(
+        ticker: str,
+        source: str = "insider",
+        transaction_type: Optional[str] = "P",
+        owner: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        reference_date: Optional[str] = None,
+        horizons: Optional[list[int]] = None,
+        pre_event_days: int = 5,
+        model: str = "market",
+        benchmark: str = "SPY",
+        max_pages: int = 10
+    ) -> dict:
+        """
+        내부자 거래(Form 4) 또는 주요 지분 공시(13D/13G) 이후 주가 반응을 측정하는 이벤트 스터디 도구
+        공시일마다 벤치마크 대비 누적 초과수익률(CAR)을 구간별로 계산하고, 구간별 평균/중앙값/t-stat/양(+)의 비율을 요약한다.
+        "내부자 매수 후 주가가 올랐는가" 같은 질문에 사용할 것
+
+        Args:
+            ticker (str): 기업 티커 (예: TSLA)
+            source (str, optional): 이벤트 출처. "insider"(Form 4) 또는 "ownership"(13D/13G). 기본값 "insider"
+            transaction_type (str, optional): insider 거래 코드 (예: P 매수, S 매도). 기본값 "P", None 이면 전체
+            owner (str, optional): 내부자/투자자 이름
+            start_date (str, optional): 공시 조회 시작일 ("YYYY-MM-DD")
+            end_date (str, optional): 공시 조회 종료일 ("YYYY-MM-DD")
+            reference_date (str, optional): 현재 시간
+            horizons (list[int], optional): 공시 이후 CAR 구간 [0, h] 의 거래일 수 목록. 기본값 [1, 5, 20]
+            pre_event_days (int, optional): 공시 이전 구간 [-n, -1] 의 거래일 수. 0 이면 생략. 기본값 5
+            model (str, optional): "market"(벤치마크 차감) 또는 "market_model"(추정 구간 alpha/beta). 기본값 "market"
+            benchmark (str, optional): 벤치마크 티커. 기본값 "SPY"
+            max_pages (int, optional): 조회할 최대 공시 페이지 수 (페이지당 5건). 기본값 10
+
+        Returns:
+            dict: 구간별 CAR 요약과 이벤트별 CAR 표 (공통 값은 common 줄, 나머지는 '|' 구분 행으로 요약된 텍스트)
+        """
+        reference_date, start_date, end_date = SecToolRegistry.insider_api.resolve_date_range(
+            reference_date, start_date, end_date, default_days=365
+        )
+        identifiers = SecToolRegistry.insider_api.identifier_resolver.resolve(ticker=ticker)
+        symbol = identifiers["ticker"] or ticker
+
+        if source == "ownership":
+            filings = []
+            page_size = SecToolRegistry.form13d13g_api.SEC_PAGE_SIZE
+            for page in range(max_pages):
+                result = SecToolRegistry.form13d13g_api._fetch_filings_core(
+                    issuer_name=identifiers["name"] or ticker,
+                    owner=owner,
+                    start_date=start_date,
+                    end_date=end_date,
+                    from_value=page * page_size,
+                    reference_date=reference_date
+                )
+                if not result:
+                    break
+                filings.extend(result)
+                if len(result) < page_size:
+                    break
+            events = MarketDataTools.event_engine.ownership_events(filings, symbol)
+        else:
+            filings = SecToolRegistry.insider_api._fetch_filings_pages(
+                ticker=symbol,
+                owner=owner,
+                transaction_type=transaction_type,
+                start_date=start_date,
+                end_date=end_date,
+                reference_date=reference_date,
+                max_pages=max_pages
+            )
+            events = MarketDataTools.event_engine.insider_events(SECInsiderAggregator.to_frame(filings))
+
+        if events.empty:
+            return {"message": f"No {source} filings found for {symbol} between {start_date} and {end_date}."}
+
+        try:
+            return {"message": MarketDataTools.event_engine.run(
+                events,
+                benchmark=benchmark,
+                horizons=horizons or EventStudyEngine.DEFAULT_HORIZONS,
+                pre_event_days=pre_event_days,
+                model=model
+            )}
+        except ValueError as e:
+            return {"message": str(e)}
+
+    @staticmethod
+    @tool
+    def get_insider_signal_backtest_tool(
+        signal: str = "cluster_buy",
+        ticker: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        holding_days: int = 20,
+        entry_delay: int = 1,
+        stop_loss_pct: Optional[float] = None,
+        take_profit_pct: Optional[float] = None,
+        min_value: Optional[float] = None,
+        window_days: int = 14,
+        min_insiders: int = 3,
+        benchmark: str = "SPY"
+    ) -> dict:
+        """
+        로컬에 저장된 내부자 거래(Form 4) 신호로 매매 전략을 백테스트하는 도구
+        "내부자 클러스터 매수 후 20일 보유" 같은 전략의 승률, 평균/초과 수익률, 포트폴리오 수익률과 최대 낙폭을 반환한다.
+        ticker 를 지정하지 않으면 로컬 스토어의 전체 종목을 대상으로 한다. (스토어에 없는 기간은 먼저 내부자 조회 도구로 수집할 것)
+
+        Args:
+            signal (str, optional): "cluster_buy"(클러스터 매수), "insider_buy"(장내 매수 공시), "insider_sell"(장내 매도 공시, 공매도로 평가). 기본값 "cluster_buy"
+            ticker (str, optional): 특정 종목만 백테스트할 때의 티커
+            start_date (str, optional): 신호 시작일 ("YYYY-MM-DD")
+            end_date (str, optional): 신호 종료일 ("YYYY-MM-DD")
+            holding_days (int, optional): 최대 보유 거래일 수. 기본값 20
+            entry_delay (int, optional): 공시일 이후 진입까지의 거래일 수 (종가 진입). 기본값 1
+                (제출 시각이 없는 과거 데이터는 장 마감 후 공시를 구분하지 못하므로 0 은 look-ahead 가 생길 수 있다)
+            stop_loss_pct (float, optional): 손절 기준 손실률 % (예: 10)
+            take_profit_pct (float, optional): 익절 기준 수익률 % (예: 20)
+            min_value (float, optional): 신호로 볼 최소 거래 금액 (USD)
+            window_days (int, optional): cluster_buy 의 클러스터 기간(일). 기본값 14
+            min_insiders (int, optional): cluster_buy 의 최소 내부자 수. 기본값 3
+            benchmark (str, optional): 초과수익률 기준 티커. 기본값 "SPY"
+
+        Returns:
+            dict: 전략 규칙, 성과 요약, 연도별 거래 통계
+        """
+        try:
+            return {"message": SecToolRegistry.backtester.run(
+                signal=signal,
+                ticker=ticker,
+                start_date=start_date,
+                end_date=end_date,
+                holding_days=holding_days,
+                entry_delay=entry_delay,
+                stop_loss_pct=stop_loss_pct,
+                take_profit_pct=take_profit_pct,
+                min_value=min_value,
+                window_days=window_days,
+                min_insiders=min_insiders,
+                benchmark=benchmark
+            )}
+        except ValueError as e:
+            return {"message": str(e)}
@@ -0,0 +1,251 @@
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class TechnicalIndicatorEngine:
+    """
+    종가 패널(날짜 × 종목)에서 SMA/EMA, RSI, MACD, 볼린저 밴드를 계산하는 엔진.
+
+    - 처음 보는 종목은 전체 구간을 EWM/rolling 으로 한 번에(종목 축 벡터화) 계산하고,
+      재귀식에 필요한 값(EMA, RSI 평균 상승/하락폭, 최근 종가 윈도우)만 상태로 남긴다.
+    - 이후 새 봉이 추가되면 남겨 둔 상태에서 새 봉만 재귀식으로 갱신한다.
+    - 마지막으로 본 봉의 종가가 달라졌으면(분할/배당 수정) 상태를 버리고 다시 계산한다.
+    """
+
+    SMA_WINDOWS = (20, 50, 200)
+    EMA_SPANS = (12, 26)
+    MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+    RSI_PERIOD = 14
+    BB_WINDOW, BB_STD = 20, 2.0
+    RSI_OVERBOUGHT, RSI_OVERSOLD = 70.0, 30.0
+    WINDOW_LENGTH = max(max(SMA_WINDOWS), BB_WINDOW)
+    ADJUSTMENT_TOLERANCE = 1e-4
+
+    def __init__(self):
+        self._states: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _alpha(span: int) -> float:
+        return 2.0 / (span + 1)
+
+    @staticmethod
+    def _core(state: dict) -> dict:
+        """
+        상태에서 교차 신호 판단에 쓰는 값만 계산한다.
+        """
+        window = state["window"]
+        sma_fast, sma_slow = (
+            window[-n:].mean() if len(window) >= n else np.nan for n in TechnicalIndicatorEngine.SMA_WINDOWS[1:]
+        )
+        macd = state["ema"][TechnicalIndicatorEngine.MACD_FAST] - state["ema"][TechnicalIndicatorEngine.MACD_SLOW]
+        return {"macd_hist": macd - state["signal"], "sma_cross": sma_fast - sma_slow}
+
+    @staticmethod
+    def _step(state: dict, date: pd.Timestamp, close: float) -> dict:
+        """
+        새 봉 하나를 재귀식으로 반영한 새 상태를 반환한다. (ewm(adjust=False) 와 동일한 식)
+        """
+        engine = TechnicalIndicatorEngine
+        prev = engine._core(state)
+
+        ema = {span: engine._alpha(span) * close + (1 - engine._alpha(span)) * value for span, value in state["ema"].items()}
+        macd = ema[engine.MACD_FAST] - ema[engine.MACD_SLOW]
+        signal = engine._alpha(engine.MACD_SIGNAL) * macd + (1 - engine._alpha(engine.MACD_SIGNAL)) * state["signal"]
+
+        delta = close - state["close"]
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        a = 1.0 / engine.RSI_PERIOD
+        avg_gain = gain if np.isnan(state["avg_gain"]) else a * gain + (1 - a) * state["avg_gain"]
+        avg_loss = loss if np.isnan(state["avg_loss"]) else a * loss + (1 - a) * state["avg_loss"]
+
+        return {
+            "date": date,
+            "close": close,
+            "bars": state["bars"] + 1,
+            "window": np.append(state["window"], close)[-engine.WINDOW_LENGTH:],
+            "ema": ema,
+            "signal": signal,
+            "avg_gain": avg_gain,
+            "avg_loss": avg_loss,
+            "prev": prev
+        }
+
+    @staticmethod
+    def _initial_states(closes: pd.DataFrame) -> dict[str, dict]:
+        """
+        전체 구간을 종목 축으로 벡터화하여 계산하고, 마지막 봉 직전까지의 상태를 만든 뒤
+        마지막 봉은 _step 으로 반영한다. (직전 값이 있어야 교차 신호를 판단할 수 있음)
+        """
+        engine = TechnicalIndicatorEngine
+        states = {}
+        head = closes.iloc[:-1]
+        if head.empty:
+            head_ema = head_signal = head_gain = head_loss = None
+        else:
+            ema = {span: head.ewm(span=span, adjust=False).mean() for span in engine.EMA_SPANS}
+            macd = ema[engine.MACD_FAST] - ema[engine.MACD_SLOW]
+            signal = macd.ewm(span=engine.MACD_SIGNAL, adjust=False).mean()
+            delta = head.diff()
+            avg_gain = delta.clip(lower=0).ewm(alpha=1.0 / engine.RSI_PERIOD, adjust=False).mean()
+            avg_loss = (-delta).clip(lower=0).ewm(alpha=1.0 / engine.RSI_PERIOD, adjust=False).mean()
+            head_ema = {span: frame.iloc[-1] for span, frame in ema.items()}
+            head_signal, head_gain, head_loss = signal.iloc[-1], avg_gain.iloc[-1], avg_loss.iloc[-1]
+
+        values = closes.to_numpy(dtype=float)
+        for idx, ticker in enumerate(closes.columns):
+            column = values[:, idx]
+            valid = ~np.isnan(column)
+            if not valid.any():
+                continue
+            series = column[valid]
+            last_date = closes.index[valid][-1]
+
+            if len(series) == 1 or head_ema is None:
+                # 봉이 하나뿐이면 그 종가로 EMA 를 시작
+                first = series[-1]
+                states[ticker] = {
+                    "date": last_date, "close": first, "bars": 1, "window": series[-1:],
+                    "ema": {span: first for span in engine.EMA_SPANS}, "signal": 0.0,
+                    "avg_gain": np.nan, "avg_loss": np.nan,
+                    "prev": {"macd_hist": np.nan, "sma_cross": np.nan}
+                }
+                continue
+
+            state = {
+                "date": closes.index[valid][-2],
+                "close": series[-2],
+                "bars": len(series) - 1,
+                "window": series[-engine.WINDOW_LENGTH - 1:-1],
+                "ema": {span: float(head_ema[span][ticker]) for span in engine.EMA_SPANS},
+                "signal": float(head_signal[ticker]),
+                "avg_gain": float(head_gain[ticker]),
+                "avg_loss": float(head_loss[ticker]),
+            }
+            states[ticker] = engine._step(state, last_date, float(series[-1]))
+        return states
+
+    def _can_extend(self, state: Optional[dict], column: pd.Series) -> bool:
+        if state is None or state["date"] not in column.index:
+            return False
+        cached = column.loc[state["date"]]
+        if np.isnan(cached) or state["close"] == 0:
+            return False
+        return abs(cached / state["close"] - 1) <= self.ADJUSTMENT_TOLERANCE
+
+    def update(self, closes: pd.DataFrame, keep_state: bool = True) -> dict[str, dict]:
+        """
+        종가 패널의 마지막 봉 기준 지표와 신호를 계산한다.
+
+        :param closes: 날짜 × 종목 종가 패널 (PriceSeriesFormatter.align_closes 결과)
+        :param keep_state: False 이면 저장된 상태를 쓰지도 갱신하지도 않는다. (과거 시점 조회용)
+        :return: {ticker: snapshot}
+        """
+        if closes.empty:
+            return {}
+
+        with self._lock:
+            states = {}
+            fresh = []
+            for ticker in closes.columns:
+                column = closes[ticker].dropna()
+                state = self._states.get(ticker) if keep_state else None
+                if column.empty:
+                    continue
+                if self._can_extend(state, column):
+                    # 새로 들어온 봉만 재귀식으로 반영
+                    for date, close in column.loc[column.index > state["date"]].items():
+                        state = self._step(state, date, float(close))
+                    states[ticker] = state
+                else:
+                    fresh.append(ticker)
+
+            if fresh:
+                states.update(self._initial_states(closes[fresh]))
+
+            if keep_state:
+                self._states.update(states)
+
+        return {ticker: self.snapshot(state) for ticker, state in states.items()}
+
+    @staticmethod
+    def snapshot(state: dict) -> dict:
+        """
+        상태에서 최신 지표 값과 신호를 만든다.
+        """
+        engine = TechnicalIndicatorEngine
+        window, close = state["window"], state["close"]
+
+        def _value(value, digits: int = 2):
+            return None if value is None or np.isnan(value) else round(float(value), digits)
+
+        result = {"date": state["date"].strftime("%Y-%m-%d"), "close": _value(close)}
+        for n in engine.SMA_WINDOWS:
+            result[f"sma_{n}"] = _value(window[-n:].mean()) if len(window) >= n else None
+        for span in engine.EMA_SPANS:
+            result[f"ema_{span}"] = _value(state["ema"][span])
+
+        rsi = None
+        if state["bars"] > engine.RSI_PERIOD:
+            avg_gain, avg_loss = state["avg_gain"], state["avg_loss"]
+            rsi = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        result[f"rsi_{engine.RSI_PERIOD}"] = _value(rsi)
+
+        core = engine._core(state)
+        macd = state["ema"][engine.MACD_FAST] - state["ema"][engine.MACD_SLOW]
+        macd_ready = state["bars"] >= engine.MACD_SLOW
+        result["macd"] = _value(macd, 3) if macd_ready else None
+        result["macd_signal"] = _value(state["signal"], 3) if macd_ready else None
+        result["macd_hist"] = _value(core["macd_hist"], 3) if macd_ready else None
+
+        bb_upper = bb_lower = percent_b = None
+        if len(window) >= engine.BB_WINDOW:
+            recent = window[-engine.BB_WINDOW:]
+            mid, std = recent.mean(), recent.std()
+            bb_upper, bb_lower = mid + engine.BB_STD * std, mid - engine.BB_STD * std
+            percent_b = (close - bb_lower) / (bb_upper - bb_lower) if bb_upper != bb_lower else np.nan
+        result["bb_upper"], result["bb_lower"] = _value(bb_upper), _value(bb_lower)
+        result["bb_percent_b"] = _value(percent_b, 3)
+
+        # 신호
+        if rsi is None:
+            result["rsi_signal"] = None
+        elif rsi >= engine.RSI_OVERBOUGHT:
+            result["rsi_signal"] = "overbought"
+        elif rsi <= engine.RSI_OVERSOLD:
+            result["rsi_signal"] = "oversold"
+        else:
+            result["rsi_signal"] = "neutral"
+
+        prev_hist, hist = state["prev"]["macd_hist"], core["macd_hist"]
+        if not macd_ready:
+            result["macd_signal_state"] = None
+        elif prev_hist <= 0 < hist:
+            result["macd_signal_state"] = "bullish_cross"
+        elif prev_hist >= 0 > hist:
+            result["macd_signal_state"] = "bearish_cross"
+        else:
+            result["macd_signal_state"] = "bullish" if hist > 0 else "bearish"
+
+        prev_cross, cross = state["prev"]["sma_cross"], core["sma_cross"]
+        if np.isnan(cross):
+            result["trend"] = None
+        elif prev_cross <= 0 < cross:
+            result["trend"] = "golden_cross"
+        elif prev_cross >= 0 > cross:
+            result["trend"] = "death_cross"
+        else:
+            result["trend"] = "uptrend" if cross > 0 else "downtrend"
+
+        if bb_upper is None:
+            result["bb_signal"] = None
+        elif close > bb_upper:
+            result["bb_signal"] = "above_upper"
+        elif close < bb_lower:
+            result["bb_signal"] = "below_lower"
+        else:
+            result["bb_signal"] = "inside"
+        return result
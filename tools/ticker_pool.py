@@ -0,0 +1,192 @@
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
+from typing import Any, Callable, Optional, Union
+
+import pandas as pd
+import yfinance as yf
+
+from utils.logger import logger
+
+
+class _Flight:
+    """
+    진행 중인 조회 1건. 같은 키를 요청한 다른 스레드는 이 결과를 기다린다.
+    """
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class YFTickerPool:
+    """
+    프로세스 전역에서 공유하는 yf.Ticker 핸들 풀과 속성별 TTL 캐시.
+
+    - 티커마다 yf.Ticker 를 한 번만 만들어 재사용한다.
+    - (티커, 속성) 단위로 결과를 캐시하며, 속성마다 만료 시간이 다르다.
+      뉴스/옵션 체인은 수 분, SEC 제출 목록은 수 시간, 재무제표는 다음 실적 발표일까지.
+    - 같은 키를 동시에 요청하면 한 스레드만 실제로 조회하고 나머지는 그 결과를 기다린다. (single-flight)
+    - 조회가 실패하면 캐시하지 않고, 기다리던 스레드에도 같은 예외를 전달한다.
+    """
+
+    NEWS_TTL = 10 * 60
+    SEC_FILINGS_TTL = 6 * 60 * 60
+    CALENDAR_TTL = 12 * 60 * 60
+    SPOT_TTL = 60
+    OPTION_EXPIRATIONS_TTL = 60 * 60
+    OPTION_CHAIN_TTL = 5 * 60
+    PROFILE_TTL = 7 * 24 * 60 * 60
+    # 실적 발표일을 모르거나 이미 지났을 때의 재무제표 TTL 범위
+    FINANCIALS_MIN_TTL = 6 * 60 * 60
+    FINANCIALS_DEFAULT_TTL = 24 * 60 * 60
+    FINANCIALS_MAX_TTL = 100 * 24 * 60 * 60
+    MAX_ENTRIES = 2048
+
+    def __init__(self):
+        self._handles: dict[str, yf.Ticker] = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._inflight: dict[tuple, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def ticker(self, symbol: str) -> yf.Ticker:
+        symbol = symbol.strip().upper()
+        with self._lock:
+            handle = self._handles.get(symbol)
+            if handle is None:
+                handle = self._handles[symbol] = yf.Ticker(symbol)
+            return handle
+
+    def get(
+        self,
+        symbol: str,
+        attribute: str,
+        loader: Callable[[yf.Ticker], Any],
+        ttl: Union[float, Callable[[Any], float]]
+    ) -> Any:
+        """
+        (symbol, attribute) 결과를 캐시에서 꺼내거나 loader 로 한 번만 조회한다.
+
+        :param loader: yf.Ticker 를 받아 값을 반환하는 함수
+        :param ttl: 초 단위 TTL, 또는 조회 결과를 받아 TTL 을 돌려주는 함수
+        """
+        key = (symbol.strip().upper(), attribute)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._cache.move_to_end(key)
+                return entry[0]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader(self.ticker(key[0]))
+            seconds = ttl(value) if callable(ttl) else ttl
+            flight.value = value
+            with self._lock:
+                self._cache[key] = (value, time.time() + seconds)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+            return value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    def invalidate(self, symbol: str, attribute: Optional[str] = None):
+        symbol = symbol.strip().upper()
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == symbol and attribute in (None, key[1])]:
+                del self._cache[key]
+
+    def news(self, symbol: str) -> list:
+        return self.get(symbol, "news", lambda t: t.news or [], self.NEWS_TTL)
+
+    def sec_filings(self, symbol: str) -> list:
+        return self.get(symbol, "sec_filings", lambda t: t.get_sec_filings() or [], self.SEC_FILINGS_TTL)
+
+    def spot(self, symbol: str) -> float:
+        return self.get(symbol, "spot", lambda t: float(t.fast_info["lastPrice"]), self.SPOT_TTL)
+
+    def option_expirations(self, symbol: str) -> tuple:
+        return self.get(symbol, "option_expirations", lambda t: tuple(t.options or ()), self.OPTION_EXPIRATIONS_TTL)
+
+    def option_chain(self, symbol: str, expiration: str):
+        """
+        만기 1개의 옵션 체인 (calls, puts, underlying). 만기별로 짧게 캐시한다.
+        """
+        return self.get(symbol, f"option_chain:{expiration}", lambda t: t.option_chain(expiration), self.OPTION_CHAIN_TTL)
+
+    def profile(self, symbol: str) -> dict:
+        """
+        섹터/산업/국가 등 거의 바뀌지 않는 종목 정보. (yf.Ticker.info 는 느리므로 길게 캐시)
+        """
+        def _load(t: yf.Ticker) -> dict:
+            info = t.info or {}
+            return {key: info.get(key) for key in ("sector", "industry", "country", "quoteType", "exchange")}
+        return self.get(symbol, "profile", _load, self.PROFILE_TTL)
+
+    @staticmethod
+    def _earnings_dates(calendar) -> list[date]:
+        """
+        yf.Ticker.calendar 에서 실적 발표 예정일 목록을 꺼낸다. (dict / DataFrame 모두 처리)
+        """
+        if isinstance(calendar, pd.DataFrame):
+            calendar = {index: list(row.dropna()) for index, row in calendar.iterrows()}
+        if not isinstance(calendar, dict):
+            return []
+        values = calendar.get("Earnings Date") or []
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        dates = []
+        for value in values:
+            try:
+                dates.append(pd.Timestamp(value).date())
+            except (ValueError, TypeError):
+                continue
+        return dates
+
+    def next_earnings_date(self, symbol: str) -> Optional[date]:
+        try:
+            dates = self.get(symbol, "earnings_dates", lambda t: self._earnings_dates(t.calendar), self.CALENDAR_TTL)
+        except Exception as e:
+            logger.warning(f"[YFTickerPool] {symbol} 실적 발표일 조회 실패: {e}")
+            return None
+        today = datetime.now().date()
+        upcoming = [d for d in dates if d >= today]
+        return min(upcoming) if upcoming else None
+
+    def _financials_ttl(self, symbol: str) -> float:
+        """
+        다음 실적 발표일 다음 날까지 유지한다. (발표 당일 장 마감 후 반영되는 경우 포함)
+        """
+        next_date = self.next_earnings_date(symbol)
+        if next_date is None:
+            return self.FINANCIALS_DEFAULT_TTL
+        expires = datetime.combine(next_date + timedelta(days=1), datetime.min.time())
+        seconds = (expires - datetime.now()).total_seconds()
+        return min(max(seconds, self.FINANCIALS_MIN_TTL), self.FINANCIALS_MAX_TTL)
+
+    def financials(self, symbol: str, freq: str = "quarterly") -> pd.DataFrame:
+        return self.get(
+            symbol,
+            f"financials:{freq}",
+            lambda t: t.get_financials(freq=freq),
+            lambda _: self._financials_ttl(symbol)
+        )
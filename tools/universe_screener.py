@@ -0,0 +1,477 @@
+import os
+import ast
+import time
+import operator
+import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.price_cache import OHLCVCache
+from tools.columnar_price_store import ColumnarPriceStore
+from tools.fundamentals_cache import FundamentalsCache
+from tools.sec_insider_store import SECInsiderStore
+from tools.sec_insider_aggregator import SECInsiderAggregator
+from tools.ticker_pool import YFTickerPool
+from tools.filing_records import serialize_columns
+from utils.data_paths import data_path
+from utils.logger import logger
+
+
+class ScreenExpression:
+    """
+    "sector == 'technology' and pe < 20 and insider_buy_value_30d > 0" 같은 조건식을
+    ast 로 파싱해 (컬럼 dict → bool 배열) 함수로 컴파일한다.
+
+    - 허용: and/or/not, 비교(연쇄 비교 포함), in/not in [리터럴 목록], + - * /, 단항 -, 숫자/문자열/True/False, 컬럼 이름
+    - 함수 호출, 속성 접근, 인덱싱 등 그 밖의 구문은 ValueError.
+    - 문자열은 대소문자를 구분하지 않는다. (스냅샷의 문자열 컬럼은 소문자로 저장)
+    - 문자열과 숫자의 크기 비교(sector > 5), 문자열 산술은 컴파일 단계에서 ValueError.
+    """
+
+    _COMPARE = {
+        ast.Eq: operator.eq, ast.NotEq: operator.ne,
+        ast.Lt: operator.lt, ast.LtE: operator.le,
+        ast.Gt: operator.gt, ast.GtE: operator.ge
+    }
+    _ARITHMETIC = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+    def __init__(self, text: str, columns: set[str], string_columns: Optional[set[str]] = None):
+        self.text = text
+        self.columns = columns
+        self.string_columns = string_columns or set()
+        self.names: list[str] = []
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"조건식 문법 오류: {e.msg}") from None
+        self._fn = self._compile(tree.body)
+
+    def __call__(self, data: dict[str, np.ndarray]) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self._fn(data)
+
+    def _literal(self, node: ast.AST):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool)):
+            return node.value.lower() if isinstance(node.value, str) else node.value
+        raise ValueError(f"목록에는 리터럴만 사용할 수 있습니다: {ast.unparse(node)}")
+
+    def _kind(self, node: ast.AST) -> Optional[str]:
+        """
+        식의 값 종류 ("str" / "num"). 알 수 없으면 None.
+        """
+        if isinstance(node, ast.Constant):
+            return "str" if isinstance(node.value, str) else "num"
+        if isinstance(node, ast.Name):
+            return "str" if node.id.lower() in self.string_columns else "num"
+        if isinstance(node, ast.BinOp) or (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)):
+            return "num"
+        return None
+
+    def _compile(self, node: ast.AST) -> Callable[[dict], np.ndarray]:
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compile(value) for value in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            return lambda data: reduce(combine, (part(data) for part in parts))
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._compile(node.operand)
+            if isinstance(node.op, ast.Not):
+                return lambda data: np.logical_not(operand(data))
+            if isinstance(node.op, ast.USub):
+                if self._kind(node.operand) == "str":
+                    raise ValueError(f"문자열에는 산술 연산을 쓸 수 없습니다: {ast.unparse(node)}")
+                return lambda data: -operand(data)
+
+        if isinstance(node, ast.Compare):
+            left = self._compile(node.left)
+            steps = []
+            for previous, op, comparator in zip([node.left, *node.comparators], node.ops, node.comparators):
+                if isinstance(op, (ast.Lt, ast.LtE, ast.Gt, ast.GtE)):
+                    kinds = {self._kind(previous), self._kind(comparator)} - {None}
+                    if len(kinds) > 1:
+                        raise ValueError(f"문자열과 숫자는 크기를 비교할 수 없습니다: {ast.unparse(node)}")
+                if isinstance(op, (ast.In, ast.NotIn)):
+                    if not isinstance(comparator, (ast.List, ast.Tuple, ast.Set)):
+                        raise ValueError("in 뒤에는 [..] 목록이 와야 합니다.")
+                    values = [self._literal(element) for element in comparator.elts]
+                    invert = isinstance(op, ast.NotIn)
+                    steps.append((lambda a, b, values=values, invert=invert: np.isin(a, values, invert=invert), None))
+                elif type(op) in self._COMPARE:
+                    steps.append((self._COMPARE[type(op)], self._compile(comparator)))
+                else:
+                    raise ValueError(f"지원하지 않는 비교 연산입니다: {ast.unparse(node)}")
+
+            def _compare(data: dict) -> np.ndarray:
+                a, mask = left(data), True
+                for fn, right in steps:
+                    b = right(data) if right is not None else None
+                    mask = np.logical_and(mask, fn(a, b))
+                    a = b
+                return mask
+            return _compare
+
+        if isinstance(node, ast.BinOp) and type(node.op) in self._ARITHMETIC:
+            if "str" in (self._kind(node.left), self._kind(node.right)):
+                raise ValueError(f"문자열에는 산술 연산을 쓸 수 없습니다: {ast.unparse(node)}")
+            fn, a, b = self._ARITHMETIC[type(node.op)], self._compile(node.left), self._compile(node.right)
+            return lambda data: fn(a(data), b(data))
+
+        if isinstance(node, ast.Name):
+            name = node.id.lower()
+            if name in ("true", "false"):
+                return lambda data, value=(name == "true"): value
+            if name not in self.columns:
+                raise ValueError(f"알 수 없는 컬럼입니다: {node.id} (사용 가능: {', '.join(sorted(self.columns))})")
+            if name not in self.names:
+                self.names.append(name)
+            return lambda data: data[name]
+
+        if isinstance(node, ast.Constant):
+            value = self._literal(node)
+            return lambda data: value
+
+        raise ValueError(f"지원하지 않는 구문입니다: {ast.unparse(node)}")
+
+
+class UniverseScreener:
+    """
+    로컬 캐시(가격, 손익계산서, 내부자 스토어, 종목 프로필)로 만든 종목 × 지표 컬럼형 스냅샷 위에서
+    조건식을 NumPy 마스크로 평가하는 스크리너.
+
+    - 스냅샷은 컬럼별 NumPy 배열(dict)로 메모리에 두고, Parquet 으로 저장해 재시작 후에도 재사용한다.
+    - 스냅샷 생성은 네트워크 없이 로컬 캐시만 읽는다. (프로필은 refresh(fetch_profiles=True) 때만 빠진 종목을 조회)
+    - 가격 지표는 종목별 파일 대신 컬럼형 가격 스토어(ColumnarPriceStore)의 (거래일 × 종목) 패널로 한 번에 계산한다.
+    - SNAPSHOT_TTL 이 지난 스냅샷은 다음 조회 때 다시 만든다.
+    - 컴파일한 조건식은 문자열 단위로 재사용한다.
+    """
+
+    SNAPSHOT_TTL = 6 * 60 * 60
+    PRICE_LOOKBACK_DAYS = 400
+    PROFILE_WORKERS = 8
+    MAX_COMPILED = 256
+    STRING_COLUMNS = ("sector", "industry", "country")
+    DEFAULT_COLUMNS = ("sector", "close", "market_cap_musd")
+    DESCRIPTIONS = {
+        "sector": "섹터 (예: technology, healthcare)",
+        "industry": "산업",
+        "country": "국가 (예: united states)",
+        "close": "최근 종가",
+        "ret_1m_pct": "1개월 수익률 %",
+        "ret_3m_pct": "3개월 수익률 %",
+        "ret_12m_pct": "12개월 수익률 %",
+        "from_52w_high_pct": "52주 고점 대비 %",
+        "volatility_3m_pct": "3개월 연율 변동성 %",
+        "dollar_volume_20d_musd": "20일 평균 거래대금 (백만 USD)",
+        "market_cap_musd": "시가총액 (백만 USD, 종가 × 희석 주식 수)",
+        "revenue_ttm_musd": "최근 4분기 매출 (백만 USD)",
+        "net_income_ttm_musd": "최근 4분기 순이익 (백만 USD)",
+        "eps_ttm": "최근 4분기 희석 EPS",
+        "pe": "PER (종가 / eps_ttm, 적자면 비어 있음)",
+        "revenue_growth_pct": "최근 분기 매출 전년 동기 대비 %",
+        "operating_margin_pct": "최근 4분기 영업이익률 %",
+        "net_margin_pct": "최근 4분기 순이익률 %",
+        "insider_buy_value_30d_musd": "최근 30일 내부자 장내 매수 금액 (백만 USD)",
+        "insider_sell_value_30d_musd": "최근 30일 내부자 장내 매도 금액 (백만 USD)",
+        "insider_buyers_30d": "최근 30일 장내 매수한 내부자 수",
+        "insider_net_value_90d_musd": "최근 90일 내부자 순매수 금액 (백만 USD)"
+    }
+
+    def __init__(
+        self,
+        price_cache: OHLCVCache,
+        price_store: ColumnarPriceStore,
+        fundamentals_cache: FundamentalsCache,
+        insider_store: SECInsiderStore,
+        ticker_pool: YFTickerPool,
+        snapshot_dir: Optional[str] = None
+    ):
+        self.price_cache = price_cache
+        self.price_store = price_store
+        self.fundamentals_cache = fundamentals_cache
+        self.insider_store = insider_store
+        self.ticker_pool = ticker_pool
+        self.snapshot_dir = snapshot_dir or os.path.dirname(data_path("universe", "_"))
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._tickers: Optional[np.ndarray] = None
+        self._data: dict[str, np.ndarray] = {}
+        self._built_at = 0.0
+        self._compiled: dict[str, ScreenExpression] = {}
+
+    @property
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.snapshot_dir, "snapshot.parquet")
+
+    @property
+    def _profiles_path(self) -> str:
+        return os.path.join(self.snapshot_dir, "profiles.parquet")
+
+    def _price_metrics(self, tickers: list[str], as_of: pd.Timestamp) -> pd.DataFrame:
+        """
+        컬럼형 가격 스토어의 최근 1년여 종가/거래량 패널에서 전 종목 가격 지표를 한 번에 계산한다.
+        다른 시장의 휴장일은 앞 값으로 채우므로 N 봉 수익률은 합집합 거래일 기준이다.
+        """
+        start = (as_of - pd.Timedelta(days=self.PRICE_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+        closes = self.price_store.panel("Close", tickers, start=start)
+        if closes.empty:
+            return pd.DataFrame(index=pd.Index([], name="ticker"))
+        volumes = self.price_store.panel("Volume", list(closes.columns), start=start).reindex_like(closes)
+
+        raw = closes.to_numpy(dtype=float)
+        filled = closes.ffill().to_numpy(dtype=float)
+        last = filled[-1]
+
+        def _change(bars: int) -> np.ndarray:
+            return (last / filled[-bars - 1] - 1.0) * 100 if len(filled) > bars else np.full(last.shape, np.nan)
+
+        with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            recent = filled[-64:]
+            returns = np.diff(recent, axis=0) / recent[:-1]
+            volatility = np.nanstd(returns, axis=0, ddof=1) * np.sqrt(252) * 100
+            volatility[np.isfinite(returns).sum(axis=0) <= 20] = np.nan
+            metrics = {
+                "close": last,
+                "ret_1m_pct": _change(21),
+                "ret_3m_pct": _change(63),
+                "ret_12m_pct": _change(252),
+                "from_52w_high_pct": (last / np.nanmax(raw[-252:], axis=0) - 1.0) * 100,
+                "volatility_3m_pct": volatility,
+                "dollar_volume_20d_musd": np.nanmean(raw[-20:] * volumes.to_numpy(dtype=float)[-20:], axis=0) / 1e6
+            }
+        return pd.DataFrame(metrics, index=closes.columns)
+
+    @staticmethod
+    def _fundamental_metrics(df: pd.DataFrame) -> dict:
+        """
+        분기 손익계산서(행: 항목, 열: 기간)에서 TTM 지표를 만든다. 4분기가 안 되면 TTM 은 비워 둔다.
+        """
+        if df is None or df.empty:
+            return {}
+        df = df[sorted(df.columns, reverse=True)]
+
+        def _row(name: str) -> np.ndarray:
+            return df.loc[name].to_numpy(dtype=float) if name in df.index else np.full(len(df.columns), np.nan)
+
+        def _ttm(values: np.ndarray) -> float:
+            return values[:4].sum() if values.size >= 4 and np.isfinite(values[:4]).all() else np.nan
+
+        revenue, operating, net, eps = _row("TotalRevenue"), _row("OperatingIncome"), _row("NetIncome"), _row("DilutedEPS")
+        shares = _row("DilutedAverageShares")
+        revenue_ttm = _ttm(revenue)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {
+                "revenue_ttm_musd": revenue_ttm / 1e6,
+                "net_income_ttm_musd": _ttm(net) / 1e6,
+                "eps_ttm": _ttm(eps),
+                "shares": shares[np.isfinite(shares)][0] if np.isfinite(shares).any() else np.nan,
+                "revenue_growth_pct": (revenue[0] / revenue[4] - 1.0) * 100 if revenue.size > 4 and revenue[4] > 0 else np.nan,
+                "operating_margin_pct": _ttm(operating) / revenue_ttm * 100,
+                "net_margin_pct": _ttm(net) / revenue_ttm * 100
+            }
+
+    def _insider_metrics(self, as_of: pd.Timestamp) -> pd.DataFrame:
+        frame = self.insider_store.frame()
+        frame = frame[frame["ticker"].notna()]
+        if frame.empty:
+            return pd.DataFrame()
+        days = SECInsiderAggregator.filing_days(frame["filedAt"])
+        recent = frame[days >= as_of - pd.Timedelta(days=90)].assign(day=days)
+        last_30 = recent["day"] >= as_of - pd.Timedelta(days=30)
+        buys = recent["transaction_code"] == "P"
+        sells = recent["transaction_code"] == "S"
+        ticker = recent["ticker"].str.upper()
+
+        metrics = pd.DataFrame({
+            "insider_buy_value_30d_musd": recent["value"].where(buys & last_30, 0.0).groupby(ticker).sum() / 1e6,
+            "insider_sell_value_30d_musd": recent["value"].where(sells & last_30, 0.0).groupby(ticker).sum() / 1e6,
+            "insider_buyers_30d": recent["owner"].where(buys & last_30).groupby(ticker).nunique(),
+            "insider_net_value_90d_musd": (
+                recent["value"].where(buys, 0.0) - recent["value"].where(sells, 0.0)
+            ).groupby(ticker).sum() / 1e6
+        })
+        return metrics
+
+    def _load_profiles(self) -> pd.DataFrame:
+        if os.path.exists(self._profiles_path):
+            try:
+                return pd.read_parquet(self._profiles_path)
+            except Exception as e:
+                logger.warning(f"[UniverseScreener] 프로필 로드 실패: {e}")
+        return pd.DataFrame(columns=list(self.STRING_COLUMNS))
+
+    def _fetch_profiles(self, profiles: pd.DataFrame, tickers: list[str]) -> pd.DataFrame:
+        missing = [ticker for ticker in tickers if ticker not in profiles.index]
+        if not missing:
+            return profiles
+
+        def _fetch(ticker: str) -> Optional[dict]:
+            try:
+                return self.ticker_pool.profile(ticker)
+            except Exception as e:
+                logger.warning(f"[UniverseScreener] {ticker} 프로필 조회 실패: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.PROFILE_WORKERS) as executor:
+            fetched = dict(zip(missing, executor.map(_fetch, missing)))
+        rows = pd.DataFrame.from_dict({t: p for t, p in fetched.items() if p is not None}, orient="index")
+        if rows.empty:
+            return profiles
+        profiles = pd.concat([profiles, rows.reindex(columns=profiles.columns.union(rows.columns))])
+        try:
+            profiles.to_parquet(self._profiles_path)
+        except Exception as e:
+            logger.warning(f"[UniverseScreener] 프로필 저장 실패: {e}")
+        return profiles
+
+    def universe(self) -> list[str]:
+        tickers = set(self.price_cache.cached_tickers()) | set(self.fundamentals_cache.cached_tickers())
+        frame = self.insider_store.frame()
+        tickers |= set(frame["ticker"].dropna().str.upper())
+        return sorted(ticker for ticker in tickers if ticker and not ticker.startswith("^"))
+
+    def build(self, fetch_profiles: bool = False) -> pd.DataFrame:
+        """
+        로컬 캐시에서 종목 × 지표 스냅샷을 만든다.
+        """
+        tickers = self.universe()
+        as_of = pd.Timestamp.now().normalize()
+        self.price_store.sync(self.price_cache)
+
+        rows = {ticker: self._fundamental_metrics(self.fundamentals_cache.cached(ticker, "quarterly")) for ticker in tickers}
+        snapshot = pd.DataFrame.from_dict(rows, orient="index").reindex(tickers)
+        snapshot = self._price_metrics(tickers, as_of).reindex(tickers).join(snapshot)
+
+        profiles = self._load_profiles()
+        if fetch_profiles:
+            profiles = self._fetch_profiles(profiles, tickers)
+        for column in self.STRING_COLUMNS:
+            values = profiles[column] if column in profiles else pd.Series(dtype=object)
+            snapshot[column] = values.reindex(tickers).fillna("").astype(str).str.strip().str.lower()
+
+        snapshot = snapshot.join(self._insider_metrics(as_of), how="left")
+        for column in self.DESCRIPTIONS:
+            if column not in snapshot:
+                snapshot[column] = np.nan
+        insider_columns = [c for c in snapshot.columns if c.startswith("insider_")]
+        snapshot[insider_columns] = snapshot[insider_columns].fillna(0.0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            snapshot["market_cap_musd"] = snapshot["close"] * snapshot.get("shares", np.nan) / 1e6
+            snapshot["pe"] = np.where(snapshot["eps_ttm"] > 0, snapshot["close"] / snapshot["eps_ttm"], np.nan)
+        snapshot = snapshot[list(self.DESCRIPTIONS)]
+        snapshot.index.name = "ticker"
+
+        try:
+            snapshot.to_parquet(self._snapshot_path)
+        except Exception as e:
+            logger.warning(f"[UniverseScreener] 스냅샷 저장 실패: {e}")
+        self._install(snapshot, time.time())
+        return snapshot
+
+    def _install(self, snapshot: pd.DataFrame, built_at: float):
+        data = {}
+        for column in snapshot.columns:
+            dtype = object if column in self.STRING_COLUMNS else float
+            data[column] = snapshot[column].to_numpy(dtype=dtype)
+        with self._lock:
+            self._tickers = snapshot.index.to_numpy(dtype=object)
+            self._data = data
+            self._built_at = built_at
+
+    def snapshot_age(self) -> float:
+        """
+        마지막 스냅샷 이후 경과 초. (메모리에 없으면 저장된 파일 기준, 둘 다 없으면 inf)
+        """
+        built_at = self._built_at
+        if not built_at and os.path.exists(self._snapshot_path):
+            built_at = os.path.getmtime(self._snapshot_path)
+        return time.time() - built_at if built_at else float("inf")
+
+    def refresh(self, fetch_profiles: bool = False) -> int:
+        snapshot = self.build(fetch_profiles=fetch_profiles)
+        logger.info(f"[UniverseScreener] 스냅샷 갱신: {len(snapshot)} 종목")
+        return len(snapshot)
+
+    def _ensure_snapshot(self):
+        if self._tickers is not None and time.time() - self._built_at < self.SNAPSHOT_TTL:
+            return
+        if self._tickers is None and os.path.exists(self._snapshot_path):
+            built_at = os.path.getmtime(self._snapshot_path)
+            if time.time() - built_at < self.SNAPSHOT_TTL:
+                try:
+                    self._install(pd.read_parquet(self._snapshot_path), built_at)
+                    return
+                except Exception as e:
+                    logger.warning(f"[UniverseScreener] 스냅샷 로드 실패, 다시 만듭니다: {e}")
+        self.build()
+
+    def compile(self, expression: str) -> ScreenExpression:
+        with self._lock:
+            compiled = self._compiled.get(expression)
+        if compiled is None:
+            compiled = ScreenExpression(expression, set(self.DESCRIPTIONS), set(self.STRING_COLUMNS))
+            with self._lock:
+                if len(self._compiled) >= self.MAX_COMPILED:
+                    self._compiled.clear()
+                self._compiled[expression] = compiled
+        return compiled
+
+    def screen(
+        self,
+        expression: str,
+        sort_by: Optional[str] = None,
+        ascending: bool = False,
+        limit: int = 20,
+        columns: Optional[list[str]] = None
+    ) -> dict:
+        """
+        조건식을 만족하는 종목을 sort_by 기준으로 정렬해 상위 limit 개를 반환한다.
+        """
+        compiled = self.compile(expression)
+        if sort_by is not None and sort_by not in self.DESCRIPTIONS:
+            raise ValueError(f"알 수 없는 정렬 컬럼입니다: {sort_by}")
+        self._ensure_snapshot()
+        with self._lock:
+            tickers, data, built_at = self._tickers, self._data, self._built_at
+
+        try:
+            mask = np.broadcast_to(np.asarray(compiled(data), dtype=bool), tickers.shape)
+        except TypeError as e:
+            raise ValueError(f"조건식을 평가할 수 없습니다 ({expression}): {e}") from None
+        matched = np.flatnonzero(mask)
+        if sort_by:
+            keys = data[sort_by][matched]
+            if sort_by not in self.STRING_COLUMNS:
+                # NaN 은 방향과 관계없이 맨 뒤
+                keys = np.where(np.isnan(keys), np.inf, keys if ascending else -keys)
+            matched = matched[np.argsort(keys, kind="stable")]
+        top = matched[:limit]
+
+        shown = [c for c in [*(columns or []), *compiled.names, *([sort_by] if sort_by else []), *self.DEFAULT_COLUMNS]
+                 if c in self.DESCRIPTIONS]
+        shown = list(dict.fromkeys(shown))
+
+        def _cell(column: str, idx: int):
+            value = data[column][idx]
+            if column in self.STRING_COLUMNS:
+                return value
+            return None if not np.isfinite(value) else round(float(value), 2)
+
+        rows = [(tickers[idx], *(_cell(column, idx) for column in shown)) for idx in top]
+        return {
+            "universe": int(len(tickers)),
+            "matches": int(matched.size),
+            "snapshot_at": time.strftime("%Y-%m-%d %H:%M", time.localtime(built_at)),
+            "results": serialize_columns(
+                ["ticker"] + shown,
+                rows,
+                title=f"Screen: {expression}" + (f" | sort {sort_by} {'asc' if ascending else 'desc'}" if sort_by else "")
+            )
+        }
@@ -0,0 +1,126 @@
+import re
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
+
+from tools.news_pipeline import MinHashDeduplicator
+from utils.logger import logger
+
+
+class WebSearchService:
+    """
+    프로세스 전역에서 공유하는 DuckDuckGo 검색 서비스.
+
+    - 검색 클라이언트(DuckDuckGoSearchAPIWrapper)를 한 번만 만들어 재사용한다.
+    - 정규화한 질의(소문자, 공백 정리) 단위로 결과를 TTL 캐시하고, 같은 질의가 진행 중이면 그 결과를 함께 기다린다.
+    - 백엔드 호출은 전역 동시 실행 수(MAX_CONCURRENCY)와 최소 호출 간격(MIN_INTERVAL_SECONDS)으로 제한한다.
+    - 호출마다 DEADLINE_SECONDS 안에 끝나지 않으면 그래프를 멈추지 않고 만료된 캐시(있으면) 또는 빈 결과를 반환한다.
+      늦게 끝난 검색 결과는 캐시에 저장되어 다음 호출에서 사용된다.
+    """
+
+    TTL_SECONDS = 15 * 60
+    STALE_SECONDS = 24 * 60 * 60
+    MAX_ENTRIES = 512
+    MAX_RESULTS = 8
+    MAX_CONCURRENCY = 2
+    MIN_INTERVAL_SECONDS = 1.0
+    DEADLINE_SECONDS = 8.0
+
+    def __init__(self):
+        self._client = DuckDuckGoSearchAPIWrapper()
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY, thread_name_prefix="websearch")
+        self._deduplicator = MinHashDeduplicator()
+        self._cache: OrderedDict = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._rate_lock = threading.Lock()
+        self._last_call = 0.0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return re.sub(r"\s+", " ", (query or "").strip().lower()).strip(" ?!.")
+
+    def _search(self, query: str) -> list[dict]:
+        # 백엔드 스로틀링을 피하기 위해 호출 간 최소 간격 유지
+        with self._rate_lock:
+            wait = self._last_call + self.MIN_INTERVAL_SECONDS - time.time()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_call = time.time()
+        return self._client.results(query, max_results=self.MAX_RESULTS)
+
+    def _dedupe(self, results: list[dict]) -> list[dict]:
+        """
+        같은 기사를 옮겨 실은 결과(거의 같은 제목+스니펫)는 첫 번째만 남긴다.
+        """
+        roots = self._deduplicator.cluster([f"{r.get('title', '')} {r.get('snippet', '')}" for r in results])
+        return [result for idx, (result, root) in enumerate(zip(results, roots)) if idx == root]
+
+    def _run(self, key: str, query: str) -> list[dict]:
+        """
+        작업 스레드에서 검색 → 중복 제거 → 캐시 저장까지 처리한다.
+        (마감 시간을 넘겨 호출자가 떠난 뒤에도 결과는 캐시에 남는다)
+        """
+        try:
+            results = self._dedupe(self._search(query))
+        except Exception as e:
+            logger.warning(f"[WebSearchService] 검색 실패 ({key}): {e}")
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        with self._lock:
+            self._cache[key] = (results, time.time())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return results
+
+    def search(self, query: str, deadline: Optional[float] = None) -> dict:
+        """
+        검색 결과를 반환한다.
+
+        Returns:
+            dict: {"results": [{"title", "snippet", "link"}], "status": "fresh" | "cached" | "stale" | "timeout" | "error"}
+        """
+        key = self.normalize_query(query)
+        if not key:
+            return {"results": [], "status": "error"}
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.time() - entry[1] < self.TTL_SECONDS:
+                self._cache.move_to_end(key)
+                return {"results": entry[0], "status": "cached"}
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = self._executor.submit(self._run, key, query)
+
+        try:
+            return {"results": future.result(timeout=deadline or self.DEADLINE_SECONDS), "status": "fresh"}
+        except FutureTimeoutError:
+            status = "timeout"
+        except Exception:
+            status = "error"
+
+        if entry is not None and time.time() - entry[1] < self.STALE_SECONDS:
+            return {"results": entry[0], "status": "stale"}
+        return {"results": [], "status": status}
+
+    @staticmethod
+    def to_text(response: dict) -> str:
+        results = response.get("results") or []
+        if not results:
+            if response.get("status") == "timeout":
+                return "웹 검색이 시간 내에 끝나지 않았습니다. 잠시 후 다시 시도하거나 다른 도구를 사용하세요."
+            return "검색 결과가 없습니다."
+        lines = []
+        if response.get("status") == "stale":
+            lines.append("(검색 지연으로 이전에 저장된 결과를 반환합니다)")
+        for result in results:
+            lines.append(f"- {result.get('title', '')}: {result.get('snippet', '')} ({result.get('link', '')})")
+        return "\n".join(lines)
@@ -0,0 +1,17 @@
+# utils/data_paths.py
+import os
+
+# 로컬 캐시/스토어 루트 디렉토리 (FINBRAIN_DATA_DIR 로 변경 가능)
+DATA_DIR = os.getenv(
+    "FINBRAIN_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+)
+
+
+def data_path(*parts: str) -> str:
+    """
+    DATA_DIR 하위 경로를 반환하고, 상위 디렉토리가 없으면 생성한다.
+    """
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
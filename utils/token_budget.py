@@ -0,0 +1,12 @@
+# utils/token_budget.py
+
+# 대략적인 토큰 추정치 (영문/숫자 위주 텍스트 기준 약 4글자당 1토큰)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    tokenizer 호출 없이 텍스트의 토큰 수를 대략 추정한다.
+    예산 안에 들어오는지 판단하는 용도로만 사용한다.
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN